@@ -0,0 +1,139 @@
+"""Load-test one worker of ``epl_api.asgi:application`` against a fake upstream.
+
+    python -m benchmarks.loadtest run --users 20 --duration 30 --mode cached
+    python -m benchmarks.loadtest run --mode cold --latency-ms 250 --json out.json
+    python -m benchmarks.loadtest record --out recorded/
+
+Redis must be reachable at ``EPL_REDIS_URL`` (default ``redis://127.0.0.1:6379/1``).
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+import httpx
+import uvicorn
+
+from benchmarks.loadtest import driver, upstream
+
+
+async def _serve_upstream(args):
+    app = upstream.create_app(args.latency_ms, args.jitter_ms, args.pages)
+    server = uvicorn.Server(
+        uvicorn.Config(
+            app, host="127.0.0.1", port=args.upstream_port, log_level="warning"
+        )
+    )
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+    return server, task
+
+
+async def run(args) -> dict:
+    upstream_url = f"http://127.0.0.1:{args.upstream_port}"
+    app_url = f"http://127.0.0.1:{args.port}{args.api_prefix}"
+    server, serving = await _serve_upstream(args)
+    app = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", args.app,
+            "--host", "127.0.0.1", "--port", str(args.port),
+            "--workers", "1", "--log-level", "warning",
+        ],
+        env=driver.app_env(upstream_url, cold=args.mode == "cold"),
+    )
+    players = [name for name, _ in upstream.PLAYERS]
+    clubs = upstream.CLUBS
+    mix = driver.parse_mix(args.mix) if args.mix else driver.DEFAULT_MIX
+    try:
+        await driver.wait_until_ready(app_url)
+        if args.mode == "cached":
+            # One pass over every distinct URL so the measured run is all hits
+            async with httpx.AsyncClient(base_url=app_url, timeout=300) as c:
+                for endpoint in mix:
+                    names = {"stats": players, "clubstats": clubs}
+                    for name in names.get(endpoint, [None]):
+                        await c.get(driver.endpoint_path(endpoint, [name], [name]))
+
+        usage = driver.ResourceUsage()
+        sampler = asyncio.create_task(
+            driver.sample_resources(app_url, app.pid, usage)
+        )
+        started = time.perf_counter()
+        samples = await driver.run_users(
+            app_url, mix, args.users, args.duration, players, clubs
+        )
+        elapsed = time.perf_counter() - started
+        sampler.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await sampler
+        return driver.summarize(samples, elapsed, usage)
+    finally:
+        app.terminate()
+        app.wait(timeout=30)
+        server.should_exit = True
+        await serving
+
+
+async def record(args):
+    """Save the rendered HTML of live upstream pages for later replay."""
+    from playwright.async_api import async_playwright
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True, args=["--no-sandbox"])
+        page = await browser.new_page()
+        for path in args.paths:
+            await page.goto(args.base_url.rstrip("/") + path)
+            (args.out / upstream.recorded_name(path.split("?")[0])).write_text(
+                await page.content()
+            )
+            print(f"recorded {path}")
+        await browser.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.loadtest")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run a load test")
+    run_parser.add_argument("--users", type=int, default=10)
+    run_parser.add_argument("--duration", type=float, default=30.0)
+    run_parser.add_argument("--mode", choices=("cached", "cold"), default="cached")
+    run_parser.add_argument(
+        "--mix", help="weights, e.g. table=35,results=25,stats=30,clubstats=10"
+    )
+    run_parser.add_argument("--latency-ms", type=float, default=150.0)
+    run_parser.add_argument("--jitter-ms", type=float, default=50.0)
+    run_parser.add_argument("--pages", type=Path, help="directory of recorded pages")
+    run_parser.add_argument("--app", default="epl_api.asgi:app", help="ASGI target")
+    run_parser.add_argument("--api-prefix", default="/api/v1")
+    run_parser.add_argument("--port", type=int, default=8765)
+    run_parser.add_argument("--upstream-port", type=int, default=8766)
+    run_parser.add_argument("--json", type=Path, help="also write the report here")
+
+    record_parser = commands.add_parser("record", help="record upstream pages")
+    record_parser.add_argument("--out", type=Path, required=True)
+    record_parser.add_argument("--base-url", default="https://www.premierleague.com")
+    record_parser.add_argument(
+        "paths",
+        nargs="*",
+        default=["/tables", "/results", "/fixtures", "/clubs", "/players"],
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "record":
+        asyncio.run(record(args))
+        return
+
+    report = asyncio.run(run(args))
+    print(driver.format_report(report))
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
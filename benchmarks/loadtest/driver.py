@@ -0,0 +1,196 @@
+"""Drive a weighted traffic mix against the API and summarise what happened."""
+import asyncio
+import os
+import random
+import re
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+import httpx
+
+DEFAULT_MIX = {"table": 35, "results": 25, "stats": 30, "clubstats": 10}
+
+
+@dataclass
+class Sample:
+    endpoint: str
+    status: int
+    latency: float
+
+
+@dataclass
+class ResourceUsage:
+    rss_mb: List[float] = field(default_factory=list)
+    browsers: List[float] = field(default_factory=list)
+
+
+def endpoint_path(endpoint: str, players: List[str], clubs: List[str]) -> str:
+    if endpoint == "stats":
+        return f"/stats/{random.choice(players)}"
+    if endpoint == "clubstats":
+        club = random.choice(clubs)
+        return f"/clubstats/{club}?club={club}"
+    return f"/{endpoint}"
+
+
+def parse_mix(spec: str) -> Dict[str, int]:
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in DEFAULT_MIX:
+            raise ValueError(f"Unknown endpoint in mix: {name}")
+        mix[name.strip()] = int(weight)
+    return mix
+
+
+async def run_users(
+    base_url: str,
+    mix: Dict[str, int],
+    users: int,
+    duration: float,
+    players: List[str],
+    clubs: List[str],
+    timeout: float = 120.0,
+) -> List[Sample]:
+    """Run ``users`` closed-loop clients for ``duration`` seconds."""
+    samples: List[Sample] = []
+    names, weights = list(mix), list(mix.values())
+    deadline = time.perf_counter() + duration
+
+    async def user(client: httpx.AsyncClient):
+        while time.perf_counter() < deadline:
+            endpoint = random.choices(names, weights)[0]
+            started = time.perf_counter()
+            try:
+                response = await client.get(endpoint_path(endpoint, players, clubs))
+                status = response.status_code
+            except httpx.HTTPError:
+                status = 0
+            samples.append(Sample(endpoint, status, time.perf_counter() - started))
+
+    limits = httpx.Limits(max_connections=users)
+    async with httpx.AsyncClient(
+        base_url=base_url, timeout=timeout, limits=limits
+    ) as client:
+        await asyncio.gather(*(user(client) for _ in range(users)))
+    return samples
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(samples: List[Sample], elapsed: float, usage: ResourceUsage) -> dict:
+    by_endpoint = defaultdict(list)
+    for sample in samples:
+        by_endpoint[sample.endpoint].append(sample)
+    by_endpoint["all"] = samples
+
+    def _stats(group: List[Sample]) -> dict:
+        latencies = sorted(s.latency * 1000 for s in group)
+        return {
+            "requests": len(group),
+            "errors": sum(1 for s in group if not 200 <= s.status < 300),
+            "throughput_rps": round(len(group) / elapsed, 2) if elapsed else 0.0,
+            "p50_ms": round(percentile(latencies, 50), 1),
+            "p95_ms": round(percentile(latencies, 95), 1),
+            "p99_ms": round(percentile(latencies, 99), 1),
+        }
+
+    return {
+        "elapsed_s": round(elapsed, 2),
+        "endpoints": {name: _stats(group) for name, group in sorted(by_endpoint.items())},
+        "peak_rss_mb": round(max(usage.rss_mb, default=0.0), 1),
+        "peak_browsers": max(usage.browsers, default=0.0),
+    }
+
+
+def format_report(report: dict) -> str:
+    lines = [
+        f"{'endpoint':<12}{'reqs':>8}{'errors':>8}{'rps':>10}"
+        f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    ]
+    for name, s in report["endpoints"].items():
+        lines.append(
+            f"{name:<12}{s['requests']:>8}{s['errors']:>8}{s['throughput_rps']:>10}"
+            f"{s['p50_ms']:>10}{s['p95_ms']:>10}{s['p99_ms']:>10}"
+        )
+    lines.append(
+        f"elapsed {report['elapsed_s']}s, peak RSS {report['peak_rss_mb']} MB, "
+        f"peak browsers {report['peak_browsers']:g}"
+    )
+    return "\n".join(lines)
+
+
+def process_tree_rss_mb(pid: int) -> Optional[float]:
+    """Resident memory of ``pid`` and all its descendants, read from /proc."""
+    proc = Path("/proc")
+    if not proc.exists():
+        return None
+    children = defaultdict(list)
+    for stat in proc.glob("[0-9]*/stat"):
+        try:
+            fields = stat.read_text().rsplit(")", 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        children[int(fields[1])].append(int(stat.parent.name))
+
+    total_kb, pending = 0, [pid]
+    while pending:
+        current = pending.pop()
+        pending.extend(children.get(current, []))
+        try:
+            status = (proc / str(current) / "status").read_text()
+        except OSError:
+            continue
+        match = re.search(r"VmRSS:\s+(\d+) kB", status)
+        total_kb += int(match.group(1)) if match else 0
+    return total_kb / 1024
+
+
+async def sample_resources(
+    base_url: str, pid: int, usage: ResourceUsage, interval: float = 0.5
+):
+    """Poll RSS and the ``epl_browsers_open`` gauge until cancelled.
+
+    ``base_url`` includes the API prefix, as for every helper here.
+    """
+    async with httpx.AsyncClient(base_url=base_url, timeout=5) as client:
+        while True:
+            rss = process_tree_rss_mb(pid)
+            if rss is not None:
+                usage.rss_mb.append(rss)
+            try:
+                metrics = (await client.get("/metrics")).text
+                match = re.search(r"^epl_browsers_open ([\d.e+]+)$", metrics, re.M)
+                if match:
+                    usage.browsers.append(float(match.group(1)))
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(interval)
+
+
+async def wait_until_ready(base_url: str, timeout: float = 60.0):
+    deadline = time.perf_counter() + timeout
+    async with httpx.AsyncClient(base_url=base_url, timeout=2) as client:
+        while time.perf_counter() < deadline:
+            try:
+                if (await client.get("/")).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"{base_url} did not become ready within {timeout}s")
+
+
+def app_env(upstream_url: str, cold: bool) -> Dict[str, str]:
+    env = dict(os.environ, EPL_BASE_URL=upstream_url)
+    if cold:
+        # A zero timeout makes every cache write a no-op, so each request scrapes
+        env["EPL_CACHE_TIMEOUT"] = "0"
+    return env
@@ -0,0 +1,226 @@
+"""A local stand-in for premierleague.com.
+
+Pages mirror the markup the scrapers select on. When a directory of recorded
+pages is given (see ``python -m benchmarks.loadtest record``) those are served
+instead, keyed by URL path. Every response is delayed by a configurable latency.
+"""
+import asyncio
+import random
+from pathlib import Path
+from typing import Optional
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import HTMLResponse
+from starlette.routing import Route
+
+CLUBS = [
+    "Arsenal", "Aston Villa", "Bournemouth", "Brentford", "Brighton",
+    "Chelsea", "Crystal Palace", "Everton", "Fulham", "Ipswich Town",
+    "Leicester City", "Liverpool", "Manchester City", "Manchester United",
+    "Newcastle United", "Nottingham Forest", "Southampton", "Tottenham Hotspur",
+    "West Ham United", "Wolverhampton Wanderers",
+]
+PLAYERS = [
+    ("Bukayo Saka", "Midfielder"),
+    ("Erling Haaland", "Forward"),
+    ("Mohamed Salah", "Forward"),
+    ("Virgil van Dijk", "Defender"),
+    ("Bruno Fernandes", "Midfielder"),
+    ("Cole Palmer", "Midfielder"),
+]
+
+COOKIE_BANNER = '<button id="onetrust-accept-btn-handler">Accept All Cookies</button>'
+FIRST_TEAM_TAB = '<ul><li data-tab-index="0" data-text="First Team">First Team</li></ul>'
+
+
+def slug(name: str) -> str:
+    return "-".join(name.lower().split())
+
+
+def short_name(club: str) -> str:
+    return club[:3].upper()
+
+
+def _page(body: str) -> str:
+    return f"<html><body>{COOKIE_BANNER}<main id='mainContent'>{body}</main></body></html>"
+
+
+def _fixture_pairs():
+    for i, home in enumerate(CLUBS):
+        away = CLUBS[(i + 7) % len(CLUBS)]
+        yield 1000 + i, home, away
+
+
+def tables_page(request: Request) -> str:
+    rows = "".join(
+        f"<tr><td>{pos}</td>"
+        f"<td><span class='league-table__team-name--long'>{club}</span></td>"
+        f"<td>8</td><td>5</td><td>2</td><td>1</td><td>15</td><td>7</td>"
+        f"<td>+8</td><td>17</td><td>W D W L W W</td></tr>"
+        for pos, club in enumerate(CLUBS, start=1)
+    )
+    return _page(
+        FIRST_TEAM_TAB
+        + "<div class='league-table__all-tables-container allTablesContainer'>"
+        + f"<table><tbody>{rows}</tbody></table></div>"
+    )
+
+
+def results_page(request: Request) -> str:
+    items = "".join(
+        f"<li class='match-fixture' data-home='{home}' data-away='{away}'>"
+        f"<span class='match-fixture__score'>{match_id % 4} - {match_id % 3}</span></li>"
+        for match_id, home, away in _fixture_pairs()
+    )
+    return _page(FIRST_TEAM_TAB + f"<ul>{items}</ul>")
+
+
+def fixtures_page(request: Request) -> str:
+    items = "".join(
+        f"<li class='match-fixture' data-home='{home}' data-away='{away}'>"
+        f"<time datetime='2024-11-{1 + i % 28:02d}T15:00:00Z'>15:00</time></li>"
+        for i, (_, home, away) in enumerate(_fixture_pairs())
+    )
+    return _page(FIRST_TEAM_TAB + f"<ul>{items}</ul>")
+
+
+def clubs_page(request: Request) -> str:
+    items = "".join(
+        f"<li class='club-card-wrapper'><a href='/clubs/{i}/{slug(club)}/overview'>"
+        f"<h2 class='club-card__name'>{club}</h2></a></li>"
+        for i, club in enumerate(CLUBS, start=1)
+    )
+    return _page(f"<ul class='club-list dataContainer'>{items}</ul>")
+
+
+def club_results_page(request: Request) -> str:
+    club = CLUBS[int(request.path_params["club_id"]) - 1]
+    host = request.url.netloc
+    items = "".join(
+        "<li class='match-fixture'>"
+        f"<div class='match-fixture__wrapper' data-href='//{host}/match/{match_id}'>"
+        "<span class='match-fixture__team'>"
+        f"<span class='match-fixture__short-name'>{short_name(home)}</span></span>"
+        f"<span class='match-fixture__score'>{match_id % 4}-{match_id % 3}</span>"
+        "<span class='match-fixture__team'>"
+        f"<span class='match-fixture__short-name'>{short_name(away)}</span></span>"
+        "</div></li>"
+        for match_id, home, away in _fixture_pairs()
+        if club in (home, away)
+    )
+    return _page(f"<div class='fixtures__matches-list'><ul class='matchList'>{items}</ul></div>")
+
+
+def squad_page(request: Request) -> str:
+    sections = []
+    for position in ("Goalkeepers", "Defenders", "Midfielders", "Forwards"):
+        players = "".join(
+            f"<li>{n} Player {position[0]}{n} {position[:-1]} Appearances {n + 3} "
+            f"Goals {n % 4} Assists {n % 3} Clean sheets {n % 2} View Profile</li>"
+            for n in range(1, 6)
+        )
+        sections.append(f"<li>{position}</li>{players}")
+    return _page(f"<ul class='squadListContainer squad-list'>{''.join(sections)}</ul>")
+
+
+def _lineup(team: str, active: bool) -> str:
+    side = "homeLineup active" if active else "awayLineup"
+    starters = "".join(f" Shirt number {n} First{n} Last{n}" for n in range(1, 12))
+    subs = "".join(f" Shirt number {n} Sub{n} Bench{n} 78'" for n in range(12, 16))
+    return (
+        f"<div class='teamList mcLineUpContainter {side}'>"
+        f"{team} 4-3-3 Formation{starters} Substitutes{subs}</div>"
+    )
+
+
+def match_page(request: Request) -> str:
+    match_id = int(request.path_params["match_id"])
+    home, away = next((h, a) for i, h, a in _fixture_pairs() if i == match_id)
+    events = "".join(
+        f"<div class='matchEventsContainer {side}'><div class='mc-summary__event'>"
+        "<div class='mc-summary__player-names-container'>"
+        f"<span class='mc-summary__assister'>First{n} Last{n} (Assist) {n * 9}’</span>"
+        "</div></div></div>"
+        for n, side in ((7, "home"), (9, "away"))
+    )
+    return _page(
+        "<ul><li role='tab' data-tab-index='1'>Line-ups</li>"
+        "<li role='tab' data-tab-index='2'>Stats</li></ul>"
+        f"<div class='matchLineups'>{_lineup(home, True)}{_lineup(away, False)}</div>"
+        f"{events}"
+        "<div class='matchCentreStatsContainer'>54.2 Possession % 45.8 "
+        "14 Shots 9 6 Shots on target 3 7 Corners 4 11 Fouls conceded 13</div>"
+    )
+
+
+def players_page(request: Request) -> str:
+    host = request.url.netloc
+    rows = "".join(
+        "<tr class='player'><td>"
+        f"<a class='player__name' href='//{host}/players/{i}/{slug(name)}/overview'>"
+        f"{name}</a></td><td class='player__position'>{position}</td>"
+        "<td><span class='player__country'>England</span></td></tr>"
+        for i, (name, position) in enumerate(PLAYERS[:2], start=1)
+    )
+    return _page(
+        "<input placeholder='Search for a Player'>"
+        f"<table><tbody class='dataContainer indexSection'>{rows}</tbody></table>"
+    )
+
+
+def player_stats_page(request: Request) -> str:
+    def section(title, stats):
+        values = "".join(
+            f"<div class='player-stats__stat-value'>{name}"
+            f"<span class='allStatContainer'>{value}</span></div>"
+            for name, value in stats
+        )
+        return f"<li class='player-stats__stat'><div>{title}</div>{values}</li>"
+
+    return _page(
+        "<div class='player-stats__top-stats'>"
+        "<span class='statappearances'>180</span><span class='statgoals'>52</span>"
+        "<span class='statwins'>110</span><span class='statlosses'>35</span></div><ul>"
+        + section("Attack", [("Goals", 52), ("Shots", 390), ("Shooting accuracy %", "41%")])
+        + section("Team Play", [("Assists", 47), ("Passes", 5400), ("Crosses", 620)])
+        + section("Discipline", [("Yellow cards", 17), ("Red cards", 0), ("Fouls", 98)])
+        + section("Defence", [("Tackles", 190), ("Interceptions", 70), ("Clearances", 40)])
+        + "</ul>"
+    )
+
+
+ROUTES = [
+    ("/tables", tables_page),
+    ("/results", results_page),
+    ("/fixtures", fixtures_page),
+    ("/clubs", clubs_page),
+    ("/clubs/{club_id:int}/{club_slug}/results", club_results_page),
+    ("/clubs/{club_id:int}/{club_slug}/squad", squad_page),
+    ("/match/{match_id:int}", match_page),
+    ("/players", players_page),
+    ("/players/{player_id:int}/{player_slug}/stats", player_stats_page),
+]
+
+
+def create_app(
+    latency_ms: float = 0, jitter_ms: float = 0, pages_dir: Optional[Path] = None
+) -> Starlette:
+    """Build the fake site; each response waits ``latency_ms`` ± ``jitter_ms``."""
+
+    def handler(render):
+        async def endpoint(request: Request):
+            delay = latency_ms + random.uniform(-jitter_ms, jitter_ms)
+            if delay > 0:
+                await asyncio.sleep(delay / 1000)
+            recorded = pages_dir and pages_dir / recorded_name(request.url.path)
+            if recorded and recorded.exists():
+                return HTMLResponse(recorded.read_text())
+            return HTMLResponse(render(request))
+
+        return endpoint
+
+    return Starlette(routes=[Route(path, handler(render)) for path, render in ROUTES])
+
+
+def recorded_name(path: str) -> str:
+    return (path.strip("/").replace("/", "__") or "index") + ".html"
@@ -0,0 +1,166 @@
+"""Compare per-row validation of parser output with bulk validation.
+
+    python -m benchmarks.materialize --sizes 20 380 5000
+
+Before: each row is validated on its own, and player stats are built as section
+models, dumped to dicts and validated again. After: every row of a response is
+validated in one call through a cached list ``TypeAdapter``, with player stats
+as plain nested dicts. Player stats are also timed with ``model_construct``
+throughout, which skips validation but costs more than it saves here.
+"""
+import argparse
+import json
+import os
+import timeit
+
+import django
+
+SECTIONS = ("attack", "team_play", "discipline", "defence")
+
+
+def table_rows(size: int) -> list:
+    return [
+        {
+            "position": str(n % 20 + 1),
+            "club": f"Club {n}",
+            "played": "38",
+            "won": str(n % 30),
+            "drawn": str(n % 9),
+            "lost": str(n % 12),
+            "gf": str(n % 90),
+            "ga": str(n % 70),
+            "gd": str(n % 90 - n % 70),
+            "points": str(n % 100),
+            "form": "WDLWW",
+        }
+        for n in range(size)
+    ]
+
+
+def result_rows(size: int) -> list:
+    return [
+        {"home": f"Club {n}", "away": f"Club {n + 1}", "score": f"{n % 5}-{n % 3}"}
+        for n in range(size)
+    ]
+
+
+def player_rows(size: int) -> list:
+    """Player stats as ``extract_p_stats`` has them just before building models."""
+    from epl_api.v1.schemas import PlayerStatsSchema
+
+    fields = {
+        name: list(PlayerStatsSchema.model_fields[name].annotation.model_fields)
+        for name in SECTIONS
+    }
+    return [
+        {
+            "player_name": f"Player {n}",
+            "position": "Midfielder",
+            "club": f"Club {n % 20}",
+            "appearances": str(n % 300),
+            "goals": str(n % 90),
+            "wins": str(n % 150),
+            "losses": str(n % 80),
+            **{
+                section: {field: str(n % 50) for field in names}
+                for section, names in fields.items()
+            },
+        }
+        for n in range(size)
+    ]
+
+
+def legacy_players(rows: list) -> list:
+    from epl_api.v1.schemas import PlayerStatsSchema
+
+    sections = {
+        name: PlayerStatsSchema.model_fields[name].annotation for name in SECTIONS
+    }
+    dumped = [
+        {**row, **{s: sections[s](**row[s]).model_dump() for s in SECTIONS}}
+        for row in rows
+    ]
+    return [PlayerStatsSchema(**row) for row in dumped]
+
+
+def players(rows: list) -> list:
+    from epl_api.v1.codec import list_adapter
+    from epl_api.v1.schemas import PlayerStatsSchema
+
+    return list_adapter(PlayerStatsSchema).validate_python(rows)
+
+
+def constructed_players(rows: list) -> list:
+    """``model_construct`` on every model: unvalidated, but a Python loop per field."""
+    from epl_api.v1.schemas import PlayerStatsSchema
+
+    sections = {
+        name: PlayerStatsSchema.model_fields[name].annotation for name in SECTIONS
+    }
+    return [
+        PlayerStatsSchema.model_construct(
+            **{**row, **{s: sections[s].model_construct(**row[s]) for s in SECTIONS}}
+        )
+        for row in rows
+    ]
+
+
+def per_row_us(func, rows: list, repeat: int) -> float:
+    best = min(timeit.repeat(lambda: func(rows), number=1, repeat=repeat))
+    return round(best * 1e6 / max(len(rows), 1), 3)
+
+
+def measure(sizes, repeat: int) -> dict:
+    from epl_api.v1.codec import list_adapter
+    from epl_api.v1.schemas import ResultSchema, TableSchema
+
+    def per_row(schema):
+        return lambda rows: [schema(**row) for row in rows]
+
+    def bulk(schema):
+        return lambda rows: list_adapter(schema).validate_python(rows)
+
+    cases = {
+        "table": (table_rows, per_row(TableSchema), bulk(TableSchema)),
+        "results": (result_rows, per_row(ResultSchema), bulk(ResultSchema)),
+        "player_stats": (player_rows, legacy_players, players),
+        "player_stats_constructed": (player_rows, legacy_players, constructed_players),
+    }
+    report = {}
+    for size in sizes:
+        report[str(size)] = {}
+        for name, (generate, before, after) in cases.items():
+            rows = generate(size)
+            assert [m.model_dump() for m in before(rows)] == [
+                m.model_dump() for m in after(rows)
+            ]
+            report[str(size)][name] = {
+                "before_us_per_row": per_row_us(before, rows, repeat),
+                "after_us_per_row": per_row_us(after, rows, repeat),
+            }
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20, 380, 5000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "epl_api.settings")
+    django.setup()
+    report = measure(args.sizes, args.repeat)
+    for size, cases in report.items():
+        for name, result in cases.items():
+            print(
+                f"{size:>6} rows {name:<24} before {result['before_us_per_row']} "
+                f"us/row, after {result['after_us_per_row']} us/row"
+            )
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Compare the squad and line-up parsers with the previous regex-per-field ones.
+
+    python -m benchmarks.parsers --sizes 100 1000 10000
+    python -m benchmarks.parsers --squad-file squad.txt --lineup-file lineup.txt
+
+Without files, texts of ``size`` players are generated in the site's format.
+Time per player should stay flat as the size grows.
+"""
+import argparse
+import json
+import re
+import timeit
+
+from epl_api.v1.parsers import parse_lineup, parse_squad
+
+POSITIONS = ("Goalkeepers", "Defenders", "Midfielders", "Forwards")
+
+
+def squad_text(size: int) -> str:
+    per_position = max(1, size // len(POSITIONS))
+    return "\n".join(
+        f"{position}\n"
+        + "\n".join(
+            f"  {n} Player{n} {position[:-1]}{n} {position[:-1]} England\n"
+            f"  Appearances {n % 38} Goals {n % 9} Assists {n % 7} "
+            f"Clean sheets {n % 5} Saves {n % 3} Shots {n % 50} View Profile"
+            for n in range(per_position)
+        )
+        for position in POSITIONS
+    )
+
+
+def lineup_text(size: int) -> str:
+    events = ("Goal", "Yellow", "Red", "label.penaltyscore", "", "Goal Goal")
+    starters = "".join(
+        f"\n  Shirt number {n} First{n} Last{n} {events[n % 6]} {60 + n % 30}'"
+        for n in range(size // 2)
+    )
+    subs = "".join(
+        f"\n  Shirt number {n} Sub{n} Bench{n} {events[n % 6]}"
+        for n in range(size // 2, size)
+    )
+    return f"Arsenal 4-3-3 Formation{starters} Substitutes{subs}"
+
+
+def legacy_squad(text: str) -> dict:
+    text = re.sub(r"\s+", " ", text.replace("\n", " ")).strip()
+    player_data = {}
+    sections = re.split(r"(Goalkeepers|Defenders|Midfielders|Forwards)", text)
+    for i in range(1, len(sections), 2):
+        position = sections[i].strip()
+        player_data[position] = []
+        for entry in sections[i + 1].strip().split("View Profile"):
+            entry = entry.strip()
+            if not entry:
+                continue
+            name_pos = entry.find("Appearances")
+            info = {
+                "name": entry[:name_pos].rsplit(" ", 1)[0].strip()
+                if name_pos != -1
+                else "Unknown"
+            }
+            for key, label in (
+                ("appearances", "Appearances"),
+                ("goals", "Goals"),
+                ("assists", "Assists"),
+                ("clean_sheets", "Clean sheets"),
+                ("saves", "Saves"),
+                ("shots", "Shots"),
+            ):
+                match = re.search(rf"{label} (\d+)", entry)
+                info[key] = int(match.group(1)) if match else 0
+            player_data[position].append(info)
+    return player_data
+
+
+def legacy_lineup(text: str) -> dict:
+    team_info = (
+        text.strip().replace("\n", " ").replace("  ", " ").split(" Shirt number ")
+    )
+
+    def players(entries, default):
+        result = {}
+        for entry in entries:
+            parts = entry.split()
+            minutes = [p for p in parts if "'" in p and p.replace("'", "").isdigit()]
+            result[" ".join(parts[1:3])] = {
+                "name": " ".join(parts[1:3]),
+                "yellow_cards": 1 if "Yellow" in parts else 0,
+                "red_cards": 1 if "Red" in parts else 0,
+                "goals": entry.count("Goal") + entry.count("label.penaltyscore"),
+                "minutes": minutes[0].strip("'") if minutes else default,
+            }
+        return result
+
+    subi = next((i for i, e in enumerate(team_info) if "Substitutes" in e), None)
+    starters = team_info[: subi + 1] if subi else team_info
+    substitutes = team_info[subi + 1 :] if subi else []
+    return {
+        "formation": starters[0].split()[-2],
+        "starters": players(starters[1:], "90"),
+        "substitutes": players(substitutes, "0"),
+    }
+
+
+def per_player_us(func, text: str, players: int, repeat: int) -> float:
+    best = min(timeit.repeat(lambda: func(text), number=1, repeat=repeat))
+    return round(best * 1e6 / max(players, 1), 3)
+
+
+def measure(texts: dict, repeat: int) -> dict:
+    report = {}
+    for label, (squad, lineup, players) in texts.items():
+        assert parse_squad(squad) == legacy_squad(squad)
+        report[label] = {
+            "players": players,
+            "squad_us_per_player": per_player_us(parse_squad, squad, players, repeat),
+            "legacy_squad_us_per_player": per_player_us(
+                legacy_squad, squad, players, repeat
+            ),
+            "lineup_us_per_player": per_player_us(parse_lineup, lineup, players, repeat),
+            "legacy_lineup_us_per_player": per_player_us(
+                legacy_lineup, lineup, players, repeat
+            ),
+        }
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[30, 300, 3000])
+    parser.add_argument("--squad-file", help="recorded squad list text")
+    parser.add_argument("--lineup-file", help="recorded line-up text")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args(argv)
+
+    if args.squad_file and args.lineup_file:
+        with open(args.squad_file) as f:
+            squad = f.read()
+        with open(args.lineup_file) as f:
+            lineup = f.read()
+        players = sum(map(len, parse_squad(squad).values()))
+        texts = {"recorded": (squad, lineup, players)}
+    else:
+        texts = {
+            str(size): (squad_text(size), lineup_text(size), size)
+            for size in args.sizes
+        }
+
+    report = measure(texts, args.repeat)
+    for label, result in report.items():
+        print(
+            f"{label:>9} players: squad {result['squad_us_per_player']} us/player "
+            f"(legacy {result['legacy_squad_us_per_player']}), "
+            f"lineup {result['lineup_us_per_player']} us/player "
+            f"(legacy {result['legacy_lineup_us_per_player']})"
+        )
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
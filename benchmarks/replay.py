@@ -0,0 +1,97 @@
+"""Time the real browser path of each scraper, offline, from recorded HAR archives.
+
+    EPL_HAR_MODE=record python -m benchmarks.replay --runs 1
+    python -m benchmarks.replay --runs 5 --json replay.json
+
+Recording hits premierleague.com once; replays never leave the machine, so the
+numbers are Chromium, parsing and validation cost without network variance.
+Scrapers are called below the cache, and the mode defaults to replay.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+import django
+
+SCRAPERS = ("fixtures", "player", "results", "table")
+
+
+async def _drain(result):
+    if hasattr(result, "__aiter__"):
+        return [item async for item in result]
+    return result
+
+
+def scrapers(player: str) -> dict:
+    from epl_api.views import get_fixtures, get_results, get_table
+
+    # ``__wrapped__`` skips cache_result but keeps the navigation budget
+    return {
+        "table": lambda page: get_table.__wrapped__(page=page),
+        "results": lambda page: get_results.__wrapped__(page=page),
+        "fixtures": lambda page: get_fixtures.__wrapped__(page=page),
+        "player": lambda page: _player(player, page),
+    }
+
+
+async def _player(player: str, page):
+    from epl_api.v1.helpers import extract_player_stats
+
+    return [stats async for stats in await extract_player_stats(player, page)]
+
+
+async def time_scraper(scrape, runs: int) -> dict:
+    from epl_api.v1.dependencies import launch_page
+
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        async with launch_page() as page:
+            rows = await _drain(await scrape(page))
+        times.append((time.perf_counter() - started) * 1000)
+    times.sort()
+    return {
+        "rows": len(rows or []),
+        "median_ms": round(statistics.median(times), 1),
+        "min_ms": round(times[0], 1),
+        "max_ms": round(times[-1], 1),
+    }
+
+
+async def measure(names, runs: int, player: str) -> dict:
+    available = scrapers(player)
+    return {name: await time_scraper(available[name], runs) for name in names}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument(
+        "--scraper",
+        action="append",
+        choices=SCRAPERS,
+        help="repeat to pick several; defaults to all",
+    )
+    parser.add_argument("--player", default="Bukayo Saka")
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "epl_api.settings")
+    os.environ.setdefault("EPL_HAR_MODE", "replay")
+    django.setup()
+    names = args.scraper or SCRAPERS
+    report = asyncio.run(measure(names, args.runs, args.player))
+    for name, result in report.items():
+        print(
+            f"{name:<9} median {result['median_ms']} ms "
+            f"(min {result['min_ms']}, max {result['max_ms']}); {result['rows']} rows"
+        )
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
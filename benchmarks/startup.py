@@ -0,0 +1,103 @@
+"""Measure how long ``epl_api.asgi`` takes to import, with and without lean startup.
+
+    python -m benchmarks.startup --runs 10
+    python -m benchmarks.startup --runs 5 --top 15 --json startup.json
+
+Every run is a fresh interpreter, so the numbers are cold-start costs.
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ("bs4", "lxml.etree", "playwright.async_api", "django.contrib.admin")
+
+PROBE = """
+import sys, time
+started = time.perf_counter()
+import epl_api.asgi
+elapsed = time.perf_counter() - started
+print("elapsed", elapsed)
+print("loaded", ",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+
+def probe(lean: bool) -> dict:
+    env = dict(os.environ, EPL_LEAN_STARTUP="1" if lean else "0")
+    env.setdefault("DJANGO_SETTINGS_MODULE", "epl_api.settings")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE.format(heavy=HEAVY_MODULES)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed = float(re.search(r"^elapsed (\S+)$", proc.stdout, re.M).group(1))
+    loaded = re.search(r"^loaded (.*)$", proc.stdout, re.M).group(1)
+    modules = {}
+    for line in proc.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \| ( *)(\S+)", line)
+        if match:
+            depth = len(match.group(2)) // 2
+            modules.setdefault(match.group(3), (int(match.group(1)), depth))
+    return {
+        "elapsed_ms": elapsed * 1000,
+        "loaded": [m for m in loaded.split(",") if m],
+        "modules": modules,
+    }
+
+
+def measure(lean: bool, runs: int, top: int) -> dict:
+    samples = [probe(lean) for _ in range(runs)]
+    last = samples[-1]["modules"]
+    slowest = sorted(
+        # Direct imports of top-level modules; deeper ones are already included
+        ((name, us) for name, (us, depth) in last.items() if depth == 1),
+        key=lambda item: item[1],
+        reverse=True,
+    )[:top]
+    times = sorted(s["elapsed_ms"] for s in samples)
+    return {
+        "median_ms": round(statistics.median(times), 1),
+        "min_ms": round(times[0], 1),
+        "max_ms": round(times[-1], 1),
+        "heavy_modules_loaded": samples[-1]["loaded"],
+        "slowest_imports_ms": {name: round(us / 1000, 1) for name, us in slowest},
+    }
+
+
+def format_report(report: dict) -> str:
+    lines = []
+    for mode, result in report.items():
+        lines.append(
+            f"{mode:<8} median {result['median_ms']} ms "
+            f"(min {result['min_ms']}, max {result['max_ms']}); "
+            f"heavy modules: {', '.join(result['heavy_modules_loaded']) or 'none'}"
+        )
+        for name, ms in result["slowest_imports_ms"].items():
+            lines.append(f"    {ms:>8} ms  {name}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list")
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args(argv)
+
+    report = {
+        "default": measure(lean=False, runs=args.runs, top=args.top),
+        "lean": measure(lean=True, runs=args.runs, top=args.top),
+    }
+    print(format_report(report))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
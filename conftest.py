@@ -0,0 +1,5 @@
+import os
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "epl_api.settings")
+django.setup()
@@ -8,19 +8,36 @@ https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
 """
 
 import os
+from contextlib import asynccontextmanager
 
-from django.core.asgi import get_asgi_application
+from django.conf import settings
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from epl_api.urls import router
+from epl_api.v1.browsers import shutdown_browsers
+from epl_api.v1.profiling import ProfilingMiddleware
+from epl_api.v1.exceptions import (
+    ClientDisconnected,
+    Forbidden,
+    NotFound,
+    ScrapeFailed,
+    ScrapeQueued,
+    UpstreamUnavailable,
+)
+from epl_api.views import (
+    client_disconnected_handler,
+    forbidden_handler,
+    not_found_handler,
+    scrape_failed_handler,
+    scrape_queued_handler,
+    upstream_unavailable_handler,
+)
 from starlette.applications import Starlette
 from starlette.routing import Mount
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "epl_api.settings")
 
-django_app = get_asgi_application()
-
 app = FastAPI(
     title="EPL API",
     description="""An open source Premier League API client, designed to 
@@ -40,11 +57,40 @@ app.add_middleware(
 
 app.add_middleware(GZipMiddleware, minimum_size=500)
 
+# Outermost, so a profile covers compression and the other middleware too
+app.add_middleware(ProfilingMiddleware)
+
 app.include_router(router, prefix="/api/v1")
 
-application = Starlette(
-    routes=[
-        Mount("/api/v1", app=app), 
-        Mount("/", app=django_app), 
-    ]
-)
+app.add_exception_handler(NotFound, not_found_handler)
+app.add_exception_handler(ScrapeFailed, scrape_failed_handler)
+app.add_exception_handler(ScrapeQueued, scrape_queued_handler)
+app.add_exception_handler(UpstreamUnavailable, upstream_unavailable_handler)
+app.add_exception_handler(ClientDisconnected, client_disconnected_handler)
+app.add_exception_handler(Forbidden, forbidden_handler)
+
+
+@asynccontextmanager
+async def lifespan(application):
+    # Mount does not pass lifespan events on to ``app``, so browsers are
+    # closed here, on the one shutdown path
+    yield
+    await shutdown_browsers()
+
+
+if settings.LEAN_STARTUP:
+    # The API needs only settings and the cache, not the admin/auth/session
+    # apps that get_asgi_application() sets up
+    application = Starlette(routes=[Mount("/api/v1", app=app)], lifespan=lifespan)
+else:
+    from django.core.asgi import get_asgi_application
+
+    django_app = get_asgi_application()
+
+    application = Starlette(
+        routes=[
+            Mount("/api/v1", app=app), 
+            Mount("/", app=django_app), 
+        ],
+        lifespan=lifespan,
+    )
@@ -129,13 +129,213 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 CACHES = {
     'default': {
         'BACKEND': 'django_redis.cache.RedisCache',
-        'LOCATION': 'redis://127.0.0.1:6379/1',  
+        'LOCATION': os.environ.get('EPL_REDIS_URL', 'redis://127.0.0.1:6379/1'),
         'OPTIONS': {
             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            # Codec entries are stored as written instead of pickled a second time
+            'SERIALIZER': 'epl_api.v1.codec.CodecSerializer',
         }
     }
 }
 
-CACHE_TIMEOUT = 72 * 60 * 60  # 72 hours
+# asyncio client used by cache_result, pooled per event loop; the sync cache above
+# still serves management commands and background bookkeeping
+ASYNC_CACHE = {
+    "MAX_CONNECTIONS": int(os.environ.get("EPL_REDIS_MAX_CONNECTIONS", 50)),
+    "SOCKET_TIMEOUT": float(os.environ.get("EPL_REDIS_SOCKET_TIMEOUT", 2)),
+    "CONNECT_TIMEOUT": float(os.environ.get("EPL_REDIS_CONNECT_TIMEOUT", 2)),
+}
+
+# Scrapes share one Chromium per event loop. The watchdog retires it after
+# MAX_PAGES pages, or once the browser process tree exceeds MAX_RSS_MB (checked
+# at most every RSS_CHECK_INTERVAL seconds); open pages finish first.
+# With ENDPOINT set, workers connect over CDP to the Chromium run by
+# `manage.py browserservice` on PORT instead of launching their own.
+# PAGE_QUOTA > 0 caps open pages across all workers through Redis; slots are
+# granted first come first served and expire after QUOTA_LEASE_TTL seconds
+# unless renewed. Waiting longer than QUOTA_MAX_WAIT seconds answers 503.
+BROWSER = {
+    "HEADLESS": os.environ.get("EPL_BROWSER_HEADLESS", "1").lower()
+    in ("1", "true", "yes"),
+    "MAX_PAGES": int(os.environ.get("EPL_BROWSER_MAX_PAGES", 200)),
+    "MAX_RSS_MB": int(os.environ.get("EPL_BROWSER_MAX_RSS_MB", 1536)),
+    "RSS_CHECK_INTERVAL": float(os.environ.get("EPL_BROWSER_RSS_CHECK_INTERVAL", 30)),
+    "ENDPOINT": os.environ.get("EPL_BROWSER_ENDPOINT", ""),  # e.g. http://127.0.0.1:9222
+    "PORT": int(os.environ.get("EPL_BROWSER_PORT", 9222)),
+    "PAGE_QUOTA": int(os.environ.get("EPL_BROWSER_PAGE_QUOTA", 0)),
+    "QUOTA_LEASE_TTL": float(os.environ.get("EPL_BROWSER_QUOTA_LEASE_TTL", 60)),
+    "QUOTA_MAX_WAIT": float(os.environ.get("EPL_BROWSER_QUOTA_MAX_WAIT", 30)),
+    "QUOTA_POLL_INTERVAL": 0.1,
+}
+
+# "record" saves the traffic of every scrape as a HAR archive in DIR; "replay"
+# serves scrapes from those archives only and aborts anything they do not hold
+HAR = {
+    "MODE": os.environ.get("EPL_HAR_MODE", "off"),  # off | record | replay
+    "DIR": os.environ.get("EPL_HAR_DIR", str(BASE_DIR / "har")),
+}
+
+# Serve only the API from asgi.application, skipping Django's ASGI handler and
+# the apps it loads. Meant for serverless deploys where cold starts matter.
+LEAN_STARTUP = os.environ.get("EPL_LEAN_STARTUP", "").lower() in ("1", "true", "yes")
+
+CACHE_TIMEOUT = int(os.environ.get("EPL_CACHE_TIMEOUT", 72 * 60 * 60))  # 72 hours
+
+BASE_URL = os.environ.get("EPL_BASE_URL", "https://www.premierleague.com")
+
+# Per-stage Playwright timeouts in milliseconds
+SCRAPE_TIMEOUTS = {
+    "browser_launch": int(os.environ.get("EPL_TIMEOUT_BROWSER_LAUNCH", 30_000)),
+    "goto": int(os.environ.get("EPL_TIMEOUT_GOTO", 30_000)),
+    "cookie": int(os.environ.get("EPL_TIMEOUT_COOKIE", 5_000)),
+    "selector": int(os.environ.get("EPL_TIMEOUT_SELECTOR", 30_000)),
+}
+
+# Overall deadline (ms) per page type for goto, selector waits and the consent
+# check combined, and the goto wait mode. List pages wait for their target
+# selector anyway, so navigation can return as soon as the response commits.
+NAVIGATION = {
+    "default": {"BUDGET": 20000, "WAIT_UNTIL": "domcontentloaded"},
+    "fixtures": {"BUDGET": 20000, "WAIT_UNTIL": "commit"},
+    "results": {"BUDGET": 20000, "WAIT_UNTIL": "commit"},
+    "table": {"BUDGET": 20000, "WAIT_UNTIL": "commit"},
+    "players": {"BUDGET": 20000, "WAIT_UNTIL": "commit"},
+    "player_stats": {"BUDGET": 15000, "WAIT_UNTIL": "domcontentloaded"},
+    "clubs": {"BUDGET": 15000, "WAIT_UNTIL": "domcontentloaded"},
+    "club_results": {"BUDGET": 20000, "WAIT_UNTIL": "domcontentloaded"},
+    "squad": {"BUDGET": 15000, "WAIT_UNTIL": "domcontentloaded"},
+    "match": {"BUDGET": 30000, "WAIT_UNTIL": "domcontentloaded"},
+    "live": {"BUDGET": 25000, "WAIT_UNTIL": "domcontentloaded"},
+}
+
+# Request tracing; spans are exported as OTLP-shaped JSON to a file or collector
+TRACING = {
+    "ENABLED": os.environ.get("EPL_TRACING", "").lower() in ("1", "true", "yes"),
+    "EXPORTER": os.environ.get("EPL_TRACING_EXPORTER", "file"),  # file | otlp
+    "PATH": os.environ.get("EPL_TRACING_PATH", str(BASE_DIR / "traces.jsonl")),
+    "ENDPOINT": os.environ.get(
+        "EPL_TRACING_ENDPOINT", "http://127.0.0.1:4318/v1/traces"
+    ),
+    "BATCH_SIZE": 64,
+}
+
+# On-demand profiling. A request whose X-EPL-Profile header carries TOKEN, or a
+# SAMPLE_RATE share of all requests, runs under a stack sampler that takes a
+# sample every INTERVAL seconds. Speedscope files are written to DIR, the newest
+# KEEP are kept, and they are listed at /profiles with the same token. With no
+# token and a zero rate, a request only pays for reading these two settings.
+PROFILING = {
+    "TOKEN": os.environ.get("EPL_PROFILE_TOKEN", ""),
+    "SAMPLE_RATE": float(os.environ.get("EPL_PROFILE_SAMPLE_RATE", 0)),
+    "INTERVAL": float(os.environ.get("EPL_PROFILE_INTERVAL", 0.005)),
+    "DIR": os.environ.get("EPL_PROFILE_DIR", str(BASE_DIR / "profiles")),
+    "KEEP": int(os.environ.get("EPL_PROFILE_KEEP", 50)),
+}
+
+# Scrape jobs (cache misses, queued jobs, exports) share CAPACITY slots per
+# process. Free slots go to the highest class waiting; under contention a class
+# holds at most SHARE of them. RESERVED slots stay free for that class and the
+# ones above it. A job still queued after DEADLINE seconds is refused.
+SCRAPE_SCHEDULER = {
+    "CAPACITY": int(os.environ.get("EPL_SCHEDULER_CAPACITY", 8)),
+    "CLASSES": {
+        "interactive": {
+            "SHARE": 0.6,
+            "RESERVED": 2,
+            "DEADLINE": float(os.environ.get("EPL_SCHEDULER_INTERACTIVE_DEADLINE", 20)),
+        },
+        "refresh": {
+            "SHARE": 0.25,
+            "RESERVED": 0,
+            "DEADLINE": float(os.environ.get("EPL_SCHEDULER_REFRESH_DEADLINE", 120)),
+        },
+        "bulk": {
+            "SHARE": 0.15,
+            "RESERVED": 0,
+            "DEADLINE": float(os.environ.get("EPL_SCHEDULER_BULK_DEADLINE", 900)),
+        },
+    },
+    "DISCONNECT_POLL": 0.5,  # seconds between client checks while queued
+}
+
+# Shared limits for all traffic to BASE_URL (per process)
+UPSTREAM_GOVERNOR = {
+    "RATE": float(os.environ.get("EPL_UPSTREAM_RATE", 5)),  # navigations per second
+    "BURST": int(os.environ.get("EPL_UPSTREAM_BURST", 10)),
+    "MAX_IN_FLIGHT": int(os.environ.get("EPL_UPSTREAM_MAX_IN_FLIGHT", 8)),
+    "MAX_QUEUE_WAIT": float(os.environ.get("EPL_UPSTREAM_MAX_QUEUE_WAIT", 10)),
+    "FAILURE_THRESHOLD": int(os.environ.get("EPL_UPSTREAM_FAILURE_THRESHOLD", 5)),
+    "RESET_TIMEOUT": float(os.environ.get("EPL_UPSTREAM_RESET_TIMEOUT", 30)),
+}
+
+# process_fixture is tried ATTEMPTS times, sleeping a random 0..min(MAX_DELAY,
+# BASE_DELAY * 2**n) seconds between tries. Matches that still miss a section are
+# kept for INCOMPLETE_TIMEOUT seconds, after which only they are scraped again,
+# up to INCOMPLETE_ATTEMPTS scrapes in all; then they are kept as they are.
+FIXTURE_RETRY = {
+    "ATTEMPTS": int(os.environ.get("EPL_FIXTURE_RETRY_ATTEMPTS", 3)),
+    "BASE_DELAY": float(os.environ.get("EPL_FIXTURE_RETRY_BASE_DELAY", 0.5)),
+    "MAX_DELAY": float(os.environ.get("EPL_FIXTURE_RETRY_MAX_DELAY", 8)),
+    "INCOMPLETE_TIMEOUT": int(os.environ.get("EPL_INCOMPLETE_MATCH_TIMEOUT", 15 * 60)),
+    "INCOMPLETE_ATTEMPTS": int(os.environ.get("EPL_INCOMPLETE_MATCH_ATTEMPTS", 3)),
+}
+
+# Last good copy of every cached result, served while the upstream is shed
+STALE_CACHE_TIMEOUT = int(os.environ.get("EPL_STALE_CACHE_TIMEOUT", 7 * 24 * 60 * 60))
+
+# "Not found" and failed scrapes are remembered separately and briefly
+NEGATIVE_CACHE_TIMEOUT = int(os.environ.get("EPL_NEGATIVE_CACHE_TIMEOUT", 10 * 60))
+FAILURE_CACHE_TIMEOUT = int(os.environ.get("EPL_FAILURE_CACHE_TIMEOUT", 60))
+
+# Cached results are stored as FORMAT (orjson | msgpack | pickle), compressed with
+# COMPRESSION (zstd | lz4 | zlib | none) once they reach THRESHOLD bytes. Bump
+# VERSION when a cached schema changes so old entries read as misses.
+CACHE_CODEC = {
+    "FORMAT": os.environ.get("EPL_CACHE_FORMAT", "orjson"),
+    "COMPRESSION": os.environ.get("EPL_CACHE_COMPRESSION", "zstd"),
+    "THRESHOLD": int(os.environ.get("EPL_CACHE_COMPRESSION_THRESHOLD", 1024)),
+    "VERSION": 1,
+}
+
+# Leaderboards and comparisons rank players from an in-memory matrix built out of
+# cached /stats results, rebuilt at most every REFRESH seconds
+LEADERBOARD = {"REFRESH": int(os.environ.get("EPL_LEADERBOARD_REFRESH", 5 * 60))}
+
+# "scrape": API workers launch Chromium on a cache miss. "cache_only": they only
+# read the cache, queue misses on SCRAPE_QUEUE and answer with stale data or 202,
+# while `manage.py scrapeworker` processes do all browser work.
+SERVING_MODE = os.environ.get("EPL_SERVING_MODE", "scrape")
+
+SCRAPE_QUEUE = {
+    "BACKEND": os.environ.get("EPL_SCRAPE_QUEUE", "redis"),  # redis | memory
+    "KEY": "epl:scrape_jobs",
+    "PENDING_TIMEOUT": 5 * 60,  # one queued job per key until done or expired
+    "RETRY_AFTER": 5,
+}
 
-BASE_URL = "https://www.premierleague.com"
\ No newline at end of file
+# Seasons the API can serve, keyed by label, with premierleague.com's compSeason
+# ids. Past seasons are cached without expiry; only CURRENT uses CACHE_TIMEOUT.
+SEASONS = {
+    "CURRENT": os.environ.get("EPL_CURRENT_SEASON", "2024-25"),
+    "IDS": {
+        "2024-25": 719,
+        "2023-24": 578,
+        "2022-23": 489,
+        "2021-22": 418,
+        "2020-21": 363,
+        "2019-20": 274,
+    },
+}
+
+# Revisions of /results, /fixtures and /table kept for ?since= deltas. Older
+# revisions expire and clients asking for them get a full resync.
+SNAPSHOT_TIMEOUT = int(os.environ.get("EPL_SNAPSHOT_TIMEOUT", 7 * 24 * 60 * 60))
+
+# Live match mode: one shared scraper polls in-progress fixtures every INTERVAL
+# seconds. A fixture counts as live for MATCH_WINDOW seconds after kickoff.
+LIVE = {
+    "INTERVAL": int(os.environ.get("EPL_LIVE_INTERVAL", 30)),
+    "MATCH_WINDOW": 135 * 60,
+    "QUEUE_SIZE": 100,
+    "HEARTBEAT": 15,
+}
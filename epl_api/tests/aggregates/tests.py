@@ -0,0 +1,272 @@
+import pytest
+from unittest.mock import patch
+from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
+
+from epl_api.v1.aggregates import (
+    MatchStore,
+    club_aggregates,
+    club_stats_timeout,
+    identify_team,
+    mark_completeness,
+)
+from epl_api.v1.exceptions import NotFound
+from epl_api.v1.seasons import season_key
+from epl_api.v1.utils import store_result
+from epl_api.views import aggregate_club_stats, team_level_features
+
+
+def _player(name, minutes, goals=0):
+    return {"name": name, "minutes": minutes, "goals": goals,
+            "yellow_cards": 0, "red_cards": 0}
+
+
+def _match(match_id, home, away, formation, stats, players, assists):
+    club = "Arsenal"
+    opponent = away if home == club else home
+    return {
+        "match_id": match_id,
+        "home": home,
+        "away": away,
+        "score": "2-0",
+        "lineups": {
+            club: {
+                "formation": formation,
+                "starters": {p["name"]: p for p in players},
+                "substitutes": {},
+            },
+            opponent: {"formation": "4-4-2", "starters": {}, "substitutes": {}},
+        },
+        "assists": {club: [{"name": n, "minute": 10} for n in assists], opponent: []},
+        "match_stats": {club: stats, opponent: {"Shots": 1}},
+    }
+
+
+MATCHES = [
+    _match("101", "Arsenal", "Chelsea", "4-3-3", {"Shots": 20, "Possession %": 60.0},
+           [_player("Bukayo Saka", "90", 2), _player("Declan Rice", "90")], ["Declan Rice"]),
+    _match("102", "Everton", "Arsenal", "4-3-3", {"Shots": 10, "Possession %": 50.0},
+           [_player("Bukayo Saka", "75", 1), _player("Declan Rice", "90")], ["Declan Rice"]),
+    _match("103", "Arsenal", "Spurs", "4-2-3-1", {"Shots": 15},
+           [_player("Bukayo Saka", "90")], ["Bukayo Saka"]),
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_identify_team_uses_frequency_then_hint():
+    assert identify_team(MATCHES, "gunners") == "Arsenal"
+    assert identify_team(MATCHES[1:2], "arsenal") == "Arsenal"
+
+
+def test_aggregates_cover_totals_splits_and_leaders():
+    MatchStore("arsenal").save(MATCHES)
+
+    agg = club_aggregates("arsenal")
+
+    assert agg["team"] == "Arsenal" and agg["matches"] == 3
+    assert agg["totals"]["Shots"] == 45
+    assert agg["per_match"]["Possession %"] == 55.0
+    assert agg["home"]["matches"] == 2 and agg["away"]["totals"]["Shots"] == 10
+    assert agg["formations"] == {"4-3-3": 2, "4-2-3-1": 1}
+    assert agg["minutes"] == {"Bukayo Saka": 255, "Declan Rice": 180}
+    assert agg["goal_leaders"] == [{"name": "Bukayo Saka", "count": 3}]
+    assert agg["assist_leaders"][0] == {"name": "Declan Rice", "count": 2}
+
+
+def test_new_matches_are_folded_in_incrementally():
+    store = MatchStore("arsenal")
+    store.save(MATCHES[:2])
+    assert club_aggregates("arsenal")["matches"] == 2
+
+    store.save(MATCHES[2:])
+    with patch.object(MatchStore, "load", wraps=store.load) as load:
+        agg = club_aggregates("arsenal")
+
+    assert agg["matches"] == 3 and agg["totals"]["Shots"] == 45
+    load.assert_called_once_with({"103"})
+    assert club_aggregates("arsenal") == agg
+
+
+class _Locator:
+    def __init__(self, value=None, items=()):
+        self.value, self.items = value, items
+
+    def locator(self, selector):
+        if "short-name" in selector:
+            return _Locator(self.value["home" if "nth-child(1)" in selector else "away"])
+        if "score" in selector:
+            return _Locator("2-0")
+        return _Locator(self.value)
+
+    async def get_attribute(self, name):
+        return f"/match/{self.value['id']}"
+
+    async def inner_text(self):
+        return self.value
+
+    async def all(self):
+        return self.items
+
+
+@pytest.mark.asyncio
+async def test_stored_fixtures_are_not_scraped_again():
+    store = MatchStore("arsenal")
+    store.save(MATCHES[:1])
+    fixtures = [
+        _Locator({"id": "101", "home": "Arsenal", "away": "Chelsea"}),
+        _Locator({"id": "102", "home": "Everton", "away": "Arsenal"}),
+    ]
+
+    class Page:
+        def locator(self, selector):
+            return _Locator(items=fixtures)
+
+    async def process(fixture, home, away):
+        return {k: v for k, v in MATCHES[1].items() if k not in ("match_id", "score")}
+
+    with patch("epl_api.views.goto"), patch("epl_api.views.onetrust_accept_cookie"):
+        with patch("epl_api.views.process_fixture", side_effect=process) as scraped:
+            results = [r async for r in team_level_features("link", Page(), store)]
+
+    assert scraped.call_count == 1
+    assert [r["match_id"] for r in results] == ["101", "102"]
+    assert store.ids() == {"101", "102"}
+
+
+def test_completeness_flags_name_missing_sections():
+    partial = {k: v for k, v in MATCHES[0].items() if k != "match_stats"}
+    no_assists = {**MATCHES[0], "assists": {"Arsenal": [], "Chelsea": []}}
+
+    assert mark_completeness(dict(MATCHES[0]))["complete"] is True
+    assert mark_completeness(no_assists)["missing"] == []
+    assert mark_completeness(partial)["missing"] == ["match_stats"]
+    assert mark_completeness({"match_id": "104"})["missing"] == [
+        "lineups", "assists", "match_stats"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_incomplete_fixtures_are_refilled_once_due():
+    store = MatchStore("arsenal")
+    store.save(MATCHES[:1])
+    fixtures = [
+        _Locator({"id": "101", "home": "Arsenal", "away": "Chelsea"}),
+        _Locator({"id": "102", "home": "Everton", "away": "Arsenal"}),
+    ]
+    attempts = []
+
+    class Page:
+        def locator(self, selector):
+            return _Locator(items=fixtures)
+
+    async def process(fixture, home, away):
+        attempts.append(fixture["href"])
+        match = {k: v for k, v in MATCHES[1].items() if k not in ("match_id", "score")}
+        if len(attempts) == 1:
+            del match["match_stats"]
+        return match
+
+    async def scrape():
+        return [r async for r in team_level_features("link", Page(), store)]
+
+    with patch("epl_api.views.goto"), patch("epl_api.views.onetrust_accept_cookie"):
+        with patch("epl_api.views.process_fixture", side_effect=process):
+            first = await scrape()
+            assert first[1]["missing"] == ["match_stats"]
+            assert store.ids() == {"101"} and store.has_partial()
+            timeout = await club_stats_timeout("arsenal")
+            assert timeout == settings.FIXTURE_RETRY["INCOMPLETE_TIMEOUT"]
+
+            # Still within INCOMPLETE_TIMEOUT: the partial record is served as-is
+            again = await scrape()
+            assert again[1]["missing"] == ["match_stats"] and again[1]["checked_at"]
+            assert len(attempts) == 1
+
+            retry = {**settings.FIXTURE_RETRY, "INCOMPLETE_TIMEOUT": 0}
+            with override_settings(FIXTURE_RETRY=retry):
+                second = await scrape()
+
+    assert len(attempts) == 2
+    assert second[1]["complete"] is True
+    assert store.ids() == {"101", "102"} and not store.has_partial()
+    assert await club_stats_timeout("arsenal") == settings.CACHE_TIMEOUT
+
+
+@pytest.mark.asyncio
+async def test_match_that_stays_incomplete_is_settled_after_capped_attempts():
+    store = MatchStore("arsenal")
+    partial = mark_completeness(
+        {k: v for k, v in MATCHES[0].items() if k != "lineups"}
+    )
+    retry = {**settings.FIXTURE_RETRY, "INCOMPLETE_ATTEMPTS": 2}
+
+    with override_settings(FIXTURE_RETRY=retry):
+        store.save([partial])
+        assert store.ids() == set() and store.has_partial()
+        assert await club_stats_timeout("arsenal") == retry["INCOMPLETE_TIMEOUT"]
+
+        store.save([partial])
+
+        assert store.ids() == {"101"} and not store.has_partial()
+        assert await club_stats_timeout("arsenal") == settings.CACHE_TIMEOUT
+    settled = store.load()["101"]
+    assert settled["missing"] == ["lineups"] and settled["attempts"] == 2
+    assert club_aggregates("arsenal")["matches"] == 1
+
+
+@pytest.mark.asyncio
+async def test_fixture_that_keeps_failing_becomes_an_incomplete_record():
+    fixtures = [_Locator({"id": "105", "home": "Arsenal", "away": "Spurs"})]
+
+    class Page:
+        def locator(self, selector):
+            return _Locator(items=fixtures)
+
+    retry = {**settings.FIXTURE_RETRY, "ATTEMPTS": 2}
+    with patch("epl_api.views.goto"), patch("epl_api.views.onetrust_accept_cookie"):
+        with patch(
+            "epl_api.views.process_fixture", side_effect=TimeoutError("goto")
+        ) as scraped, patch("epl_api.v1.utils.asyncio.sleep"):
+            with override_settings(FIXTURE_RETRY=retry):
+                [result] = [r async for r in team_level_features("link", Page())]
+
+    assert scraped.call_count == 2
+    assert result["match_id"] == "105" and result["complete"] is False
+    assert result["missing"] == ["lineups", "assists", "match_stats"]
+
+
+@pytest.mark.asyncio
+async def test_club_spellings_share_one_cache_entry_and_store():
+    store_result(
+        "club_directory",
+        [
+            {"name": "Arsenal", "link": "https://site/clubs/1/arsenal/overview"},
+            {"name": "Aston Villa", "link": "https://site/clubs/2/villa/overview"},
+        ],
+    )
+    stores = []
+
+    async def team(link, page, store):
+        stores.append(store.key)
+        yield MATCHES[0]
+
+    async def players(link, page):
+        return []
+
+    with patch("epl_api.views.team_level_features", side_effect=team):
+        with patch("epl_api.views.player_level_features", side_effect=players):
+            first = await aggregate_club_stats(club="ARSENAL", page=None)
+            second = await aggregate_club_stats(club="arsen", page=None)
+            with pytest.raises(NotFound):
+                await aggregate_club_stats(club="a", page=None)
+
+    assert first == second and len(stores) == 1
+    assert stores[0] == MatchStore("Arsenal").key
+    assert cache.get(season_key("club_stats_arsenal")) is not None
@@ -0,0 +1,83 @@
+import asyncio
+import time
+import pytest
+from unittest.mock import patch
+from django.core.cache import cache
+
+from epl_api.v1.async_cache import async_cache, reset_async_cache
+from epl_api.v1.codec import get_codec
+from epl_api.v1.utils import astore_result, cache_result, stale_key
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    reset_async_cache()
+    yield
+    reset_async_cache()
+    cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_entries_are_shared_with_the_sync_cache():
+    cache.set("sync_written", {"kind": "not_found"})
+    await async_cache().set("async_written", [1, 2, 3], timeout=60)
+
+    assert await async_cache().get("sync_written") == {"kind": "not_found"}
+    assert cache.get("async_written") == [1, 2, 3]
+    assert 0 < cache.ttl("async_written") <= 60
+
+
+@pytest.mark.asyncio
+async def test_get_many_is_one_round_trip_and_skips_misses():
+    await async_cache().set_many({"a": 1, "b": b"two"}, timeout=None)
+
+    with patch.object(
+        async_cache().client, "mget", wraps=async_cache().client.mget
+    ) as mget:
+        found = await async_cache().get_many(["a", "b", "missing"])
+
+    assert found == {"a": 1, "b": b"two"}
+    mget.assert_called_once()
+    assert cache.ttl("a") is None
+
+
+@pytest.mark.asyncio
+async def test_codec_entries_are_stored_raw():
+    encoded = get_codec().encode([{"club": "Arsenal"}])
+    await async_cache().set("async_codec", encoded, timeout=60)
+    cache.set("sync_codec", encoded, timeout=60)
+
+    for key in ("async_codec", "sync_codec"):
+        assert await async_cache().client.get(cache.make_key(key)) == encoded
+        assert await async_cache().get(key) == encoded
+        assert cache.get(key) == encoded
+
+
+@pytest.mark.asyncio
+async def test_store_writes_result_and_stale_copy():
+    await astore_result("epl_table", [{"club": "Arsenal"}], timeout=30)
+
+    assert 0 < cache.ttl("epl_table") <= 30
+    assert cache.get(stale_key("epl_table")) == cache.get("epl_table")
+
+
+@pytest.mark.asyncio
+async def test_cache_lookups_overlap_instead_of_blocking_the_loop():
+    @cache_result(lambda n: f"slow_{n}", use_generator=False)
+    async def lookup(n):
+        return [n]
+
+    client = async_cache().client
+    original = client.mget
+
+    async def slow_mget(*args, **kwargs):
+        await asyncio.sleep(0.2)
+        return await original(*args, **kwargs)
+
+    with patch.object(client, "mget", side_effect=slow_mget):
+        started = time.monotonic()
+        results = await asyncio.gather(*(lookup(n=n) for n in range(5)))
+
+    assert results == [[n] for n in range(5)]
+    assert time.monotonic() - started < 0.6
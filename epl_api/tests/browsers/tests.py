@@ -0,0 +1,131 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from django.test import override_settings
+
+from epl_api.v1.browsers import BrowserManager, process_tree_rss
+
+CONFIG = {
+    "HEADLESS": True,
+    "MAX_PAGES": 2,
+    "MAX_RSS_MB": 100,
+    "RSS_CHECK_INTERVAL": 0,
+    "ENDPOINT": "",
+}
+
+
+def _fake_playwright():
+    launched = []
+
+    def new_browser(**kwargs):
+        context = MagicMock(close=AsyncMock())
+        page = MagicMock(context=context)
+        context.new_page = AsyncMock(return_value=page)
+        browser = MagicMock(
+            new_context=AsyncMock(return_value=context),
+            close=AsyncMock(),
+            is_connected=MagicMock(return_value=True),
+            contexts=[],
+            launch_kwargs=kwargs,
+        )
+        launched.append(browser)
+        return browser
+
+    playwright = MagicMock(stop=AsyncMock())
+    playwright.chromium.launch = AsyncMock(side_effect=new_browser)
+    playwright.chromium.connect_over_cdp = AsyncMock(
+        side_effect=lambda endpoint, **kwargs: new_browser(endpoint=endpoint)
+    )
+    starter = MagicMock()
+    starter.return_value.start = AsyncMock(return_value=playwright)
+    return starter, launched
+
+
+@pytest.fixture
+def manager():
+    starter, launched = _fake_playwright()
+    with patch("epl_api.v1.browsers.async_playwright", starter), patch(
+        "epl_api.v1.browsers.process_tree_rss", return_value=0
+    ), override_settings(HAR={"MODE": "off", "DIR": "har"}):
+        yield BrowserManager(CONFIG), launched
+
+
+@pytest.mark.asyncio
+async def test_pages_are_closed_on_every_exit_path(manager):
+    manager, launched = manager
+
+    with pytest.raises(RuntimeError):
+        async with manager.page() as page:
+            assert manager.counts()["pages"] == 1
+            raise RuntimeError("scrape failed")
+
+    page.context.close.assert_awaited_once()
+    assert manager.counts() == {"browsers": 1, "pages": 0, "served": 1}
+    assert launched[0].launch_kwargs["headless"] is True
+
+
+@pytest.mark.asyncio
+async def test_page_outliving_a_shutdown_exits_cleanly(manager):
+    manager, launched = manager
+
+    async with manager.page():
+        await manager.close()
+
+    assert manager.counts() == {"browsers": 0, "pages": 0, "served": 1}
+    assert launched[0].close.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_browser_is_recycled_after_max_pages_once_drained(manager):
+    manager, launched = manager
+    async with manager.page():
+        pass
+    async with manager.page():
+        # Third page goes to a fresh browser; the old one still has this page
+        async with manager.page():
+            assert len(launched) == 2
+            launched[0].close.assert_not_awaited()
+
+    launched[0].close.assert_awaited_once()
+    launched[1].close.assert_not_awaited()
+    assert manager.counts() == {"browsers": 1, "pages": 0, "served": 1}
+
+    await manager.close()
+    launched[1].close.assert_awaited_once()
+    assert manager.counts()["browsers"] == 0
+
+
+@pytest.mark.asyncio
+async def test_rss_over_threshold_recycles_idle_browser(manager):
+    manager, launched = manager
+    async with manager.page():
+        pass
+
+    with patch("epl_api.v1.browsers.process_tree_rss", return_value=200 * 2**20):
+        async with manager.page():
+            pass
+
+    assert len(launched) == 2
+    launched[0].close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_remote_browser_is_shared_not_launched(manager):
+    manager, launched = manager
+    manager.config = {**CONFIG, "ENDPOINT": "http://127.0.0.1:9222"}
+
+    for _ in range(3):
+        async with manager.page():
+            pass
+
+    # One connection for every page: the browser service does the recycling
+    assert len(launched) == 1
+    assert launched[0].launch_kwargs == {"endpoint": "http://127.0.0.1:9222"}
+    manager.playwright.chromium.launch.assert_not_awaited()
+
+    await manager.close()
+    launched[0].close.assert_awaited_once()
+
+
+def test_process_tree_rss_counts_descendants():
+    rss = process_tree_rss()
+    assert rss is None or rss >= 0
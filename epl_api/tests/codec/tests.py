@@ -0,0 +1,88 @@
+import pickle
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+
+from epl_api.v1.codec import CacheCodec, rehydrate
+from epl_api.v1.schemas import (
+    AttackSchema,
+    DefenceSchema,
+    DisciplineSchema,
+    PlayerStatsSchema,
+    TeamPlaySchema,
+)
+from epl_api.v1.utils import cache_result
+
+
+def _players(n):
+    return [
+        PlayerStatsSchema(
+            player_name=f"Player {i}",
+            appearances=str(100 + i),
+            attack=AttackSchema(goals=str(i), shots="40"),
+            team_play=TeamPlaySchema(assists="7"),
+            discipline=DisciplineSchema(),
+            defence=DefenceSchema(tackles="12"),
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("fmt", ["orjson", "msgpack", "pickle"])
+@pytest.mark.parametrize("compression", ["zstd", "lz4", "zlib", "none"])
+def test_round_trip_rebuilds_schema_instances(fmt, compression):
+    codec = CacheCodec(fmt, compression, threshold=512, version=1)
+    players = _players(20)
+
+    encoded = codec.encode(players)
+
+    assert CacheCodec.describe(encoded)["compression"] == compression
+    assert rehydrate(codec.decode(encoded), PlayerStatsSchema) == players
+
+
+def test_small_values_skip_compression():
+    codec = CacheCodec("orjson", "zstd", threshold=1024, version=1)
+
+    encoded = codec.encode({"home": "Arsenal"})
+
+    assert CacheCodec.describe(encoded) == {
+        "version": 1,
+        "format": "orjson",
+        "compression": "none",
+    }
+
+
+def test_compressed_entries_are_much_smaller_than_pickled_models():
+    players = _players(50)
+    encoded = CacheCodec("orjson", "zstd", threshold=1024, version=1).encode(players)
+
+    assert len(encoded) * 5 < len(pickle.dumps(players))
+
+
+def test_version_mismatch_reads_as_miss_and_foreign_values_pass_through():
+    old = CacheCodec("orjson", "none", threshold=0, version=1).encode([1, 2])
+    codec = CacheCodec("orjson", "none", threshold=0, version=2)
+
+    assert codec.decode(old) is None
+    assert codec.decode(["legacy", "list"]) == ["legacy", "list"]
+
+
+@pytest.mark.asyncio
+async def test_cache_result_stores_encoded_bytes_and_reports_sizes(capsys):
+    cache.clear()
+    players = _players(30)
+
+    @cache_result("player_stats_codec", use_generator=False, schema=PlayerStatsSchema)
+    async def scrape():
+        return players
+
+    await scrape()
+    raw = cache.get("player_stats_codec")
+    assert CacheCodec.describe(raw)["compression"] == "zstd"
+    assert await scrape() == players
+
+    call_command("cachestats", pattern="player_stats_*")
+    out = capsys.readouterr().out
+    assert "orjson/zstd" in out
+    assert "player_stats_codec" in out
+
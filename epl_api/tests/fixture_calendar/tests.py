@@ -0,0 +1,196 @@
+from datetime import date, datetime, timezone
+import pytest
+from unittest.mock import AsyncMock, patch
+from django.core.cache import cache
+from fastapi.testclient import TestClient
+
+from epl_api.asgi import app
+from epl_api.v1.async_cache import reset_async_cache
+from epl_api.v1.dependencies import get_page
+from epl_api.v1.exceptions import NotFound
+from epl_api.v1.fixture_calendar import (
+    FixtureIndex,
+    query_bound,
+    reset_fixture_index,
+    to_ics,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    reset_async_cache()
+    reset_fixture_index()
+    yield
+    reset_fixture_index()
+    reset_async_cache()
+    cache.clear()
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+def full(rows, revision=1):
+    return {
+        "revision": revision,
+        "since": 0,
+        "full": True,
+        "inserted": rows,
+        "updated": [],
+        "removed": [],
+    }
+
+
+ROWS = [
+    {"home": "Arsenal", "away": "Chelsea", "time": "2024-05-04T15:00:00"},
+    {"home": "Spurs", "away": "Fulham", "time": "2024-05-04T17:30:00"},
+    {"home": "Chelsea", "away": "Spurs", "time": "2024-05-11T15:00:00"},
+    {"home": "Fulham", "away": "Arsenal", "time": "2024-05-12T14:00:00"},
+    {"home": "Everton", "away": "Luton", "time": None},
+]
+
+
+def test_range_and_club_queries_are_sorted_and_inclusive():
+    index = FixtureIndex()
+    index.apply(full(ROWS[::-1]))
+
+    week = index.between(utc(2024, 5, 4, 15), utc(2024, 5, 11, 15))
+    assert [(f["home"], f["away"]) for f in week] == [
+        ("Arsenal", "Chelsea"),
+        ("Spurs", "Fulham"),
+        ("Chelsea", "Spurs"),
+    ]
+    assert [f["home"] for f in index.between(club="arsenal")] == ["Arsenal", "Fulham"]
+    assert len(index) == 5  # unscheduled fixtures are kept, not listed
+    assert len(index.between()) == 4
+
+
+def test_next_match_for_a_club():
+    index = FixtureIndex()
+    index.apply(full(ROWS))
+
+    assert index.next_match("Arsenal", utc(2024, 5, 5))["home"] == "Fulham"
+    assert index.next_match("Arsenal", utc(2024, 5, 13)) is None
+    with pytest.raises(NotFound):
+        index.next_match("Wrexham", utc(2024, 5, 5))
+
+
+def test_deltas_update_only_the_rows_they_name():
+    index = FixtureIndex()
+    index.apply(full(ROWS))
+
+    moved = {**ROWS[0], "time": "2024-05-20T19:45:00", "previous": {"time": "x"}}
+    assert index.apply(
+        {
+            "revision": 2,
+            "since": 1,
+            "full": False,
+            "inserted": [],
+            "updated": [moved],
+            "removed": [ROWS[1]],
+        }
+    )
+
+    assert index.revision == 2
+    assert [f["home"] for f in index.between(club="Chelsea")] == ["Chelsea", "Arsenal"]
+    assert index.between(club="Fulham")[0]["away"] == "Arsenal"
+    assert "previous" not in index.between(club="Chelsea")[1]
+    # A delta from another revision is refused rather than misapplied
+    assert not index.apply({**full([]), "full": False, "since": 7})
+
+
+def test_matchweeks_split_when_a_club_plays_again():
+    index = FixtureIndex()
+    index.apply(full(ROWS))
+
+    weeks = index.matchweeks()
+
+    assert [len(w["fixtures"]) for w in weeks] == [2, 2]
+    assert weeks[1]["start"] == utc(2024, 5, 11, 15)
+
+
+def test_ics_export_is_rfc_5545_shaped():
+    index = FixtureIndex()
+    index.apply(full([{**ROWS[0], "home": "Brighton & Hove Albion, Sussex"}]))
+
+    ics = to_ics(index.between(), "Fixtures; all " + "x" * 80)
+
+    lines = ics.split("\r\n")
+    assert lines[0] == "BEGIN:VCALENDAR" and lines[-2] == "END:VCALENDAR"
+    assert "DTSTART:20240504T150000Z" in lines
+    assert "DTEND:20240504T165500Z" in lines
+    assert "SUMMARY:Brighton & Hove Albion\\, Sussex v Chelsea" in lines
+    assert all(len(line.encode()) <= 75 for line in lines)
+    assert any(line.startswith(" ") for line in lines)
+
+
+def test_bare_date_bounds_cover_the_whole_day():
+    index = FixtureIndex()
+    index.apply(full(ROWS))
+    may_4, may_11 = date(2024, 5, 4), date(2024, 5, 11)
+
+    # Both kickoffs on the 4th are after midnight, the old reading of "to"
+    assert [f["home"] for f in index.between(end=query_bound(may_4, end=True))] == [
+        "Arsenal",
+        "Spurs",
+    ]
+    day = index.between(query_bound(may_11), query_bound(may_11, end=True))
+    assert [(f["home"], f["away"]) for f in day] == [("Chelsea", "Spurs")]
+    assert query_bound(utc(2024, 5, 4, 15), end=True) == utc(2024, 5, 4, 15)
+
+
+def _page(*fixtures):
+    page = AsyncMock()
+    page.content.return_value = "".join(
+        f"<li class='match-fixture' data-home='{home}' data-away='{away}'>"
+        f"<time datetime='{when}'></time></li>"
+        for home, away, when in fixtures
+    )
+    return page
+
+
+def test_endpoints_serve_from_the_index_and_follow_cache_refreshes():
+    page = _page(
+        ("Arsenal", "Chelsea", "2024-05-04T15:00:00"),
+        ("Spurs", "Arsenal", "2024-05-11T15:00:00"),
+    )
+    app.dependency_overrides[get_page] = lambda: page
+    try:
+        with patch("epl_api.views.async_playwright"):
+            client = TestClient(app)
+            ranged = client.get(
+                "/api/v1/fixtures", params={"from": "2024-05-01", "to": "2024-05-05"}
+            )
+            same_day = client.get("/api/v1/fixtures", params={"to": "2024-05-04"})
+            timed = client.get(
+                "/api/v1/fixtures", params={"to": "2024-05-04T12:00:00Z"}
+            )
+            with patch("epl_api.views.datetime") as clock:
+                clock.now.return_value = utc(2024, 5, 5)
+                upcoming = client.get("/api/v1/fixtures/next/arsenal")
+            ics = client.get("/api/v1/fixtures/calendar.ics", params={"club": "spurs"})
+            weeks = client.get("/api/v1/fixtures/matchweeks")
+            navigations = page.goto.await_count
+
+            # The cached list expires and the rescrape moves a kickoff
+            cache.delete("epl_fixture")
+            page.content.return_value = _page(
+                ("Arsenal", "Chelsea", "2024-05-04T15:00:00"),
+                ("Spurs", "Arsenal", "2024-05-18T15:00:00"),
+            ).content.return_value
+            moved = client.get("/api/v1/fixtures", params={"club": "Spurs"})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert [f["home"] for f in ranged.json()] == ["Arsenal"]
+    assert ranged.json()[0]["kickoff"] == "2024-05-04T15:00:00Z"
+    assert [f["home"] for f in same_day.json()] == ["Arsenal"]
+    assert timed.json() == []
+    assert upcoming.json()["home"] == "Spurs"
+    assert ics.headers["content-type"].startswith("text/calendar")
+    assert "X-WR-CALNAME:Spurs fixtures" in ics.text
+    assert [w["round"] for w in weeks.json()] == [1, 2]
+    assert navigations == 1
+    assert moved.json()[0]["time"] == "2024-05-18T15:00:00"
+    assert page.goto.await_count == 2
@@ -0,0 +1,239 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from django.core.cache import cache
+from fastapi.testclient import TestClient
+
+from epl_api.asgi import app
+from epl_api.v1.dependencies import get_page
+from epl_api.v1.exceptions import BudgetExceeded, UpstreamUnavailable
+from epl_api.v1.governor import (
+    CircuitBreaker,
+    InFlightLimiter,
+    TokenBucket,
+    reset_upstream_governor,
+    upstream_governor,
+)
+from epl_api.v1.scheduler import priority
+from epl_api.v1.utils import cache_result, stale_key, wait_for
+
+
+@pytest.fixture(autouse=True)
+def fresh_governor():
+    reset_upstream_governor()
+    yield
+    reset_upstream_governor()
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_fails_fast_when_wait_exceeds_budget():
+    bucket = TokenBucket(rate=1, burst=2)
+    await bucket.acquire(max_wait=0)
+    await bucket.acquire(max_wait=0)
+
+    with pytest.raises(UpstreamUnavailable, match="rate limited"):
+        await bucket.acquire(max_wait=0.1)
+
+
+@pytest.mark.asyncio
+async def test_in_flight_limiter_caps_concurrency():
+    limiter = InFlightLimiter(limit=2)
+    running = peak = 0
+
+    async def navigate():
+        nonlocal running, peak
+        await limiter.acquire(max_wait=5)
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        limiter.release()
+
+    await asyncio.gather(*(navigate() for _ in range(6)))
+
+    assert peak == 2
+    assert limiter.active == 0
+
+
+@pytest.mark.asyncio
+async def test_in_flight_waiters_are_served_by_priority():
+    limiter = InFlightLimiter(limit=1)
+    await limiter.acquire(max_wait=0)
+    order = []
+
+    async def navigate(name, klass):
+        with priority(klass):
+            await limiter.acquire(max_wait=5)
+        order.append(name)
+        limiter.release()
+
+    waiting = [
+        asyncio.create_task(navigate("export", "bulk")),
+        asyncio.create_task(navigate("fixture", "refresh")),
+        asyncio.create_task(navigate("table", "interactive")),
+    ]
+    await asyncio.sleep(0)
+    limiter.release()
+    await asyncio.gather(*waiting)
+
+    assert order == ["table", "fixture", "export"]
+
+
+def test_circuit_breaker_opens_and_probes(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("epl_api.v1.governor.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(threshold=2, reset_timeout=30)
+
+    breaker.record_failure()
+    breaker.check()
+    breaker.record_failure()
+    with pytest.raises(UpstreamUnavailable, match="circuit open"):
+        breaker.check()
+
+    now[0] += 31
+    breaker.check()  # the single half-open probe
+    with pytest.raises(UpstreamUnavailable):
+        breaker.check()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_cancelled_in_flight_waiter_hands_its_slot_on():
+    limiter = InFlightLimiter(limit=1)
+    await limiter.acquire(max_wait=0)
+    waiter = asyncio.create_task(limiter.acquire(max_wait=5))
+    await asyncio.sleep(0)
+
+    limiter.release()  # grants the waiter, which is cancelled before it runs
+    waiter.cancel()
+    try:
+        await waiter
+        held = True  # wait_for before 3.12 keeps a result that beat the cancel
+    except asyncio.CancelledError:
+        held = False
+
+    assert limiter.active == (1 if held else 0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("where", ["queued", "running"])
+async def test_cancelled_half_open_probe_frees_the_probe(monkeypatch, where):
+    now = [100.0]
+    monkeypatch.setattr("epl_api.v1.governor.time.monotonic", lambda: now[0])
+    governor = upstream_governor()
+    governor.breaker.opened_at = now[0]
+    now[0] += governor.breaker.reset_timeout + 1
+    started = asyncio.Event()
+
+    async def probe():
+        async with governor.navigation():
+            started.set()
+            await asyncio.sleep(10)
+
+    if where == "queued":
+        # Every in-flight slot is taken, so the probe waits in the limiter
+        governor.in_flight.active = governor.in_flight.limit
+        task = asyncio.create_task(probe())
+        await asyncio.sleep(0)
+    else:
+        task = asyncio.create_task(probe())
+        await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    governor.in_flight.active = 0
+
+    assert governor.breaker.state == CircuitBreaker.HALF_OPEN
+    assert not governor.breaker.probing
+    async with governor.navigation():
+        pass
+    assert governor.breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_navigation_failures_open_the_breaker():
+    governor = upstream_governor()
+    for _ in range(governor.breaker.threshold):
+        with pytest.raises(TimeoutError):
+            async with governor.navigation():
+                raise TimeoutError("goto timed out")
+
+    with pytest.raises(UpstreamUnavailable):
+        async with governor.navigation():
+            pass
+    assert governor.in_flight.active == 0
+
+
+@pytest.mark.asyncio
+async def test_optional_waits_are_not_upstream_failures():
+    governor = upstream_governor()
+    page = MagicMock(wait_for_selector=AsyncMock(side_effect=TimeoutError("stats")))
+
+    for _ in range(governor.breaker.threshold):
+        with pytest.raises(TimeoutError):
+            await wait_for(page, ".matchCentreStatsContainer", optional=True)
+
+    assert governor.breaker.failures == 0
+    with pytest.raises(TimeoutError):
+        await wait_for(page, ".matchLineups")
+    assert governor.breaker.failures == 1
+
+
+def test_each_event_loop_gets_its_own_governor():
+    async def governor():
+        return upstream_governor()
+
+    first, second = asyncio.run(governor()), asyncio.run(governor())
+
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_exhausted_budgets_are_not_upstream_failures():
+    governor = upstream_governor()
+    for _ in range(governor.breaker.threshold):
+        with pytest.raises(BudgetExceeded):
+            async with governor.observe():
+                raise BudgetExceeded("results", "wait_for_selector")
+
+    assert governor.breaker.failures == 0
+    assert governor.breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_cache_result_serves_stale_copy_when_upstream_is_shed():
+    cache.clear()
+    cache.set(stale_key("epl_governed"), ["stale row"])
+
+    @cache_result("epl_governed", use_generator=False)
+    async def scrape():
+        raise UpstreamUnavailable("circuit open", retry_after=10)
+
+    assert await scrape() == ["stale row"]
+
+    cache.clear()
+    with pytest.raises(UpstreamUnavailable):
+        await scrape()
+
+
+def test_endpoint_fails_fast_with_503_while_breaker_is_open():
+    cache.clear()
+
+    def open_breaker():
+        # The governor belongs to the loop the client serves requests on
+        breaker = upstream_governor().breaker
+        for _ in range(breaker.threshold):
+            breaker.record_failure()
+
+    app.dependency_overrides[get_page] = lambda: AsyncMock()
+    try:
+        with TestClient(app) as client:
+            client.portal.call(open_breaker)
+            response = client.get("/api/v1/table")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 503
+    assert response.json()["reason"] == "circuit open"
+    assert int(response.headers["Retry-After"]) >= 1
@@ -0,0 +1,78 @@
+import os
+import pytest
+from unittest.mock import AsyncMock, MagicMock, call
+from django.test import override_settings
+
+from epl_api.v1.har import archives, close_browser, new_page
+
+
+def _browser():
+    context = MagicMock(
+        new_page=AsyncMock(return_value="page"),
+        route=AsyncMock(),
+        route_from_har=AsyncMock(),
+        close=AsyncMock(),
+    )
+    browser = MagicMock(
+        new_context=AsyncMock(return_value=context),
+        close=AsyncMock(),
+        contexts=[context],
+    )
+    return browser, context
+
+
+@pytest.mark.asyncio
+async def test_off_mode_opens_a_plain_context(tmp_path):
+    browser, context = _browser()
+
+    with override_settings(HAR={"MODE": "off", "DIR": str(tmp_path)}):
+        assert await new_page(browser) == "page"
+
+    browser.new_context.assert_awaited_once_with()
+    context.route.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_record_mode_writes_a_new_archive_per_context(tmp_path):
+    browser, _ = _browser()
+
+    with override_settings(HAR={"MODE": "record", "DIR": str(tmp_path / "har")}):
+        await new_page(browser)
+        await new_page(browser)
+
+    paths = [c.kwargs["record_har_path"] for c in browser.new_context.call_args_list]
+    assert len(set(paths)) == 2
+    assert all(p.startswith(str(tmp_path / "har")) and p.endswith(".har.zip") for p in paths)
+    assert browser.new_context.call_args.kwargs["record_har_mode"] == "full"
+
+
+@pytest.mark.asyncio
+async def test_replay_mode_routes_archives_and_aborts_the_rest(tmp_path):
+    older, newer = tmp_path / "a.har.zip", tmp_path / "b.har"
+    older.write_bytes(b"")
+    newer.write_bytes(b"")
+    os.utime(older, (1, 1))
+    browser, context = _browser()
+
+    with override_settings(HAR={"MODE": "replay", "DIR": str(tmp_path)}):
+        assert archives() == [older, newer]
+        await new_page(browser)
+
+    # Registered first, so it only runs when no archive has the request
+    assert context.route.call_args.args[0] == "**/*"
+    assert context.route_from_har.call_args_list == [
+        call(str(older), not_found="fallback"),
+        call(str(newer), not_found="fallback"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_contexts_are_closed_before_the_browser_so_archives_are_saved():
+    browser, context = _browser()
+    order = MagicMock()
+    order.attach_mock(context.close, "context")
+    order.attach_mock(browser.close, "browser")
+
+    await close_browser(browser)
+
+    assert order.mock_calls == [call.context(), call.browser()]
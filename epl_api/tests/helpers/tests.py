@@ -1,7 +1,9 @@
 import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock, patch
+from epl_api.v1.codec import list_adapter
 from epl_api.v1.helpers import extract_player_stats
+from epl_api.v1.schemas import PlayerStatsSchema, ResultSchema, TableSchema
 
 
 @pytest_asyncio.fixture
@@ -113,3 +115,35 @@ async def test_extract_player_stats(cookie, mock_page):
     assert player_data["defence"]["clearances"] == "7"
     assert player_data["defence"]["successful_50_50s"] == "44"
     assert cookie.call_count == 2  # on search and stats load
+
+    # Sections stay plain dicts until the view validates every player at once
+    (player,) = list_adapter(PlayerStatsSchema).validate_python(player_stats)
+    assert player.defence.successful_50_50s == "44"
+    assert player.discipline.red_cards == "7"
+
+
+TABLE_ROW = {
+    "position": "1", "club": "Arsenal", "played": "38", "won": "28", "drawn": "5",
+    "lost": "5", "gf": "91", "ga": "29", "gd": "62", "points": "89", "form": "WWWWW",
+}
+RESULT_ROW = {"home": "Arsenal", "away": "Everton", "score": "2-1", "kickoff": None}
+PLAYER_ROW = {
+    "player_name": "Declan Rice", "position": "Midfielder", "club": "Arsenal",
+    "appearances": "38", "goals": "7", "wins": "28", "losses": "5",
+    "attack": {"goals": "7"}, "team_play": {"assists": "8"},
+    "discipline": {"yellow_cards": "6"}, "defence": {"tackles": "77"},
+}
+
+
+@pytest.mark.parametrize(
+    "schema, row",
+    [
+        (TableSchema, TABLE_ROW),
+        (ResultSchema, RESULT_ROW),
+        (PlayerStatsSchema, PLAYER_ROW),
+    ],
+)
+def test_bulk_validation_builds_the_same_models_as_per_row(schema, row):
+    rows = [row, dict(row)]
+
+    assert list_adapter(schema).validate_python(rows) == [schema(**r) for r in rows]
@@ -0,0 +1,96 @@
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+from django.core.cache import cache
+from django.test import override_settings
+from fastapi.testclient import TestClient
+
+from epl_api.asgi import app
+from epl_api.v1 import worker
+from epl_api.v1.jobs import job_queue, pending_key, reset_job_queue
+from epl_api.v1.seasons import season_key
+from epl_api.v1.utils import stale_key, store_result
+
+RESULTS_PAGE = (
+    "<li class='match-fixture' data-home='Arsenal' data-away='Everton'>"
+    "<span class='match-fixture__score'>2-1</span></li>"
+)
+CACHE_ONLY = {
+    "SERVING_MODE": "cache_only",
+    "SCRAPE_QUEUE": {
+        "BACKEND": "memory",
+        "KEY": "epl:scrape_jobs",
+        "PENDING_TIMEOUT": 60,
+        "RETRY_AFTER": 3,
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def cache_only_mode():
+    cache.clear()
+    reset_job_queue()
+    with override_settings(**CACHE_ONLY):
+        yield
+    reset_job_queue()
+    cache.clear()
+
+
+@pytest.fixture
+def no_browser():
+    # Any browser launch in the API tier is a bug in this mode
+    with patch("epl_api.v1.dependencies.launch_page", side_effect=AssertionError):
+        yield
+
+
+def test_miss_enqueues_one_job_and_returns_202(no_browser):
+    client = TestClient(app)
+
+    responses = [client.get("/api/v1/results") for _ in range(3)]
+
+    assert {r.status_code for r in responses} == {202}
+    assert responses[0].headers["Retry-After"] == "3"
+    assert job_queue().jobs.qsize() == 1
+    job = job_queue().jobs.get_nowait()
+    assert job["func"] == "epl_api.views.get_results"
+    assert job["key"] == season_key("epl_results")
+
+
+def test_miss_serves_stale_copy_while_job_is_queued(no_browser):
+    key = season_key("epl_results")
+    store_result(key, [{"home": "Arsenal", "away": "Everton", "score": "1-1"}])
+    cache.delete(key)
+
+    response = TestClient(app).get("/api/v1/results")
+
+    assert response.status_code == 200
+    assert response.json()[0]["score"] == "1-1"
+    assert cache.get(stale_key(key)) is not None
+    assert job_queue().jobs.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_worker_fills_cache_for_the_api():
+    page = AsyncMock()
+    page.content.return_value = RESULTS_PAGE
+
+    @asynccontextmanager
+    async def fake_launch():
+        yield page
+
+    with patch("epl_api.v1.dependencies.launch_page", side_effect=AssertionError):
+        assert TestClient(app).get("/api/v1/results").status_code == 202
+
+    with patch.object(worker, "launch_page", fake_launch), patch(
+        "epl_api.views.async_playwright"
+    ):
+        assert await worker.run_worker(max_jobs=1, poll_timeout=1) == 1
+
+    key = season_key("epl_results")
+    assert cache.get(pending_key(key)) is None
+    with patch("epl_api.v1.dependencies.launch_page", side_effect=AssertionError):
+        response = TestClient(app).get("/api/v1/results")
+    assert response.status_code == 200
+    assert response.json() == [
+        {"home": "Arsenal", "away": "Everton", "score": "2-1", "kickoff": None}
+    ]
@@ -0,0 +1,117 @@
+import time
+import pytest
+from django.core.cache import cache
+from fastapi.testclient import TestClient
+
+from epl_api.asgi import app
+from epl_api.v1.exceptions import NotFound
+from epl_api.v1.leaderboard import (
+    StatsMatrix,
+    player_index,
+    reset_stats_matrices,
+    stats_matrix,
+)
+from epl_api.v1.seasons import season_key
+from epl_api.v1.utils import store_result
+
+
+def _player(name, position, club, goals, tackles, goals_per_match="N/A"):
+    return {
+        "player_name": name,
+        "position": position,
+        "club": club,
+        "appearances": "30",
+        "goals": goals,
+        "attack": {"goals_per_match": goals_per_match},
+        "defence": {"tackles": tackles},
+        "team_play": {},
+        "discipline": {},
+    }
+
+
+PLAYERS = [
+    _player("Erling Haaland", "Forward", "Man City", "27", "10", "0.87"),
+    _player("Bukayo Saka", "Midfielder", "Arsenal", "16", "35", "0.46"),
+    _player("Declan Rice", "Midfielder", "Arsenal", "7", "1,012"),
+    _player("William Saliba", "Defender", "Arsenal", "2", "N/A"),
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    reset_stats_matrices()
+    yield
+    reset_stats_matrices()
+    cache.clear()
+
+
+def test_top_n_ranks_descending_and_skips_missing_values():
+    matrix = StatsMatrix(PLAYERS)
+
+    top = matrix.top("defence.tackles", n=10)
+
+    assert [(p["player_name"], p["value"]) for p in top] == [
+        ("Declan Rice", 1012.0),
+        ("Bukayo Saka", 35.0),
+        ("Erling Haaland", 10.0),
+    ]
+    assert [p["rank"] for p in matrix.top("goals_per_match")] == [1, 2]
+
+
+def test_top_n_filters_by_position_and_club():
+    matrix = StatsMatrix(PLAYERS)
+
+    assert [p["player_name"] for p in matrix.top("goals", 2, club="arsenal")] == [
+        "Bukayo Saka",
+        "Declan Rice",
+    ]
+    assert [p["player_name"] for p in matrix.top("goals", position="Defender")] == [
+        "William Saliba"
+    ]
+
+
+def test_compare_and_unknown_names():
+    matrix = StatsMatrix(PLAYERS)
+
+    compared = matrix.compare(["erling haaland", "Bukayo Saka"])
+
+    assert compared["Erling Haaland"]["goals"] == 27.0
+    assert compared["Bukayo Saka"]["attack.goals_per_match"] == 0.46
+    assert compared["Bukayo Saka"]["attack.shots"] is None
+    with pytest.raises(NotFound):
+        matrix.compare(["Nobody"])
+    with pytest.raises(NotFound):
+        matrix.top("not_a_stat")
+
+
+def test_queries_stay_under_a_millisecond():
+    players = [
+        _player(f"Player {i}", "Midfielder", f"Club {i % 20}", str(i % 31), str(i))
+        for i in range(600)
+    ]
+    matrix = StatsMatrix(players)
+
+    started = time.perf_counter()
+    for _ in range(100):
+        matrix.top("tackles", 10, position="Midfielder", club="Club 3")
+    assert (time.perf_counter() - started) / 100 < 1e-3
+
+
+def test_endpoints_are_built_from_cached_player_stats():
+    for player in PLAYERS:
+        slug = player["player_name"].replace(" ", "").lower()
+        store_result(
+            season_key(f"player_stats_{slug}"), [player], index=player_index()
+        )
+    client = TestClient(app)
+
+    top = client.get("/api/v1/leaderboard/goals", params={"n": 2})
+    compared = client.get(
+        "/api/v1/compare", params=[("players", "Bukayo Saka"), ("players", "Declan Rice")]
+    )
+
+    assert [p["player_name"] for p in top.json()] == ["Erling Haaland", "Bukayo Saka"]
+    assert compared.json()["Declan Rice"]["defence.tackles"] == 1012.0
+    assert client.get("/api/v1/leaderboard/nonsense").status_code == 404
+    assert len(stats_matrix().names) == len(PLAYERS)
@@ -0,0 +1,202 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+import pytest
+from unittest.mock import MagicMock, patch
+from bs4 import BeautifulSoup
+from django.test import override_settings
+from fastapi.testclient import TestClient
+
+from epl_api.asgi import app
+from epl_api.v1 import live
+from epl_api.v1.live import LiveHub, diff_matches, in_progress, match_events
+from epl_api.v1.schemas import FixtureSchema
+
+LIVE = {"INTERVAL": 0.01, "MATCH_WINDOW": 135 * 60, "QUEUE_SIZE": 3, "HEARTBEAT": 1}
+
+
+def _match(score, goals=(), assists=(), cards=()):
+    return {
+        "home": "Arsenal",
+        "away": "Chelsea",
+        "score": score,
+        "goals": list(goals),
+        "assists": list(assists),
+        "cards": list(cards),
+    }
+
+
+async def _pages():
+    yield MagicMock()
+
+
+def test_in_progress_uses_kickoff_window():
+    now = datetime(2024, 5, 4, 16, 0, tzinfo=timezone.utc)
+    fixtures = [
+        FixtureSchema(home="A", away="B", time=(now - timedelta(minutes=30)).isoformat()),
+        FixtureSchema(home="C", away="D", time=(now + timedelta(hours=2)).isoformat()),
+        FixtureSchema(home="E", away="F", time=(now - timedelta(hours=3)).isoformat()),
+        FixtureSchema(home="G", away="H", time="Sat 4 May"),
+    ]
+    with override_settings(LIVE=LIVE):
+        assert [f.home for f in in_progress(fixtures, now)] == ["A"]
+
+
+def test_match_events_reads_lineups_and_assists():
+    html = """
+    <div class="teamList mcLineUpContainter homeLineup">Arsenal 4-3-3
+      Shirt number 7 Bukayo Saka Goal Goal 90'
+      Shirt number 4 Ben White Yellow 90'</div>
+    <div class="teamList mcLineUpContainter awayLineup">Chelsea 4-2-3-1
+      Shirt number 20 Cole Palmer Red 60'</div>
+    <div class="matchEventsContainer home">
+      <div class="mc-summary__assister">Martin Ødegaard (Assist) 45+2’</div>
+    </div>
+    """
+    events = match_events(BeautifulSoup(html, "lxml"), "Arsenal", "Chelsea", "2-0")
+
+    assert events["goals"] == [{"team": "Arsenal", "player": "Bukayo Saka"}] * 2
+    assert {"team": "Chelsea", "player": "Cole Palmer", "card": "red"} in events["cards"]
+    assert events["assists"] == [
+        {"team": "Arsenal", "name": "Martin Ødegaard", "minute": 47}
+    ]
+
+
+def test_diff_reports_only_new_events():
+    goal = {"team": "Arsenal", "player": "Bukayo Saka"}
+    before = {"Arsenal v Chelsea": _match("1-0", goals=[goal])}
+    after = {"Arsenal v Chelsea": _match("2-0", goals=[goal, goal])}
+
+    changes = diff_matches(before, after)
+
+    assert changes == [
+        {"type": "score", "match": "Arsenal v Chelsea", "score": "2-0"},
+        {"type": "goal", "match": "Arsenal v Chelsea", **goal},
+    ]
+    assert diff_matches(after, after) == []
+    assert diff_matches(after, {}) == [
+        {"type": "finished", "match": "Arsenal v Chelsea", "score": "2-0"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_one_scrape_round_serves_every_subscriber():
+    rounds = [{"Arsenal v Chelsea": _match("0-0")}, {"Arsenal v Chelsea": _match("1-0")}]
+    calls = 0
+
+    async def scrape(page):
+        nonlocal calls
+        calls += 1
+        return rounds[min(calls, len(rounds)) - 1]
+
+    hub = LiveHub(scrape=scrape)
+    with override_settings(LIVE=LIVE), patch.object(live, "get_page", _pages):
+        async with hub.subscribe() as first, hub.subscribe() as second:
+            received = []
+            for queue in (first, second):
+                assert (await queue.get())["type"] == "snapshot"
+                await queue.get()  # initial round: every match is new
+                received.append(await asyncio.wait_for(queue.get(), 1))
+            scraped = calls
+            assert hub.task is not None
+        await hub.task
+
+    assert received[0] == received[1]
+    assert received[0]["changes"] == [
+        {"type": "score", "match": "Arsenal v Chelsea", "score": "1-0"}
+    ]
+    # Both subscribers were fed by the same rounds, not one scrape each
+    assert scraped <= len(rounds) + 1
+
+
+def test_publish_drops_oldest_for_slow_subscribers():
+    hub = LiveHub(scrape=None)
+    queue = asyncio.Queue(maxsize=2)
+    hub.subscribers.add(queue)
+    for n in range(3):
+        hub.publish({"n": n})
+
+    assert [queue.get_nowait()["n"] for _ in range(2)] == [1, 2]
+
+
+def test_websocket_sends_snapshot_then_changes():
+    rounds = iter([{"Arsenal v Chelsea": _match("0-0")}])
+
+    async def scrape(page):
+        return next(rounds, {"Arsenal v Chelsea": _match("0-0")})
+
+    hub = LiveHub(scrape=scrape)
+    with override_settings(LIVE=LIVE), patch.object(live, "live_hub", hub), patch.object(
+        live, "get_page", _pages
+    ):
+        with TestClient(app).websocket_connect("/api/v1/live/ws") as ws:
+            assert ws.receive_json() == {"type": "snapshot", "matches": {}}
+            message = ws.receive_json()
+
+    assert message["type"] == "changes"
+    assert message["changes"][0]["score"] == "0-0"
+
+
+def test_websocket_unsubscribes_as_soon_as_the_client_leaves():
+    async def scrape(page):
+        return {"Arsenal v Chelsea": _match("0-0")}  # never changes after round one
+
+    hub = LiveHub(scrape=scrape)
+    with override_settings(LIVE=LIVE), patch.object(live, "live_hub", hub), patch.object(
+        live, "get_page", _pages
+    ):
+        with TestClient(app) as client:
+            with client.websocket_connect("/api/v1/live/ws") as ws:
+                ws.receive_json()
+                ws.receive_json()
+                assert len(hub.subscribers) == 1
+            for _ in range(100):
+                if not hub.subscribers:
+                    break
+                time.sleep(0.01)
+
+    assert not hub.subscribers
+
+
+@pytest.mark.asyncio
+async def test_subscriber_arriving_while_the_loop_stops_gets_a_new_loop():
+    closing, scraped = asyncio.Event(), []
+
+    async def slow_pages():
+        try:
+            yield MagicMock()
+        finally:
+            closing.set()
+            await asyncio.sleep(0.05)
+
+    async def scrape(page):
+        scraped.append(page)
+        return {"Arsenal v Chelsea": _match(f"{len(scraped)}-0")}
+
+    hub = LiveHub(scrape=scrape)
+    with override_settings(LIVE=LIVE), patch.object(live, "get_page", slow_pages):
+        async with hub.subscribe():
+            pass
+        await closing.wait()
+        async with hub.subscribe() as queue:
+            assert not hub.task.done()  # the first loop is still closing its page
+            await queue.get()  # snapshot
+            message = await asyncio.wait_for(queue.get(), 1)
+        await hub.task
+
+    assert message["type"] == "changes"
+
+
+@pytest.mark.asyncio
+async def test_live_loop_does_not_scrape_without_a_page():
+    scrape = MagicMock()
+
+    async def no_pages():
+        yield None  # what get_page yields on a cache-only worker
+
+    hub = LiveHub(scrape=scrape)
+    with override_settings(LIVE=LIVE), patch.object(live, "get_page", no_pages):
+        async with hub.subscribe():
+            await hub.task
+
+    scrape.assert_not_called()
@@ -0,0 +1,63 @@
+import time
+import pytest
+from bs4 import BeautifulSoup
+from starlette.testclient import TestClient
+
+from benchmarks.loadtest import driver, upstream
+
+
+def test_fake_upstream_serves_scrapeable_pages_with_latency():
+    client = TestClient(upstream.create_app(latency_ms=50))
+
+    started = time.perf_counter()
+    response = client.get("/tables")
+
+    assert time.perf_counter() - started >= 0.05
+    soup = BeautifulSoup(response.text, "lxml")
+    rows = soup.select(
+        "#mainContent div.league-table__all-tables-container.allTablesContainer table tbody tr"
+    )
+    assert len(rows) == len(upstream.CLUBS)
+    assert soup.select_one('li[data-tab-index="0"][data-text="First Team"]')
+
+
+def test_fake_upstream_links_back_to_itself():
+    client = TestClient(upstream.create_app(), base_url="http://fake.test")
+
+    results = BeautifulSoup(client.get("/clubs/1/arsenal/results").text, "lxml")
+    href = results.select_one("div.match-fixture__wrapper")["data-href"]
+    assert href.startswith("//fake.test/match/")
+
+    match = client.get(href.replace("//fake.test", ""))
+    assert match.status_code == 200
+    assert "matchCentreStatsContainer" in match.text
+
+
+def test_fake_upstream_prefers_recorded_pages(tmp_path):
+    (tmp_path / "tables.html").write_text("<html>recorded</html>")
+    client = TestClient(upstream.create_app(pages_dir=tmp_path))
+
+    assert client.get("/tables").text == "<html>recorded</html>"
+    assert "club-card-wrapper" in client.get("/clubs").text
+
+
+def test_summarize_reports_percentiles_per_endpoint():
+    samples = [driver.Sample("table", 200, ms / 1000) for ms in range(1, 101)]
+    samples.append(driver.Sample("stats", 500, 2.0))
+    usage = driver.ResourceUsage(rss_mb=[120.0, 180.5], browsers=[0, 2, 1])
+
+    report = driver.summarize(samples, elapsed=10.0, usage=usage)
+
+    table = report["endpoints"]["table"]
+    assert (table["p50_ms"], table["p95_ms"], table["p99_ms"]) == (50.0, 95.0, 99.0)
+    assert table["throughput_rps"] == 10.0
+    assert report["endpoints"]["stats"]["errors"] == 1
+    assert report["endpoints"]["all"]["requests"] == 101
+    assert report["peak_rss_mb"] == 180.5
+    assert report["peak_browsers"] == 2
+
+
+def test_parse_mix_rejects_unknown_endpoints():
+    assert driver.parse_mix("table=3,stats=1") == {"table": 3, "stats": 1}
+    with pytest.raises(ValueError):
+        driver.parse_mix("players=1")
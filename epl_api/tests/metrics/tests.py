@@ -0,0 +1,66 @@
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from epl_api.asgi import app
+from epl_api.v1.metrics import current_endpoint, stage, track_endpoint
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.mark.asyncio
+async def test_stage_records_latency_under_endpoint():
+    @track_endpoint
+    async def fake_endpoint():
+        assert current_endpoint.get() == "fake_endpoint"
+        async with stage("goto"):
+            pass
+        with stage("parse"):
+            pass
+
+    before = _sample(
+        "epl_stage_duration_seconds_count", endpoint="fake_endpoint", stage="goto"
+    )
+    await fake_endpoint()
+
+    assert (
+        _sample(
+            "epl_stage_duration_seconds_count", endpoint="fake_endpoint", stage="goto"
+        )
+        == before + 1
+    )
+    assert _sample(
+        "epl_stage_duration_seconds_count", endpoint="fake_endpoint", stage="parse"
+    )
+    assert _sample("epl_request_duration_seconds_count", endpoint="fake_endpoint")
+    assert current_endpoint.get() == "unknown"
+
+
+@pytest.mark.asyncio
+async def test_stage_counts_failures():
+    @track_endpoint
+    async def failing_endpoint():
+        async with stage("wait_for_selector"):
+            raise TimeoutError("selector never appeared")
+
+    with pytest.raises(TimeoutError):
+        await failing_endpoint()
+
+    assert (
+        _sample(
+            "epl_scrape_failures_total",
+            endpoint="failing_endpoint",
+            stage="wait_for_selector",
+        )
+        == 1
+    )
+
+
+def test_metrics_endpoint():
+    response = TestClient(app).get("/api/v1/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "epl_stage_duration_seconds" in response.text
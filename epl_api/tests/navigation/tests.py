@@ -0,0 +1,101 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from django.test import override_settings
+
+from epl_api.v1.exceptions import BudgetExceeded
+from epl_api.v1.governor import reset_upstream_governor, upstream_governor
+from epl_api.v1.navigation import budgeted, current_budget, navigation_budget
+from epl_api.v1.utils import goto, wait_for
+
+NAVIGATION = {
+    "default": {"BUDGET": 5000, "WAIT_UNTIL": "domcontentloaded"},
+    "results": {"BUDGET": 8000, "WAIT_UNTIL": "commit"},
+    "spent": {"BUDGET": 0, "WAIT_UNTIL": "commit"},
+}
+
+
+@pytest.fixture(autouse=True)
+def navigation_policy():
+    with override_settings(NAVIGATION=NAVIGATION):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_goto_takes_wait_mode_and_timeout_from_budget():
+    page = MagicMock(goto=AsyncMock())
+
+    with navigation_budget("results"):
+        await goto(page, "https://example.com/results")
+
+    _, kwargs = page.goto.call_args
+    assert kwargs["wait_until"] == "commit"
+    assert 0 < kwargs["timeout"] <= 8000
+
+
+@pytest.mark.asyncio
+async def test_goto_without_budget_is_unchanged():
+    page = MagicMock(goto=AsyncMock())
+
+    await goto(page, "https://example.com/results")
+
+    page.goto.assert_called_once_with("https://example.com/results")
+
+
+@pytest.mark.asyncio
+async def test_wait_for_returns_once_selector_is_attached():
+    page = MagicMock(wait_for_selector=AsyncMock())
+
+    with navigation_budget("unknown"):
+        await wait_for(page, "li.match-fixture")
+
+    _, kwargs = page.wait_for_selector.call_args
+    assert kwargs["state"] == "attached"
+    assert 0 < kwargs["timeout"] <= 5000
+
+
+@pytest.mark.asyncio
+async def test_exhausted_budget_stops_before_navigating():
+    page = MagicMock(goto=AsyncMock())
+
+    with navigation_budget("spent"):
+        with pytest.raises(BudgetExceeded) as exc:
+            await goto(page, "https://example.com/results")
+
+    assert (exc.value.page_type, exc.value.step) == ("spent", "goto")
+    page.goto.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_exhausted_budget_never_reaches_the_governor():
+    page = MagicMock(goto=AsyncMock())
+    reset_upstream_governor()
+    governor = upstream_governor()
+    tokens = governor.bucket.tokens
+
+    with navigation_budget("spent"):
+        for _ in range(governor.breaker.threshold + 1):
+            with pytest.raises(BudgetExceeded):
+                await goto(page, "https://example.com/results")
+
+    assert governor.bucket.tokens == tokens and governor.in_flight.active == 0
+    assert governor.breaker.failures == 0
+    reset_upstream_governor()
+
+
+@pytest.mark.asyncio
+async def test_budget_is_current_only_while_generator_runs():
+    seen = []
+
+    @budgeted("results")
+    async def rows():
+        seen.append(current_budget.get().page_type)
+        yield 1
+        seen.append(current_budget.get().page_type)
+        yield 2
+
+    with navigation_budget("default"):
+        async for _ in rows():
+            seen.append(current_budget.get().page_type)
+
+    assert seen == ["results", "default", "results", "default"]
+    assert current_budget.get() is None
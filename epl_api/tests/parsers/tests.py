@@ -0,0 +1,63 @@
+from epl_api.v1.parsers import parse_lineup, parse_squad
+
+SQUAD = """
+Goalkeepers
+  1 David Raya Goalkeeper Spain
+  Appearances 30 Clean sheets 15 Saves 80 View Profile
+Defenders
+  4 Ben White Defender England
+  Appearances 28 Goals 4-3 Assists 3 Shots 12 View Profile
+  Trialist View Profile
+"""
+
+LINEUP = """Arsenal 4-3-3 Formation
+  Shirt number 7 Bukayo Saka Goal label.penaltyscore 90'
+  Shirt number 4 Ben White Yellow
+  Substitutes
+  Shirt number 19 Leandro Trossard Red 78'
+  Shirt number 35 Oleksandr Zinchenko
+"""
+
+
+def test_squad_entries_by_position():
+    squad = parse_squad(SQUAD)
+
+    assert list(squad) == ["Goalkeepers", "Defenders"]
+    assert squad["Goalkeepers"] == [
+        {
+            "name": "1 David Raya Goalkeeper Spain",
+            "appearances": 30,
+            "goals": 0,
+            "assists": 0,
+            "clean_sheets": 15,
+            "saves": 80,
+            "shots": 0,
+        }
+    ]
+    white, trialist = squad["Defenders"]
+    assert (white["goals"], white["assists"], white["shots"]) == (4, 3, 12)
+    assert trialist["name"] == "Unknown" and trialist["appearances"] == 0
+    assert parse_squad("no headings View Profile") == {}
+
+
+def test_lineup_splits_starters_and_substitutes():
+    lineup = parse_lineup(LINEUP)
+
+    assert lineup["formation"] == "4-3-3"
+    assert list(lineup["starters"]) == ["Bukayo Saka", "Ben White"]
+    assert lineup["starters"]["Bukayo Saka"]["goals"] == 2
+    assert lineup["starters"]["Ben White"] == {
+        "name": "Ben White",
+        "yellow_cards": 1,
+        "red_cards": 0,
+        "goals": 0,
+        "minutes": "90",
+    }
+    assert lineup["substitutes"]["Leandro Trossard"]["minutes"] == "78"
+    assert lineup["substitutes"]["Oleksandr Zinchenko"]["minutes"] == "0"
+
+
+def test_lineup_tolerates_irregular_whitespace():
+    spaced = LINEUP.replace(" Shirt", "\n\n      Shirt")
+
+    assert parse_lineup(spaced) == parse_lineup(LINEUP)
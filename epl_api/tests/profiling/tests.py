@@ -0,0 +1,129 @@
+import asyncio
+import json
+import time
+import pytest
+from django.conf import settings
+from django.test import override_settings
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from epl_api.asgi import app
+from epl_api.v1.profiling import LOOP, ProfilingMiddleware, Sampler
+
+TOKEN = "s3cret"
+
+
+@pytest.fixture
+def profiles(tmp_path):
+    config = {
+        **settings.PROFILING,
+        "TOKEN": TOKEN,
+        "SAMPLE_RATE": 0,
+        "INTERVAL": 0.001,
+        "DIR": str(tmp_path),
+        "KEEP": 2,
+    }
+    with override_settings(PROFILING=config):
+        yield tmp_path
+
+
+def spin(seconds):
+    until = time.perf_counter() + seconds
+    while time.perf_counter() < until:
+        pass
+
+
+def busy_client():
+    inner = FastAPI()
+
+    @inner.get("/busy")
+    async def busy():
+        spin(0.05)
+        return {"ok": True}
+
+    return TestClient(ProfilingMiddleware(inner))
+
+
+@pytest.mark.asyncio
+async def test_sampler_accounts_loop_time_per_task(profiles):
+    async def crunch():
+        spin(0.05)
+        await asyncio.sleep(0.03)
+
+    sampler = Sampler(asyncio.get_running_loop(), 0.001)
+    sampler.start()
+    await asyncio.create_task(crunch(), name="cruncher")
+    sampler.stop()
+
+    seconds = sampler.owners()
+    owner = next(o for o in seconds if o.endswith("[cruncher]"))
+    assert owner.startswith("test_sampler_accounts_loop_time_per_task.<locals>.crunch")
+    assert 0.02 < seconds[owner] < 0.2
+    assert seconds.get(LOOP, 0) > 0  # the sleep, with no task on the loop
+    profile = sampler.to_speedscope("test")
+    names = [frame["name"] for frame in profile["shared"]["frames"]]
+    assert any(name.endswith("spin") for name in names)
+    assert {p["name"] for p in profile["profiles"]} == set(seconds)
+
+
+def test_requests_are_profiled_only_with_the_token(profiles):
+    client = busy_client()
+
+    plain = client.get("/busy")
+    wrong = client.get("/busy", headers={"X-EPL-Profile": "guess"})
+    profiled = client.get("/busy", headers={"X-EPL-Profile": TOKEN})
+
+    assert "x-epl-profile-id" not in plain.headers
+    assert "x-epl-profile-id" not in wrong.headers
+    profile_id = profiled.headers["x-epl-profile-id"]
+    summary = json.loads((profiles / f"{profile_id}.summary.json").read_text())
+    assert summary["path"] == "/busy" and summary["status"] == 200
+    assert summary["trigger"] == "header" and summary["samples"] > 0
+    speedscope = json.loads((profiles / f"{profile_id}.speedscope.json").read_text())
+    assert speedscope["profiles"][0]["type"] == "sampled"
+
+
+def test_sampling_rate_profiles_without_a_header(profiles):
+    config = {**settings.PROFILING, "TOKEN": "", "SAMPLE_RATE": 1.0}
+    with override_settings(PROFILING=config):
+        response = busy_client().get("/busy")
+
+    summary = json.loads(
+        (profiles / f"{response.headers['x-epl-profile-id']}.summary.json").read_text()
+    )
+    assert summary["trigger"] == "sampled"
+
+
+def test_nothing_is_profiled_when_off(tmp_path):
+    config = {**settings.PROFILING, "TOKEN": "", "DIR": str(tmp_path / "p")}
+    with override_settings(PROFILING=config):
+        response = busy_client().get("/busy", headers={"X-EPL-Profile": ""})
+
+    assert "x-epl-profile-id" not in response.headers
+    assert not (tmp_path / "p").exists()
+
+
+def test_admin_endpoints_list_and_serve_profiles(profiles):
+    busy = busy_client()
+    ids = [
+        busy.get("/busy", headers={"X-EPL-Profile": TOKEN}).headers["x-epl-profile-id"]
+        for _ in range(3)
+    ]
+    client = TestClient(app)
+    auth = {"Authorization": f"Bearer {TOKEN}"}
+
+    listed = client.get("/api/v1/profiles", headers=auth)
+    denied = client.get("/api/v1/profiles", headers={"Authorization": "Bearer no"})
+    speedscope = client.get(f"/api/v1/profiles/{ids[-1]}", headers=auth)
+    flame = client.get(f"/api/v1/profiles/{ids[-1]}?format=folded", headers=auth)
+    pruned = client.get(f"/api/v1/profiles/{ids[0]}", headers=auth)
+    escape = client.get("/api/v1/profiles/..%2Fsecrets", headers=auth)
+
+    assert [p["id"] for p in listed.json()] == ids[:0:-1]  # newest KEEP, newest first
+    assert denied.status_code == 403
+    assert speedscope.json()["exporter"] == "epl_api"
+    lines = flame.text.splitlines()
+    assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any("spin" in line for line in lines)
+    assert pruned.status_code == 404
+    assert escape.status_code == 404
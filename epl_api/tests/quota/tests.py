@@ -0,0 +1,135 @@
+import asyncio
+import time
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+from django.core.cache import cache
+from fastapi.testclient import TestClient
+
+from epl_api.asgi import app
+from epl_api.v1.async_cache import reset_async_cache
+from epl_api.v1.exceptions import UpstreamUnavailable
+from epl_api.v1.lazy import LazyPage
+from epl_api.v1.quota import PageQuota
+from epl_api.v1.seasons import season_key
+from epl_api.v1.utils import goto, store_result
+
+CONFIG = {
+    "PAGE_QUOTA": 2,
+    "QUOTA_LEASE_TTL": 60,
+    "QUOTA_MAX_WAIT": 5,
+    "QUOTA_POLL_INTERVAL": 0.01,
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    reset_async_cache()
+    yield
+    reset_async_cache()
+    cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_pages_beyond_the_quota_wait_for_a_slot():
+    quota = PageQuota(CONFIG)
+    open_pages, peak = 0, 0
+
+    async def scrape():
+        nonlocal open_pages, peak
+        async with quota.lease():
+            open_pages += 1
+            peak = max(peak, open_pages)
+            await asyncio.sleep(0.05)
+            open_pages -= 1
+
+    await asyncio.gather(*(scrape() for _ in range(5)))
+
+    assert peak == 2
+    assert await quota.in_use() == 0
+
+
+@pytest.mark.asyncio
+async def test_freed_slots_go_to_the_oldest_waiter():
+    quota = PageQuota({**CONFIG, "PAGE_QUOTA": 1})
+    assert await quota.try_acquire("holder")
+    for waiter in ("first", "second", "third"):
+        assert not await quota.try_acquire(waiter)
+
+    await quota.release("holder")
+
+    # Later arrivals polling first must not jump the queue
+    assert not await quota.try_acquire("third")
+    assert not await quota.try_acquire("second")
+    assert await quota.try_acquire("first")
+    await quota.release("first")
+    assert await quota.try_acquire("second")
+
+
+@pytest.mark.asyncio
+async def test_waiting_too_long_is_refused_and_leaves_the_queue():
+    quota = PageQuota({**CONFIG, "PAGE_QUOTA": 1, "QUOTA_MAX_WAIT": 0.05})
+
+    async with quota.lease():
+        with pytest.raises(UpstreamUnavailable):
+            async with quota.lease():
+                pass
+
+    client = cache.client.get_client()
+    assert client.zcard(quota.keys[1]) == 0
+    assert client.zcard(quota.keys[2]) == 0
+
+
+@pytest.mark.asyncio
+async def test_expired_leases_of_dead_workers_are_reclaimed():
+    quota = PageQuota({**CONFIG, "PAGE_QUOTA": 1})
+    cache.client.get_client().zadd(quota.keys[0], {"dead-worker": time.time() - 1})
+
+    async with quota.lease():
+        assert await quota.in_use() == 1
+
+
+@pytest.mark.asyncio
+async def test_no_quota_skips_redis():
+    quota = PageQuota({**CONFIG, "PAGE_QUOTA": 0})
+
+    async with quota.lease():
+        pass
+
+    assert not cache.client.get_client().exists(quota.keys[0])
+
+
+def test_cache_hit_never_takes_a_page_lease():
+    store_result(
+        season_key("epl_results"),
+        [{"home": "Arsenal", "away": "Everton", "score": "1-1"}],
+    )
+
+    with patch(
+        "epl_api.v1.browsers.page_quota", side_effect=AssertionError
+    ) as page_quota:
+        response = TestClient(app).get("/api/v1/results")
+
+    assert response.status_code == 200
+    assert response.json()[0]["score"] == "1-1"
+    page_quota.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_lazy_page_is_opened_by_the_first_goto():
+    opened = []
+
+    @asynccontextmanager
+    async def launch():
+        opened.append(MagicMock(goto=AsyncMock()))
+        yield opened[-1]
+
+    async with LazyPage(launch) as page:
+        assert not page.opened and not opened
+        await goto(page, "https://example.com/results")
+        await goto(page, "https://example.com/tables")
+        page.set_default_timeout(1000)
+
+    assert len(opened) == 1 and opened[0].goto.await_count == 2
+    opened[0].set_default_timeout.assert_called_once_with(1000)
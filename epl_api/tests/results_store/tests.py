@@ -0,0 +1,160 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+from django.core.cache import cache
+from fastapi.testclient import TestClient
+
+from epl_api.asgi import app
+from epl_api.v1.async_cache import reset_async_cache
+from epl_api.v1.dependencies import get_page
+from epl_api.v1.exceptions import NotFound
+from epl_api.v1.results_store import ResultsStore, parse_score, reset_results_store
+from epl_api.v1.seasons import season_key
+from epl_api.v1.snapshots import delta
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    reset_async_cache()
+    reset_results_store()
+    yield
+    reset_results_store()
+    reset_async_cache()
+    cache.clear()
+
+
+# Newest first, as the results page lists them
+SEASON = [
+    {"home": "Chelsea", "away": "Arsenal", "score": "0-0", "kickoff": "2024-05-12"},
+    {"home": "Arsenal", "away": "Everton", "score": "2 - 1", "kickoff": "2024-05-04"},
+    {"home": "Everton", "away": "Chelsea", "score": "P-P", "kickoff": "2024-04-27"},
+    {"home": "Arsenal", "away": "Chelsea", "score": "5-0", "kickoff": "2024-04-23"},
+]
+EARLIER = [
+    {"home": "Arsenal", "away": "Chelsea", "score": "1-3", "kickoff": None},
+    {"home": "Chelsea", "away": "Arsenal", "score": "2-2", "kickoff": None},
+]
+
+
+def store():
+    results = ResultsStore()
+    results.load("2023-24", SEASON, 1)
+    results.load("2022-23", EARLIER, 1)
+    return results
+
+
+def test_parse_score():
+    assert parse_score("2-1") == (2, 1)
+    assert parse_score(" 10 – 0 ") == (10, 0)
+    assert parse_score("P-P") is None
+    assert parse_score(None) is None
+
+
+def test_head_to_head_spans_venues_and_seasons_newest_first():
+    h2h = store().head_to_head("arsenal", "chelsea", n=3)
+
+    assert [m["score"] for m in h2h["meetings"]] == ["0-0", "5-0", "1-3"]
+    assert [m["venue"] for m in h2h["meetings"]] == ["away", "home", "home"]
+    assert (h2h["wins"], h2h["draws"], h2h["losses"]) == (1, 1, 1)
+    assert (h2h["goals_for"], h2h["goals_against"], h2h["points"]) == (6, 3, 4)
+    with pytest.raises(NotFound):
+        store().head_to_head("Arsenal", "Wrexham")
+
+
+def test_form_by_venue():
+    results = store()
+
+    assert results.form("Arsenal")["form"] == "DWWLD"
+    assert results.form("Arsenal", n=2, venue="home")["form"] == "WW"
+    away = results.form("Chelsea", venue="away")
+    assert [r["opponent"] for r in away["results"]] == ["Arsenal", "Arsenal"]
+    assert away["form"] == "LW"  # postponed matches are not results
+
+
+def test_goal_difference_runs_oldest_first():
+    results = store()
+
+    running = [p["cumulative"] for p in results.goal_difference("Arsenal")]
+    assert running == [0, -2, 3, 4, 4]
+    season = results.goal_difference("Arsenal", "2023-24")
+    assert [p["goal_difference"] for p in season] == [5, 1, 0]
+
+
+def test_deltas_append_without_a_rebuild():
+    results = store()
+    added = {"home": "Arsenal", "away": "Everton", "score": "3-1", "kickoff": None}
+
+    assert not results.apply("2023-24", {"revision": 3, "since": 2, "full": False})
+    assert results.apply(
+        "2023-24",
+        {
+            "revision": 2,
+            "since": 1,
+            "full": False,
+            "inserted": [{**SEASON[2], "away": "Arsenal", "score": "1-1"}],
+            "updated": [{**SEASON[0], "score": "1-0", "previous": {"score": "0-0"}}],
+            "removed": [SEASON[3]],
+        },
+    )
+    results.load("2022-23", [added, *EARLIER], 4)
+
+    assert results.revisions == {"2023-24": 2, "2022-23": 4}
+    assert results.form("Arsenal")["form"] == "LWDWL"
+    assert results.form("Arsenal", n=1, venue="home")["results"][0]["score"] == "2 - 1"
+    meetings = results.head_to_head("Chelsea", "Arsenal")["meetings"]
+    assert [m["score"] for m in meetings] == ["1-0", "1-3", "2-2"]
+
+
+def _page(*results):
+    page = AsyncMock()
+    page.content.return_value = "".join(
+        f"<time class='date' datetime='{when}'>x</time><ul>"
+        f"<li class='match-fixture' data-home='{home}' data-away='{away}'>"
+        f"<span class='match-fixture__score'>{score}</span></li></ul>"
+        for home, away, score, when in results
+    )
+    return page
+
+
+def test_endpoints_answer_from_cached_results_without_scraping():
+    page = _page(
+        ("Chelsea", "Arsenal", "0-0", "2024-05-12"),
+        ("Arsenal", "Chelsea", "5-0", "2024-04-23"),
+    )
+    app.dependency_overrides[get_page] = lambda: page
+    try:
+        with patch("epl_api.views.async_playwright"):
+            client = TestClient(app)
+            listed = client.get("/api/v1/results")
+            h2h = client.get("/api/v1/results/h2h/Arsenal/Chelsea")
+            form = client.get(
+                "/api/v1/results/form/chelsea", params={"venue": "home"}
+            )
+            gd = client.get(
+                "/api/v1/results/goal-difference/Arsenal", params={"season": "2024"}
+            )
+            navigations = page.goto.await_count
+
+            # A refresh appends a result; the store follows its snapshot delta
+            cache.delete(season_key("epl_results"))
+            page.content.return_value = _page(
+                ("Arsenal", "Everton", "2-1", "2024-05-19"),
+                ("Chelsea", "Arsenal", "0-0", "2024-05-12"),
+                ("Arsenal", "Chelsea", "5-0", "2024-04-23"),
+            ).content.return_value
+            client.get("/api/v1/results")
+            with patch("epl_api.views.delta", wraps=delta) as applied:
+                after = client.get("/api/v1/results/form/Arsenal")
+            bad_venue = client.get("/api/v1/results/form/Arsenal?venue=x")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert listed.json()[0]["kickoff"] == "2024-05-12T00:00:00Z"
+    assert h2h.json()["played"] == 2 and h2h.json()["points"] == 4
+    assert form.json()["form"] == "D"
+    assert [p["cumulative"] for p in gd.json()] == [5, 5]
+    assert navigations == 1
+    assert applied.call_count == 1
+    assert after.json()["form"] == "WDW"
+    assert bad_venue.status_code == 422
+    assert page.goto.await_count == 2
@@ -0,0 +1,196 @@
+import asyncio
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+
+from epl_api.v1.async_cache import reset_async_cache
+from epl_api.v1.exceptions import ClientDisconnected, UpstreamUnavailable
+from epl_api.v1.scheduler import (
+    ScrapeScheduler,
+    client_disconnected,
+    priority,
+    reset_scrape_scheduler,
+    scrape_scheduler,
+)
+from epl_api.v1.utils import cache_result, negative_key
+
+CLASSES = {
+    "interactive": {"SHARE": 0.5, "RESERVED": 1, "DEADLINE": 5},
+    "refresh": {"SHARE": 0.25, "RESERVED": 0, "DEADLINE": 5},
+    "bulk": {"SHARE": 0.25, "RESERVED": 0, "DEADLINE": 5},
+}
+CONFIG = {"CAPACITY": 4, "CLASSES": CLASSES, "DISCONNECT_POLL": 0.01}
+
+
+@pytest.fixture(autouse=True)
+def fresh_scheduler():
+    reset_scrape_scheduler()
+    yield
+    reset_scrape_scheduler()
+
+
+async def hold(scheduler, name, release, started=None):
+    async with scheduler.job(name):
+        if started is not None:
+            started.append(name)
+        await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_bulk_uses_idle_capacity_but_leaves_the_reserve():
+    scheduler = ScrapeScheduler(CONFIG)
+    release, started = asyncio.Event(), []
+
+    jobs = [
+        asyncio.create_task(hold(scheduler, "bulk", release, started))
+        for _ in range(4)
+    ]
+    await asyncio.sleep(0.01)
+    assert started == ["bulk"] * 3  # the fourth slot is kept for users
+
+    user = asyncio.create_task(hold(scheduler, "interactive", release, started))
+    await asyncio.sleep(0.01)
+    assert started[-1] == "interactive"
+
+    release.set()
+    await asyncio.gather(*jobs, user)
+    assert sum(scheduler.running.values()) == 0
+
+
+@pytest.mark.asyncio
+async def test_freed_slots_go_to_the_highest_class_within_its_share():
+    classes = {**CLASSES, "interactive": {**CLASSES["interactive"], "RESERVED": 0}}
+    scheduler = ScrapeScheduler({**CONFIG, "CLASSES": classes})
+    blockers = [asyncio.Event() for _ in range(4)]
+    started = []
+    first = [
+        asyncio.create_task(hold(scheduler, "interactive", blocker))
+        for blocker in blockers
+    ]
+    await asyncio.sleep(0.01)
+
+    queued = [
+        asyncio.create_task(hold(scheduler, name, asyncio.Event(), started))
+        for name in ("bulk", "interactive", "refresh", "interactive")
+    ]
+    await asyncio.sleep(0.01)
+    assert started == []
+
+    # Interactive holds 3 of 4 slots, over its share of 2 while others wait
+    blockers[0].set()
+    await asyncio.sleep(0.01)
+    assert started == ["refresh"]
+    blockers[1].set()
+    await asyncio.sleep(0.01)
+    assert started == ["refresh", "bulk"]
+    blockers[2].set()
+    await asyncio.sleep(0.01)
+    assert started == ["refresh", "bulk", "interactive"]
+
+    for task in first + queued:
+        task.cancel()
+    await asyncio.gather(*first, *queued, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_jobs_past_their_deadline_are_refused():
+    scheduler = ScrapeScheduler({**CONFIG, "CAPACITY": 1})
+    release = asyncio.Event()
+    running = asyncio.create_task(hold(scheduler, "interactive", release))
+    await asyncio.sleep(0)
+
+    with pytest.raises(UpstreamUnavailable, match="deadline"):
+        async with scheduler.job("interactive", deadline=0.02):
+            pass
+
+    release.set()
+    await running
+    assert not scheduler._waiters["interactive"]
+
+
+@pytest.mark.asyncio
+async def test_queued_job_is_dropped_when_the_client_leaves():
+    scheduler = ScrapeScheduler({**CONFIG, "CAPACITY": 1})
+    release = asyncio.Event()
+    running = asyncio.create_task(hold(scheduler, "interactive", release))
+    await asyncio.sleep(0)
+    gone = False
+
+    async def is_disconnected():
+        return gone
+
+    async def request():
+        client_disconnected.set(is_disconnected)
+        async with scheduler.job():
+            pass
+
+    waiting = asyncio.create_task(request())
+    await asyncio.sleep(0.02)
+    gone = True
+    with pytest.raises(ClientDisconnected):
+        await waiting
+
+    release.set()
+    await running
+    assert scheduler.running["interactive"] == 0
+
+
+@pytest.mark.asyncio
+async def test_nested_jobs_run_in_the_outer_slot():
+    scheduler = ScrapeScheduler({**CONFIG, "CAPACITY": 2})
+
+    async with scheduler.job("refresh"):
+        async with scheduler.job("interactive"):
+            assert scheduler.running == {"interactive": 0, "refresh": 1, "bulk": 0}
+
+
+@pytest.mark.asyncio
+async def test_cache_misses_scrape_in_the_callers_class():
+    cache.clear()
+    reset_async_cache()
+    seen = []
+
+    @cache_result("scheduled_scrape")
+    async def scrape(page=None):
+        seen.append(dict(scrape_scheduler().running))
+        return [1]
+
+    with override_settings(SCRAPE_SCHEDULER=CONFIG), priority("bulk"):
+        assert list(await scrape(page=None)) == [1]
+        assert list(await scrape(page=None)) == [1]  # hit: no slot needed
+
+    assert seen == [{"interactive": 0, "refresh": 0, "bulk": 1}]
+    reset_async_cache()
+    cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_disconnects_are_not_remembered_as_failures():
+    cache.clear()
+    reset_async_cache()
+    release = asyncio.Event()
+
+    async def is_disconnected():
+        return True
+
+    @cache_result("abandoned_scrape")
+    async def scrape(page=None):
+        return [1]
+
+    async def request():
+        client_disconnected.set(is_disconnected)
+        return await scrape(page=None)
+
+    with override_settings(SCRAPE_SCHEDULER={**CONFIG, "CAPACITY": 1}):
+        running = asyncio.create_task(
+            hold(scrape_scheduler(), "interactive", release)
+        )
+        await asyncio.sleep(0)
+        with pytest.raises(ClientDisconnected):
+            await request()
+        release.set()
+        await running
+
+    assert cache.get(negative_key("abandoned_scrape")) is None
+    reset_async_cache()
+    cache.clear()
@@ -0,0 +1,91 @@
+import pytest
+from unittest.mock import ANY, AsyncMock, patch
+from django.conf import settings
+from django.core.cache import cache
+from fastapi.testclient import TestClient
+
+from epl_api.asgi import app
+from epl_api.v1.dependencies import get_page
+from epl_api.v1.exceptions import NotFound
+from epl_api.v1.seasons import normalize_season, resolve_season, season_key
+
+RESULTS_PAGE = (
+    "<li class='match-fixture' data-home='Arsenal' data-away='Everton'>"
+    "<span class='match-fixture__score'>2-1</span></li>"
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def client():
+    page = AsyncMock()
+    page.content.return_value = RESULTS_PAGE
+    app.dependency_overrides[get_page] = lambda: page
+    with patch("epl_api.views.async_playwright"):
+        yield TestClient(app), page
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize("value", ["2023", "2023-24", "2023/24", " 2023-2024 "])
+def test_season_labels_are_normalized(value):
+    assert normalize_season(value) == "2023-24"
+
+
+@pytest.mark.parametrize("value", ["2023-25", "2023/2030", "2023-23", "1999-01"])
+def test_mismatched_end_year_is_not_found(value):
+    with pytest.raises(NotFound):
+        normalize_season(value)
+
+
+def test_unknown_season_is_not_found():
+    with pytest.raises(NotFound):
+        resolve_season("1888-89")
+    with pytest.raises(NotFound):
+        resolve_season("last year")
+
+
+def test_past_season_is_cached_forever_and_never_rescraped(client):
+    client, page = client
+
+    for _ in range(3):
+        response = client.get("/api/v1/results", params={"season": "2023/24"})
+        assert response.json() == [
+            {"home": "Arsenal", "away": "Everton", "score": "2-1", "kickoff": None}
+        ]
+
+    page.goto.assert_called_once_with(
+        "https://www.premierleague.com/results?co=1&se=578",
+        wait_until="commit",
+        timeout=ANY,
+    )
+    assert cache.ttl(season_key("epl_results", "2023-24")) is None
+
+
+def test_current_season_keeps_short_ttl_in_its_own_partition(client):
+    client, page = client
+
+    client.get("/api/v1/results")
+
+    page.goto.assert_called_once_with(
+        "https://www.premierleague.com/results", wait_until="commit", timeout=ANY
+    )
+    key = season_key("epl_results")
+    assert key.endswith(resolve_season().label)
+    assert 0 < cache.ttl(key) <= settings.CACHE_TIMEOUT
+    assert cache.get(season_key("epl_results", "2023-24")) is None
+
+
+def test_unknown_season_returns_404(client):
+    client, page = client
+
+    response = client.get("/api/v1/table", params={"season": "1990-91"})
+
+    assert response.status_code == 404
+    assert response.json()["resource"] == "season"
+    page.goto.assert_not_called()
@@ -0,0 +1,136 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+from django.core.cache import cache
+from fastapi.testclient import TestClient
+
+from epl_api.asgi import app
+from epl_api.v1.dependencies import get_page
+from epl_api.v1.schemas import FixtureSchema
+from epl_api.v1.snapshots import delta, record_snapshot
+from epl_api.v1.utils import cache_result
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _fixture(home, away, time):
+    return FixtureSchema(home=home, away=away, time=time)
+
+
+def test_identical_rows_keep_the_same_revision():
+    rows = [_fixture("Arsenal", "Chelsea", "2024-05-04T15:00:00")]
+
+    first = record_snapshot("fixtures", rows)
+
+    assert record_snapshot("fixtures", rows) == first
+    assert record_snapshot("fixtures", rows[:0]) == first + 1
+
+
+def test_delta_reports_inserted_updated_and_removed_rows():
+    old = record_snapshot(
+        "fixtures",
+        [
+            _fixture("Arsenal", "Chelsea", "2024-05-04T15:00:00"),
+            _fixture("Spurs", "Fulham", "2024-05-04T17:30:00"),
+        ],
+    )
+    new = record_snapshot(
+        "fixtures",
+        [
+            _fixture("Arsenal", "Chelsea", "2024-05-05T16:30:00"),
+            _fixture("Everton", "Brentford", "2024-05-06T20:00:00"),
+        ],
+    )
+
+    changes = delta("fixtures", old)
+
+    assert changes["revision"] == new and not changes["full"]
+    assert changes["inserted"] == [
+        {
+            "home": "Everton",
+            "away": "Brentford",
+            "time": "2024-05-06T20:00:00",
+            "kickoff": None,
+        }
+    ]
+    assert changes["updated"] == [
+        {
+            "home": "Arsenal",
+            "away": "Chelsea",
+            "time": "2024-05-05T16:30:00",
+            "kickoff": None,
+            "previous": {"time": "2024-05-04T15:00:00"},
+        }
+    ]
+    assert [row["home"] for row in changes["removed"]] == ["Spurs"]
+    assert delta("fixtures", new)["inserted"] == []
+
+
+def test_expired_revision_falls_back_to_full_resync():
+    record_snapshot("table", [{"club": "Arsenal", "points": "89"}])
+    head = record_snapshot("table", [{"club": "Arsenal", "points": "92"}])
+    cache.delete(f"snap:table:{head - 1}")
+
+    changes = delta("table", head - 1)
+
+    assert changes["full"]
+    assert changes["inserted"] == [{"club": "Arsenal", "points": "92"}]
+
+
+def test_client_ahead_of_a_reset_head_gets_a_full_resync():
+    for points in ("86", "89", "92"):
+        record_snapshot("table", [{"club": "Arsenal", "points": points}])
+    cache.clear()  # Redis flushed: revisions start over
+    head = record_snapshot("table", [{"club": "Arsenal", "points": "95"}])
+
+    changes = delta("table", 3)
+
+    assert head == 1 and changes["revision"] == 1
+    assert changes["full"]
+    assert changes["inserted"] == [{"club": "Arsenal", "points": "95"}]
+    assert delta("table", head)["inserted"] == []
+
+
+@pytest.mark.asyncio
+async def test_since_is_served_from_the_cached_result():
+    calls = []
+
+    @cache_result("epl_results_test", snapshot="results")
+    async def scrape(page=None):
+        calls.append(1)
+        return [{"home": "Arsenal", "away": "Chelsea", "score": "2-1"}]
+
+    assert list(await scrape(page=None)) == [
+        {"home": "Arsenal", "away": "Chelsea", "score": "2-1"}
+    ]
+    changes = await scrape(page=None, since=0)
+
+    assert calls == [1]
+    assert changes["full"] and changes["revision"] == 1
+    assert (await scrape(page=None, since=1))["inserted"] == []
+
+
+def test_fixtures_endpoint_accepts_since():
+    page = AsyncMock()
+    page.content.return_value = (
+        "<li class='match-fixture' data-home='Arsenal' data-away='Chelsea'>"
+        "<time datetime='2024-05-04T15:00:00'></time></li>"
+    )
+    app.dependency_overrides[get_page] = lambda: page
+    try:
+        with patch("epl_api.views.async_playwright"):
+            client = TestClient(app)
+            response = client.get("/api/v1/fixtures", params={"since": 0})
+            unchanged = client.get("/api/v1/fixtures", params={"since": 1})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.json()["inserted"][0]["home"] == "Arsenal"
+    assert unchanged.json()["revision"] == 1
+    assert unchanged.json()["inserted"] == []
+    assert page.goto.await_count == 1
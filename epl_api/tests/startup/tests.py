@@ -0,0 +1,53 @@
+import os
+import subprocess
+import sys
+from unittest.mock import AsyncMock, patch
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from epl_api.v1.lazy import LazyImport
+
+
+def test_lazy_import_resolves_on_first_use():
+    dumps = LazyImport("json", "dumps")
+
+    assert dumps._target is None
+    assert dumps({"a": 1}) == '{"a": 1}'
+    assert dumps._target is not None
+
+
+def test_lean_startup_skips_django_apps_and_scraper_modules():
+    probe = (
+        "import sys, epl_api.asgi as asgi; "
+        "print(sorted(m for m in ('bs4', 'playwright.async_api', 'numpy', "
+        "'django.contrib.admin', 'django.core.handlers.asgi') if m in sys.modules)); "
+        "print([r.path for r in asgi.application.routes])"
+    )
+    env = dict(
+        os.environ, EPL_LEAN_STARTUP="1", DJANGO_SETTINGS_MODULE="epl_api.settings"
+    )
+
+    out = subprocess.run(
+        [sys.executable, "-c", probe], env=env, capture_output=True, text=True, check=True
+    ).stdout.splitlines()
+
+    assert out == ["[]", "['/api/v1']"]
+
+
+def test_default_startup_still_mounts_django():
+    from epl_api.asgi import application
+
+    assert [r.path for r in application.routes if isinstance(r, Mount)] == [
+        "/api/v1",
+        "",
+    ]
+
+
+def test_served_application_closes_browsers_on_shutdown():
+    from epl_api.asgi import application
+
+    with patch("epl_api.asgi.shutdown_browsers", AsyncMock()) as shutdown:
+        with TestClient(application):
+            shutdown.assert_not_awaited()
+
+    shutdown.assert_awaited_once()
@@ -0,0 +1,76 @@
+import asyncio
+import json
+import pytest
+from django.conf import settings
+from django.test import override_settings
+
+from epl_api.v1.metrics import stage, track_endpoint
+from epl_api.v1.tracing import current_span, exporter, span
+
+
+@pytest.fixture
+def trace_file(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    tracing = {**settings.TRACING, "ENABLED": True, "PATH": str(path)}
+    with override_settings(TRACING=tracing):
+        yield path
+
+
+def _read_spans(path):
+    exporter.flush()
+    return {s["name"]: s for s in map(json.loads, path.read_text().splitlines())}
+
+
+@pytest.mark.asyncio
+async def test_spans_nest_across_fanout_tasks(trace_file):
+    async def fixture_task(fixture_id):
+        with span("process_fixture", fixture_id=fixture_id):
+            async with stage("goto", url=f"https://example.com/match/{fixture_id}"):
+                await asyncio.sleep(0)
+
+    @track_endpoint
+    async def clubstats(c_name):
+        with stage("cache_get", key="club") as lookup:
+            lookup.set_attribute("hit", False)
+        await asyncio.gather(fixture_task("1"), fixture_task("2"))
+
+    await clubstats(c_name="arsenal")
+    exporter.flush()
+    spans = [json.loads(line) for line in trace_file.read_text().splitlines()]
+
+    root = next(s for s in spans if s["name"] == "clubstats")
+    fixtures = [s for s in spans if s["name"] == "process_fixture"]
+    navigations = [s for s in spans if s["name"] == "goto"]
+
+    assert root["parentSpanId"] == ""
+    assert {
+        "key": "param.c_name",
+        "value": {"stringValue": "arsenal"},
+    } in root["attributes"]
+    assert len(fixtures) == 2
+    assert all(f["parentSpanId"] == root["spanId"] for f in fixtures)
+    assert {n["parentSpanId"] for n in navigations} == {f["spanId"] for f in fixtures}
+    assert len({s["traceId"] for s in spans}) == 1
+    assert current_span.get() is None
+
+
+def test_span_records_errors(trace_file):
+    with pytest.raises(ValueError):
+        with span("parse", bytes=10):
+            raise ValueError("bad html")
+
+    parsed = _read_spans(trace_file)["parse"]
+    assert parsed["status"] == {"code": 2, "message": "ValueError: bad html"}
+    assert {"key": "bytes", "value": {"intValue": "10"}} in parsed["attributes"]
+
+
+def test_tracing_disabled_is_noop(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    tracing = {**settings.TRACING, "ENABLED": False, "PATH": str(path)}
+    with override_settings(TRACING=tracing):
+        with span("parse") as parsed:
+            parsed.set_attribute("bytes", 10)
+            assert current_span.get() is None
+
+    exporter.flush()
+    assert not path.exists()
@@ -0,0 +1,133 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+from django.core.cache import cache
+from fastapi.testclient import TestClient
+
+from epl_api.asgi import app
+from epl_api.v1.dependencies import get_page
+from epl_api.v1.exceptions import NotFound, ScrapeFailed, UpstreamUnavailable
+from epl_api.v1.utils import (
+    backoff_delay,
+    cache_result,
+    index_members,
+    negative_key,
+    with_backoff,
+)
+
+POLICY = {"ATTEMPTS": 3, "BASE_DELAY": 0.5, "MAX_DELAY": 1.5}
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_not_found_is_cached_separately_from_results():
+    calls = []
+
+    @cache_result(lambda name: f"player_stats_{name}")
+    async def lookup(name):
+        calls.append(name)
+        raise NotFound("player", name)
+
+    for _ in range(3):
+        with pytest.raises(NotFound):
+            await lookup(name="nobody")
+
+    assert calls == ["nobody"]
+    assert cache.get("player_stats_nobody") is None
+    assert cache.get(negative_key("player_stats_nobody"))["kind"] == "not_found"
+    assert 0 < cache.ttl(negative_key("player_stats_nobody")) <= 10 * 60
+
+
+@pytest.mark.asyncio
+async def test_stored_keys_are_recorded_in_their_index():
+    @cache_result(
+        lambda name: f"player_stats_{name}",
+        use_generator=False,
+        index=lambda name: "player_stats_keys",
+    )
+    async def lookup(name):
+        return [{"player_name": name}]
+
+    await lookup(name="saka")
+    await lookup(name="rice")
+    cache.set("player_stats_unindexed", [])
+
+    assert index_members("player_stats_keys") == [
+        "player_stats_rice",
+        "player_stats_saka",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failures_are_cached_briefly_and_reraised():
+    calls = []
+
+    @cache_result("epl_flaky", use_generator=False)
+    async def scrape():
+        calls.append(1)
+        raise TimeoutError("selector never appeared")
+
+    with pytest.raises(ScrapeFailed, match="TimeoutError"):
+        await scrape()
+    with pytest.raises(ScrapeFailed, match="selector never appeared"):
+        await scrape()
+
+    assert len(calls) == 1
+    assert 0 < cache.ttl(negative_key("epl_flaky")) <= 60
+
+
+def test_unknown_player_returns_structured_404_without_rescraping():
+    page = AsyncMock()
+    page.content.return_value = "<tbody class='dataContainer indexSection'></tbody>"
+    app.dependency_overrides[get_page] = lambda: page
+    client = TestClient(app)
+    try:
+        with patch("epl_api.v1.helpers.onetrust_accept_cookie"):
+            first = client.get("/api/v1/stats/No Such Player")
+            second = client.get("/api/v1/stats/no such player")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert first.status_code == second.status_code == 404
+    assert second.json() == {
+        "detail": "No player matches 'No Such Player'",
+        "resource": "player",
+        "query": "No Such Player",
+    }
+    assert page.goto.await_count == 1
+
+
+def test_backoff_delay_is_jittered_and_capped():
+    delays = [backoff_delay(attempt, POLICY) for attempt in range(5) for _ in range(50)]
+    assert all(0 <= d <= 1.5 for d in delays)
+    assert max(backoff_delay(0, POLICY) for _ in range(50)) <= 0.5
+    assert len(set(delays)) > 1
+
+
+@pytest.mark.asyncio
+async def test_with_backoff_retries_transient_errors():
+    scrape = AsyncMock(side_effect=[TimeoutError("goto"), TimeoutError("goto"), "ok"])
+
+    with patch("epl_api.v1.utils.asyncio.sleep", new=AsyncMock()) as sleep:
+        assert await with_backoff(scrape, "href", policy=POLICY) == "ok"
+
+    assert scrape.call_count == 3 and sleep.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_with_backoff_gives_up_and_never_retries_shed_requests():
+    failing = AsyncMock(side_effect=TimeoutError("goto"))
+    shed = AsyncMock(side_effect=UpstreamUnavailable("circuit open", 5))
+
+    with patch("epl_api.v1.utils.asyncio.sleep", new=AsyncMock()):
+        with pytest.raises(TimeoutError):
+            await with_backoff(failing, policy=POLICY)
+        with pytest.raises(UpstreamUnavailable):
+            await with_backoff(shed, policy=POLICY)
+
+    assert failing.call_count == 3 and shed.call_count == 1
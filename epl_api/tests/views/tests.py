@@ -1,6 +1,6 @@
 from fastapi.testclient import TestClient
 import pytest
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, Mock, patch
 
 from epl_api.v1.schemas import ResultSchema
 from epl_api.views import get_p_stats, get_results, get_table
@@ -57,7 +57,9 @@ async def test_get_results(mock_bs4, mock_playwright, mock_get_page):
     assert results[0].score == "2 - 1"
 
     # Ensure that the page interactions occurred
-    mock_page.goto.assert_called_once_with("https://www.premierleague.com/results")
+    mock_page.goto.assert_called_once_with(
+        "https://www.premierleague.com/results", wait_until="commit", timeout=ANY
+    )
     mock_page.wait_for_selector.assert_called()
     mock_page.click.assert_called()
 
@@ -161,7 +163,9 @@ async def test_get_table(mock_playwright, mock_get_page, mock_bs4, mock_cookie):
     # Ensure the cookie function was called
     assert mock_cookie.call_count == 1
     # Ensure that the page interactions occurred
-    mock_page.goto.assert_called_once_with("https://www.premierleague.com/tables")
+    mock_page.goto.assert_called_once_with(
+        "https://www.premierleague.com/tables", wait_until="commit", timeout=ANY
+    )
     mock_page.click.assert_called_once()
     mock_page.wait_for_selector.assert_called()
 
@@ -1,40 +1,138 @@
 from fastapi import APIRouter, status
 from epl_api.views import (
     aggregate_club_stats,
-    get_fixtures,
+    compare_players,
+    get_club_aggregates,
+    get_fixture_calendar,
+    get_form,
+    get_goal_difference,
+    get_head_to_head,
+    get_matchweeks,
+    get_next_fixture,
+    get_leaderboard,
+    get_metrics,
     get_results,
     get_root,
     get_p_stats,
+    get_profile,
+    get_profiles,
     get_table,
+    list_fixtures,
 )
+from epl_api.v1.live import live_events, live_socket
+from epl_api.v1.metrics import track_endpoint
 
 router = APIRouter()
 
-router.get("/", status_code=status.HTTP_200_OK)(get_root)
+router.get("/", status_code=status.HTTP_200_OK)(track_endpoint(get_root))
 router.get(
     "/stats/{p_name}",
     status_code=status.HTTP_200_OK,
     summary="get player stats",
     tags=["pl-stats"],
-)(get_p_stats)
+)(track_endpoint(get_p_stats))
 router.get(
     "/table",
     status_code=status.HTTP_200_OK,
     summary="get epl table",
     tags=["epl-table"],
-)(get_table)
+)(track_endpoint(get_table))
 router.get(
-    "/fixtures", status_code=status.HTTP_200_OK, summary="", tags=["epl-fixtures"]
-)(get_fixtures)
+    "/fixtures",
+    status_code=status.HTTP_200_OK,
+    summary="fixtures, optionally by date range and club",
+    tags=["epl-fixtures"],
+)(track_endpoint(list_fixtures))
+router.get(
+    "/fixtures/next/{club}",
+    status_code=status.HTTP_200_OK,
+    summary="a club's next fixture",
+    tags=["epl-fixtures"],
+)(track_endpoint(get_next_fixture))
+router.get(
+    "/fixtures/matchweeks",
+    status_code=status.HTTP_200_OK,
+    summary="fixtures grouped into rounds",
+    tags=["epl-fixtures"],
+)(track_endpoint(get_matchweeks))
+router.get(
+    "/fixtures/calendar.ics",
+    status_code=status.HTTP_200_OK,
+    summary="fixtures as an iCalendar feed",
+    tags=["epl-fixtures"],
+)(track_endpoint(get_fixture_calendar))
 router.get(
     "/results", status_code=status.HTTP_200_OK, summary="", tags=["epl-results"]
-)(get_results)
+)(track_endpoint(get_results))
+router.get(
+    "/results/h2h/{club}/{opponent}",
+    status_code=status.HTTP_200_OK,
+    summary="recent meetings of two clubs",
+    tags=["epl-results"],
+)(track_endpoint(get_head_to_head))
+router.get(
+    "/results/form/{club}",
+    status_code=status.HTTP_200_OK,
+    summary="a club's recent form, overall, home or away",
+    tags=["epl-results"],
+)(track_endpoint(get_form))
+router.get(
+    "/results/goal-difference/{club}",
+    status_code=status.HTTP_200_OK,
+    summary="a club's running goal difference",
+    tags=["epl-results"],
+)(track_endpoint(get_goal_difference))
 router.get(
     "/clubstats/{c_name}",
     status_code=200,
     summary="get club stats",
     tags=["club-stats"],
-)(aggregate_club_stats)
+)(track_endpoint(aggregate_club_stats))
+router.get(
+    "/clubstats/{club}/aggregates",
+    status_code=status.HTTP_200_OK,
+    summary="club season aggregates",
+    tags=["club-stats"],
+)(track_endpoint(get_club_aggregates))
+router.get(
+    "/leaderboard/{stat}",
+    status_code=status.HTTP_200_OK,
+    summary="top players by a stat",
+    tags=["pl-stats"],
+)(track_endpoint(get_leaderboard))
+router.get(
+    "/compare",
+    status_code=status.HTTP_200_OK,
+    summary="compare players side by side",
+    tags=["pl-stats"],
+)(track_endpoint(compare_players))
+router.get(
+    "/metrics",
+    status_code=status.HTTP_200_OK,
+    summary="prometheus metrics",
+    tags=["observability"],
+    include_in_schema=False,
+)(get_metrics)
+router.get(
+    "/profiles",
+    status_code=status.HTTP_200_OK,
+    summary="stored request profiles",
+    tags=["observability"],
+    include_in_schema=False,
+)(get_profiles)
+router.get(
+    "/profiles/{profile_id}",
+    status_code=status.HTTP_200_OK,
+    summary="a request profile as speedscope JSON or folded stacks",
+    tags=["observability"],
+    include_in_schema=False,
+)(get_profile)
+router.get(
+    "/live/stream",
+    summary="live score and event changes (server-sent events)",
+    tags=["epl-live"],
+)(live_events)
+router.websocket("/live/ws")(live_socket)
 router.get("")
 
 urlpatterns = []
@@ -0,0 +1,243 @@
+import asyncio
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set
+from django.conf import settings
+from django.core.cache import cache
+from epl_api.v1.codec import get_codec
+from epl_api.v1.metrics import stage
+from epl_api.v1.seasons import season_key, season_timeout
+
+LEADERS = 10
+SECTIONS = ("lineups", "assists", "match_stats")
+
+
+def club_slug(club: str) -> str:
+    return "-".join(club.lower().split())
+
+
+def fixture_id(href: str) -> str:
+    return href.rstrip("/").rsplit("/", 1)[-1]
+
+
+def missing_sections(match: dict) -> List[str]:
+    """Sections of a processed match that were not scraped.
+
+    A match can have no assists at all, so assists only need to be present;
+    lineups and stats need data for at least one team.
+    """
+    missing = []
+    for section in SECTIONS:
+        value = match.get(section)
+        if value is None or (section != "assists" and not any(value.values())):
+            missing.append(section)
+    return missing
+
+
+def mark_completeness(match: dict) -> dict:
+    match["missing"] = missing_sections(match)
+    match["complete"] = not match["missing"]
+    return match
+
+
+class MatchStore:
+    """Processed matches of one club and season, kept in Redis hashes by match id.
+
+    Complete matches do not change, so they never expire and are not scraped
+    again. Incomplete ones go to a second hash and are only reused for
+    ``INCOMPLETE_TIMEOUT`` seconds before the fixture is retried. Each record
+    counts its scrapes; after ``INCOMPLETE_ATTEMPTS`` the match is settled
+    among the complete ones, its ``missing`` sections left as they are.
+    """
+
+    def __init__(self, club: str, season: Optional[str] = None):
+        key = season_key(f"club_matches_{club_slug(club)}", season)
+        self.key = cache.make_key(key)
+        self.partial_key = cache.make_key(f"{key}:partial")
+        self.client = cache.client.get_client(write=True)
+
+    def ids(self) -> Set[str]:
+        return {k.decode() for k in self.client.hkeys(self.key)}
+
+    def _load(self, key: str, ids: Optional[Iterable[str]] = None) -> Dict[str, dict]:
+        codec = get_codec()
+        if ids is None:
+            raw = self.client.hgetall(key)
+        else:
+            ids = list(ids)
+            raw = dict(zip(ids, self.client.hmget(key, ids))) if ids else {}
+        return {
+            k.decode() if isinstance(k, bytes) else k: codec.decode(v)
+            for k, v in raw.items()
+            if v is not None
+        }
+
+    def load(self, ids: Optional[Iterable[str]] = None) -> Dict[str, dict]:
+        return self._load(self.key, ids)
+
+    def load_partial(self) -> Dict[str, dict]:
+        """Incomplete matches that are still too recent to scrape again."""
+        cutoff = time.time() - settings.FIXTURE_RETRY["INCOMPLETE_TIMEOUT"]
+        return {
+            match_id: match
+            for match_id, match in self._load(self.partial_key).items()
+            if match.get("checked_at", 0) > cutoff
+        }
+
+    def has_partial(self) -> bool:
+        return self.client.hlen(self.partial_key) > 0
+
+    def save(self, matches: Iterable[dict]):
+        codec, now = get_codec(), time.time()
+        policy = settings.FIXTURE_RETRY
+        matches = list(matches)
+        previous = self._load(
+            self.partial_key, [m["match_id"] for m in matches if missing_sections(m)]
+        )
+        complete, partial = {}, {}
+        for match in matches:
+            match_id = match["match_id"]
+            if not missing_sections(match):
+                complete[match_id] = codec.encode(match)
+                continue
+            attempts = previous.get(match_id, {}).get("attempts", 0) + 1
+            match = {**match, "attempts": attempts}
+            if attempts >= policy["INCOMPLETE_ATTEMPTS"]:
+                # Some matches never get line-ups; stop asking for them
+                complete[match_id] = codec.encode(match)
+            else:
+                partial[match_id] = codec.encode({**match, "checked_at": now})
+        pipe = self.client.pipeline()
+        if complete:
+            pipe.hset(self.key, mapping=complete)
+            pipe.hdel(self.partial_key, *complete)
+        if partial:
+            pipe.hset(self.partial_key, mapping=partial)
+            # Outlive every retry, so the attempt counts are still there
+            pipe.expire(
+                self.partial_key,
+                policy["INCOMPLETE_TIMEOUT"] * (policy["INCOMPLETE_ATTEMPTS"] + 1),
+            )
+        pipe.execute()
+
+
+async def club_stats_timeout(club: str, season: Optional[str] = None, **kwargs):
+    """Keep club stats briefly while any match is incomplete, so holes get refilled."""
+    if await asyncio.to_thread(MatchStore(club, season).has_partial):
+        return settings.FIXTURE_RETRY["INCOMPLETE_TIMEOUT"]
+    return season_timeout(season)
+
+
+def identify_team(matches: Iterable[dict], hint: str) -> Optional[str]:
+    """The club's own name as the site spells it in match data.
+
+    The club plays in every one of its matches, so it is the most frequent
+    team; with a single match, fall back to matching the requested name.
+    """
+    counts = Counter(team for m in matches for team in (m["home"], m["away"]))
+    if not counts:
+        return None
+    (team, seen), *rest = counts.most_common()
+    if rest and rest[0][1] == seen:
+        hint = hint.lower()
+        return next(
+            (t for t in counts if hint in t.lower() or t.lower() in hint), team
+        )
+    return team
+
+
+def _venue() -> dict:
+    return {"matches": 0, "totals": {}, "stat_matches": {}}
+
+
+def empty_aggregate(team: Optional[str] = None) -> dict:
+    return {
+        "team": team,
+        "applied": [],
+        "all": _venue(),
+        "home": _venue(),
+        "away": _venue(),
+        "formations": {},
+        "minutes": {},
+        "goals": {},
+        "assists": {},
+    }
+
+
+def _bump(counter: dict, key: str, amount=1):
+    counter[key] = counter.get(key, 0) + amount
+
+
+def fold_match(state: dict, match: dict):
+    """Add one stored ``process_fixture`` result to the running aggregate."""
+    team = state["team"]
+    venue = "home" if match["home"] == team else "away"
+    stats = (match.get("match_stats") or {}).get(team, {})
+    for scope in (state["all"], state[venue]):
+        scope["matches"] += 1
+        for stat, value in stats.items():
+            _bump(scope["totals"], stat, value)
+            _bump(scope["stat_matches"], stat)
+
+    lineup = (match.get("lineups") or {}).get(team)
+    if lineup:
+        if lineup.get("formation"):
+            _bump(state["formations"], lineup["formation"])
+        for player in [*lineup["starters"].values(), *lineup["substitutes"].values()]:
+            minutes = str(player.get("minutes", "0"))
+            if minutes.isdigit():
+                _bump(state["minutes"], player["name"], int(minutes))
+            if player.get("goals"):
+                _bump(state["goals"], player["name"], player["goals"])
+    for assist in (match.get("assists") or {}).get(team, []):
+        _bump(state["assists"], assist["name"])
+    state["applied"].append(match["match_id"])
+
+
+def _venue_summary(scope: dict) -> dict:
+    return {
+        "matches": scope["matches"],
+        "totals": scope["totals"],
+        "per_match": {
+            stat: round(total / scope["stat_matches"][stat], 2)
+            for stat, total in scope["totals"].items()
+        },
+    }
+
+
+def _leaders(counter: dict) -> list:
+    ranked = sorted(counter.items(), key=lambda item: (-item[1], item[0]))
+    return [{"name": name, "count": count} for name, count in ranked[:LEADERS] if count]
+
+
+def summarize(state: dict) -> dict:
+    return {
+        "team": state["team"],
+        **_venue_summary(state["all"]),
+        "home": _venue_summary(state["home"]),
+        "away": _venue_summary(state["away"]),
+        "formations": state["formations"],
+        "minutes": dict(sorted(state["minutes"].items(), key=lambda i: -i[1])),
+        "goal_leaders": _leaders(state["goals"]),
+        "assist_leaders": _leaders(state["assists"]),
+    }
+
+
+def club_aggregates(club: str, season: Optional[str] = None) -> dict:
+    """Aggregates over every stored match, folding in only matches not seen yet."""
+    key = season_key(f"club_aggregates_{club_slug(club)}", season)
+    codec, store = get_codec(), MatchStore(club, season)
+    raw = cache.get(key)
+    state = codec.decode(raw) if raw is not None else None
+    state = state or empty_aggregate()
+
+    new_ids = store.ids() - set(state["applied"])
+    if new_ids:
+        with stage("aggregate", club=club, matches=len(new_ids)):
+            if state["team"] is None:
+                state["team"] = identify_team(store.load().values(), club)
+            new = store.load(new_ids)
+            for match_id in sorted(new):
+                fold_match(state, new[match_id])
+        cache.set(key, codec.encode(state), timeout=None)
+    return summarize(state)
@@ -0,0 +1,96 @@
+import asyncio
+import weakref
+from typing import Any, Dict, Iterable, Optional
+import redis.asyncio as aioredis
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from epl_api.v1.codec import is_encoded
+
+
+class AsyncRedisCache:
+    """Non-blocking access to the default cache for async handlers.
+
+    Codec entries are stored raw and everything else is encoded exactly as
+    django-redis encodes it, so both clients read each other's entries. Connections come from one pool per event
+    loop, and multi-key operations go out as a single round trip.
+    """
+
+    def __init__(self, url: str, config: dict):
+        self.pool = aioredis.ConnectionPool.from_url(
+            url,
+            max_connections=config["MAX_CONNECTIONS"],
+            socket_timeout=config["SOCKET_TIMEOUT"],
+            socket_connect_timeout=config["CONNECT_TIMEOUT"],
+        )
+        self.client = aioredis.Redis(connection_pool=self.pool)
+
+    @staticmethod
+    def _ttl(timeout) -> Optional[int]:
+        if timeout is DEFAULT_TIMEOUT:
+            return cache.default_timeout
+        return None if timeout is None else int(timeout)
+
+    @staticmethod
+    def _encode(value: Any) -> Any:
+        return value if is_encoded(value) else cache.client.encode(value)
+
+    @staticmethod
+    def _decode(raw: bytes) -> Any:
+        return raw if is_encoded(raw) else cache.client.decode(raw)
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        raw = await self.client.get(cache.make_key(key))
+        return default if raw is None else self._decode(raw)
+
+    async def exists(self, key: str) -> bool:
+        return bool(await self.client.exists(cache.make_key(key)))
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        keys = list(keys)
+        if not keys:
+            return {}
+        values = await self.client.mget([cache.make_key(k) for k in keys])
+        return {
+            key: self._decode(raw) for key, raw in zip(keys, values) if raw is not None
+        }
+
+    async def set(self, key: str, value: Any, timeout=DEFAULT_TIMEOUT):
+        await self.set_many({key: value}, timeout)
+
+    async def set_many(self, mapping: Dict[str, Any], timeout=DEFAULT_TIMEOUT):
+        ttl = self._ttl(timeout)
+        async with self.client.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                if ttl is not None and ttl <= 0:
+                    pipe.delete(cache.make_key(key))
+                else:
+                    pipe.set(cache.make_key(key), self._encode(value), ex=ttl)
+            await pipe.execute()
+
+    async def add_to_set(self, key: str, *members: str):
+        """Add plain string ``members`` to the Redis set at ``key``."""
+        await self.client.sadd(cache.make_key(key), *members)
+
+    async def close(self):
+        await self.client.aclose()
+        await self.pool.disconnect()
+
+
+# Pooled connections belong to the loop that opened them
+_caches: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncRedisCache]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def async_cache() -> AsyncRedisCache:
+    loop = asyncio.get_running_loop()
+    if loop not in _caches:
+        _caches[loop] = AsyncRedisCache(
+            settings.CACHES["default"]["LOCATION"], settings.ASYNC_CACHE
+        )
+    return _caches[loop]
+
+
+def reset_async_cache():
+    _caches.clear()
@@ -0,0 +1,258 @@
+import asyncio
+import logging
+import os
+import time
+import weakref
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Dict, Optional
+from django.conf import settings
+from epl_api.v1.har import close_browser, new_page
+from epl_api.v1.lazy import async_playwright
+from epl_api.v1.metrics import (
+    BROWSER_LAUNCHES,
+    BROWSER_RECYCLES,
+    BROWSER_RSS,
+    BROWSERS_OPEN,
+    PAGES_OPEN,
+    stage,
+)
+from epl_api.v1.quota import page_quota
+from epl_api.v1.utils import stage_timeout
+
+
+def process_tree_rss(pid: Optional[int] = None) -> Optional[int]:
+    """Resident bytes of every descendant of ``pid``: Chromium and its driver.
+
+    Returns None where there is no ``/proc`` to read.
+    """
+    proc = Path("/proc")
+    if not proc.is_dir():
+        return None
+    children = defaultdict(list)
+    for stat in proc.glob("[0-9]*/stat"):
+        try:
+            # The command name may contain spaces, so split after its ")"
+            fields = stat.read_text().rsplit(")", 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        children[int(fields[1])].append(int(stat.parent.name))
+
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total, pending = 0, list(children[pid or os.getpid()])
+    while pending:
+        child = pending.pop()
+        pending.extend(children[child])
+        try:
+            total += int((proc / str(child) / "statm").read_text().split()[1]) * page_size
+        except (OSError, IndexError):
+            continue
+    return total
+
+
+class BrowserManager:
+    """One shared Chromium per event loop, with every page accounted for.
+
+    Each page gets its own context, and both are closed when the ``page()``
+    block exits, however it exits. Once the browser has served ``MAX_PAGES``
+    pages or the process tree exceeds ``MAX_RSS_MB``, new pages go to a fresh
+    browser and the old one is closed as soon as its last page is.
+
+    With ``ENDPOINT`` set the browser is the shared one run by
+    ``serve_browser``: pages are opened over a CDP connection, and memory is
+    watched by the service rather than here.
+    """
+
+    def __init__(self, config: dict):
+        self.config = config
+        self.playwright = None
+        self.browser = None
+        self.open_pages: Dict[object, int] = {}
+        self.served = 0
+        self.rss_checked = 0.0
+        self.lock = asyncio.Lock()
+
+    def counts(self) -> dict:
+        return {
+            "browsers": len(self.open_pages),
+            "pages": sum(self.open_pages.values()),
+            "served": self.served,
+        }
+
+    @property
+    def remote(self) -> bool:
+        return bool(self.config["ENDPOINT"])
+
+    async def recycle_reason(self) -> Optional[str]:
+        if self.remote:
+            return None
+        if self.served >= self.config["MAX_PAGES"]:
+            return "pages"
+        now = time.monotonic()
+        if now - self.rss_checked < self.config["RSS_CHECK_INTERVAL"]:
+            return None
+        self.rss_checked = now
+        rss = await asyncio.to_thread(process_tree_rss)
+        if rss is None:
+            return None
+        BROWSER_RSS.set(rss)
+        return "rss" if rss > self.config["MAX_RSS_MB"] * 2**20 else None
+
+    async def _launch(self):
+        if self.playwright is None:
+            self.playwright = await async_playwright().start()
+        async with stage("browser_launch"):
+            if self.remote:
+                browser = await self.playwright.chromium.connect_over_cdp(
+                    self.config["ENDPOINT"], timeout=stage_timeout("browser_launch")
+                )
+            else:
+                browser = await self.playwright.chromium.launch(
+                    headless=self.config["HEADLESS"],
+                    args=["--no-sandbox"],
+                    timeout=stage_timeout("browser_launch"),
+                )
+        BROWSER_LAUNCHES.inc()
+        BROWSERS_OPEN.inc()
+        self.open_pages[browser] = 0
+        self.served = 0
+        return browser
+
+    async def _close(self, browser):
+        self.open_pages.pop(browser, None)
+        try:
+            if self.remote:
+                # Only disconnect: other workers' contexts live in the same browser
+                await browser.close()
+            else:
+                await close_browser(browser)
+        except Exception as e:
+            logging.warning(f"Closing Chromium failed: {e}")
+        BROWSERS_OPEN.dec()
+
+    async def _current(self):
+        async with self.lock:
+            if self.browser is not None:
+                reason = None
+                if not self.browser.is_connected():
+                    reason = "disconnected"
+                else:
+                    reason = await self.recycle_reason()
+                if reason:
+                    BROWSER_RECYCLES.labels(reason).inc()
+                    retired, self.browser = self.browser, None
+                    if not self.open_pages.get(retired):
+                        await self._close(retired)
+            if self.browser is None:
+                self.browser = await self._launch()
+            return self.browser
+
+    @asynccontextmanager
+    async def page(self):
+        async with page_quota().lease():
+            async with self._page() as page:
+                yield page
+
+    @asynccontextmanager
+    async def _page(self):
+        browser = await self._current()
+        self.served += 1
+        self.open_pages[browser] += 1
+        page = None
+        try:
+            page = await new_page(browser)
+            PAGES_OPEN.inc()
+            yield page
+        finally:
+            if page is not None:
+                PAGES_OPEN.dec()
+                try:
+                    # Closing the context closes the page and saves any HAR
+                    await page.context.close()
+                except Exception as e:
+                    logging.warning(f"Closing a page failed: {e}")
+            # close() may have shut the browser down while the page was open
+            if browser in self.open_pages:
+                self.open_pages[browser] -= 1
+                # A retired browser is closed once its last page is done
+                if browser is not self.browser and not self.open_pages[browser]:
+                    await self._close(browser)
+
+    async def close(self):
+        self.browser = None
+        for browser in list(self.open_pages):
+            await self._close(browser)
+        if self.playwright is not None:
+            await self.playwright.stop()
+            self.playwright = None
+
+
+# Playwright objects belong to the loop that created them
+_managers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, BrowserManager]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def browser_manager() -> BrowserManager:
+    loop = asyncio.get_running_loop()
+    if loop not in _managers:
+        _managers[loop] = BrowserManager(settings.BROWSER)
+    return _managers[loop]
+
+
+async def shutdown_browsers():
+    manager = _managers.pop(asyncio.get_running_loop(), None)
+    if manager is not None:
+        await manager.close()
+
+
+async def serve_browser(config: dict, port: int):
+    """Run the Chromium that every worker shares, listening for CDP on ``port``.
+
+    Relaunched when it crashes. Once the process tree exceeds ``MAX_RSS_MB`` it
+    is restarted as soon as no quota lease is held; without a quota, straight
+    away. Connected workers see the disconnect and reconnect. Runs until
+    cancelled.
+    """
+    playwright = await async_playwright().start()
+    try:
+        while True:
+            browser = await playwright.chromium.launch(
+                headless=config["HEADLESS"],
+                args=[
+                    "--no-sandbox",
+                    "--remote-debugging-address=127.0.0.1",
+                    f"--remote-debugging-port={port}",
+                ],
+                timeout=stage_timeout("browser_launch"),
+            )
+            BROWSER_LAUNCHES.inc()
+            logging.info(f"Serving Chromium over CDP on 127.0.0.1:{port}")
+            try:
+                reason = await _watch(browser, config)
+            finally:
+                try:
+                    await browser.close()
+                except Exception as e:
+                    logging.warning(f"Closing Chromium failed: {e}")
+            BROWSER_RECYCLES.labels(reason).inc()
+            logging.warning(f"Restarting the shared Chromium ({reason})")
+    finally:
+        await playwright.stop()
+
+
+async def _watch(browser, config: dict) -> str:
+    quota = page_quota()
+    while True:
+        await asyncio.sleep(config["RSS_CHECK_INTERVAL"])
+        if not browser.is_connected():
+            return "disconnected"
+        rss = await asyncio.to_thread(process_tree_rss)
+        if rss is None:
+            continue
+        BROWSER_RSS.set(rss)
+        if rss > config["MAX_RSS_MB"] * 2**20 and (
+            not quota.limit or not await quota.in_use()
+        ):
+            return "rss"
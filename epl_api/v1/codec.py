@@ -0,0 +1,154 @@
+import pickle
+import zlib
+from functools import lru_cache
+from typing import Any, List, Optional, Type
+import orjson
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django_redis.serializers.pickle import PickleSerializer
+from pydantic import BaseModel, TypeAdapter
+
+# Entry layout: MAGIC | schema version (1 byte) | format << 4 | compression | payload
+MAGIC = b"EC"
+HEADER_SIZE = len(MAGIC) + 2
+
+FORMATS = {"pickle": 0, "orjson": 1, "msgpack": 2}
+COMPRESSIONS = {"none": 0, "zlib": 1, "zstd": 2, "lz4": 3}
+
+
+def to_plain(value: Any) -> Any:
+    """Reduce Pydantic models to builtins so any format can serialize them."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (list, tuple)):
+        return [to_plain(v) for v in value]
+    if isinstance(value, dict):
+        return {k: to_plain(v) for k, v in value.items()}
+    return value
+
+
+@lru_cache(maxsize=None)
+def _serializer(name: str):
+    if name == "orjson":
+        return orjson.dumps, orjson.loads
+    if name == "msgpack":
+        try:
+            import msgpack
+        except ImportError as e:
+            raise ImproperlyConfigured("CACHE_CODEC format msgpack needs msgpack") from e
+        return msgpack.packb, msgpack.unpackb
+    if name == "pickle":
+        return pickle.dumps, pickle.loads
+    raise ImproperlyConfigured(f"Unknown CACHE_CODEC format {name!r}")
+
+
+@lru_cache(maxsize=None)
+def _compressor(name: str):
+    if name == "none":
+        return (lambda b: b), (lambda b: b)
+    if name == "zlib":
+        return zlib.compress, zlib.decompress
+    if name == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImproperlyConfigured("CACHE_CODEC zstd needs zstandard") from e
+        return zstandard.ZstdCompressor().compress, zstandard.decompress
+    if name == "lz4":
+        try:
+            import lz4.frame
+        except ImportError as e:
+            raise ImproperlyConfigured("CACHE_CODEC lz4 needs lz4") from e
+        return lz4.frame.compress, lz4.frame.decompress
+    raise ImproperlyConfigured(f"Unknown CACHE_CODEC compression {name!r}")
+
+
+class CacheCodec:
+    def __init__(self, fmt: str, compression: str, threshold: int, version: int):
+        self.fmt = fmt
+        self.compression = compression
+        self.threshold = threshold
+        self.version = version
+        self.dumps, _ = _serializer(fmt)
+        self.compress, _ = _compressor(compression)
+
+    def encode(self, value: Any) -> bytes:
+        payload = self.dumps(to_plain(value))
+        compression = "none"
+        if len(payload) >= self.threshold:
+            payload = self.compress(payload)
+            compression = self.compression
+        flags = FORMATS[self.fmt] << 4 | COMPRESSIONS[compression]
+        return MAGIC + bytes((self.version, flags)) + payload
+
+    @staticmethod
+    def describe(raw: Any) -> Optional[dict]:
+        """Header fields of an encoded entry, or None for foreign values."""
+        if not is_encoded(raw):
+            return None
+        flags = raw[len(MAGIC) + 1]
+        return {
+            "version": raw[len(MAGIC)],
+            "format": next(k for k, v in FORMATS.items() if v == flags >> 4),
+            "compression": next(
+                k for k, v in COMPRESSIONS.items() if v == flags & 0x0F
+            ),
+        }
+
+    def decode(self, raw: Any) -> Any:
+        """Return the stored value, or None when it was written for another version.
+
+        Values not written by a codec (e.g. before it was enabled) pass through.
+        """
+        if not is_encoded(raw):
+            return raw
+        header = self.describe(raw)
+        if header["version"] != self.version:
+            return None
+        _, loads = _serializer(header["format"])
+        _, decompress = _compressor(header["compression"])
+        return loads(decompress(raw[HEADER_SIZE:]))
+
+
+def is_encoded(raw: Any) -> bool:
+    return isinstance(raw, bytes) and raw.startswith(MAGIC)
+
+
+class CodecSerializer(PickleSerializer):
+    """django-redis serializer that stores codec entries as they are.
+
+    Codec bytes already carry their own format, so pickling them again only adds
+    overhead; anything else is pickled as before.
+    """
+
+    def dumps(self, value: Any) -> bytes:
+        return value if is_encoded(value) else super().dumps(value)
+
+    def loads(self, value: bytes) -> Any:
+        return value if is_encoded(value) else super().loads(value)
+
+
+@lru_cache(maxsize=None)
+def _codec(fmt: str, compression: str, threshold: int, version: int) -> CacheCodec:
+    return CacheCodec(fmt, compression, threshold, version)
+
+
+def get_codec() -> CacheCodec:
+    config = settings.CACHE_CODEC
+    return _codec(
+        config["FORMAT"], config["COMPRESSION"], config["THRESHOLD"], config["VERSION"]
+    )
+
+
+@lru_cache(maxsize=None)
+def list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[schema])
+
+
+def rehydrate(data: Any, schema: Optional[Type[BaseModel]]) -> Any:
+    """Turn decoded plain rows back into ``schema`` instances."""
+    if schema is None or not isinstance(data, list):
+        return data
+    if data and isinstance(data[0], schema):
+        return data
+    return list_adapter(schema).validate_python(data)
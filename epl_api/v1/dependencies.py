@@ -1,18 +1,32 @@
 import logging
-from playwright.async_api import async_playwright
+from contextlib import asynccontextmanager
+from fastapi import Request
+from epl_api.v1.browsers import browser_manager
+from epl_api.v1.jobs import cache_only
+from epl_api.v1.lazy import LazyPage
+from epl_api.v1.scheduler import client_disconnected
+from epl_api.v1.utils import apply_stage_timeouts
 
 
-async def get_page():
-    browser = None  
-    async with async_playwright() as p:
-        try:
-            browser = await p.chromium.launch(headless=True, args=["--no-sandbox"])
-            page = await browser.new_page()
-            try:
-                yield page
-            finally:
-                if browser:
-                    await browser.close()
-        except Exception as e:
-            logging.error(f"Failed to launch Playwright: {e}")
-            raise
+@asynccontextmanager
+async def launch_page():
+    """A page on the shared browser, closed along with its context on exit."""
+    try:
+        async with browser_manager().page() as page:
+            yield apply_stage_timeouts(page)
+    except Exception as e:
+        logging.error(f"Scrape with Playwright failed: {e}")
+        raise
+
+
+async def get_page(request: Request = None):
+    if request is not None:
+        # Lets the scheduler drop this request's scrape if the client leaves
+        client_disconnected.set(request.is_disconnected)
+    if cache_only():
+        # API workers in the split deployment never launch a browser
+        yield None
+        return
+    # Opened by the first goto, so cache hits never wait for a quota lease
+    async with LazyPage(launch_page) as page:
+        yield page
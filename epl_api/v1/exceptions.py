@@ -0,0 +1,55 @@
+class UpstreamUnavailable(Exception):
+    """premierleague.com is being shed: the breaker is open or we are throttled."""
+
+    def __init__(self, reason: str, retry_after: float = 0):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class BudgetExceeded(TimeoutError):
+    """A page type used up its navigation budget before ``step`` could start."""
+
+    def __init__(self, page_type: str, step: str):
+        super().__init__(f"{page_type} navigation budget exhausted before {step}")
+        self.page_type = page_type
+        self.step = step
+
+
+class NotFound(Exception):
+    """The upstream site has no match for the requested player or club."""
+
+    def __init__(self, resource: str, query: str):
+        super().__init__(f"No {resource} matches {query!r}")
+        self.resource = resource
+        self.query = query
+
+
+class ScrapeQueued(Exception):
+    """Cache-only API worker missed; a scraper worker will fill the entry."""
+
+    def __init__(self, key: str, retry_after: float):
+        super().__init__(f"Scrape for {key} queued")
+        self.key = key
+        self.retry_after = retry_after
+
+
+class ScrapeFailed(Exception):
+    """A scrape raised; the outcome is remembered briefly to avoid retry storms."""
+
+    def __init__(self, key: str, reason: str):
+        super().__init__(f"Scrape for {key} failed: {reason}")
+        self.key = key
+        self.reason = reason
+
+
+class ClientDisconnected(Exception):
+    """The HTTP client went away while its scrape was still queued."""
+
+
+class Forbidden(Exception):
+    """An admin endpoint was called without its token."""
+
+    def __init__(self, resource: str):
+        super().__init__(f"Access to {resource} requires a valid token")
+        self.resource = resource
@@ -0,0 +1,244 @@
+import re
+from bisect import bisect_left, bisect_right, insort
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from epl_api.v1.exceptions import NotFound
+from epl_api.v1.snapshots import row_id
+
+# Long enough for stoppage time; calendar entries only need a plausible end
+MATCH_LENGTH = timedelta(minutes=115)
+
+DATE_ONLY = re.compile(r"\s*\d{4}-\d{2}-\d{2}\s*")
+
+
+def parse_kickoff(value) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        kickoff = value
+    else:
+        try:
+            # Pydantic writes UTC as "Z", which fromisoformat only takes from 3.11
+            kickoff = datetime.fromisoformat(re.sub(r"Z$", "+00:00", value))
+        except (TypeError, ValueError):
+            return None
+    return kickoff if kickoff.tzinfo else kickoff.replace(tzinfo=timezone.utc)
+
+
+def keep_bare_date(value):
+    """Parse "2024-05-31" as a date rather than as midnight, for ``query_bound``."""
+    if isinstance(value, str) and DATE_ONLY.fullmatch(value):
+        return date.fromisoformat(value.strip())
+    return value
+
+
+def query_bound(
+    value: Union[date, datetime, None], end: bool = False
+) -> Optional[datetime]:
+    """A ``from``/``to`` query value as a UTC datetime.
+
+    A bare date stands for the whole day: its start as ``from``, and as ``to``
+    the last instant before the next midnight, since ``to`` is inclusive.
+    """
+    if value is None or isinstance(value, datetime):
+        return parse_kickoff(value)
+    start = datetime.combine(value, time.min, tzinfo=timezone.utc)
+    return start + timedelta(days=1, microseconds=-1) if end else start
+
+
+def match_club(name: str, clubs: Iterable[str]) -> str:
+    """The one of ``clubs`` (lower-cased) that ``name`` refers to.
+
+    An exact match wins; otherwise ``name`` must be part of exactly one club,
+    so "spurs" or "villa" are enough but "united" is not.
+    """
+    query = name.lower()
+    if query in clubs:
+        return query
+    matches = [club for club in clubs if query in club]
+    if len(matches) != 1:
+        raise NotFound("club", name)
+    return matches[0]
+
+
+def fixture_kickoff(row: dict) -> Optional[datetime]:
+    return parse_kickoff(row.get("kickoff")) or parse_kickoff(row.get("time"))
+
+
+class FixtureIndex:
+    """Fixtures sorted by kickoff, overall and per club.
+
+    Entries are ``(timestamp, row id)`` pairs in sorted lists, so a date range
+    or a club's next match is a bisect, and a snapshot delta updates only the
+    rows it names. Fixtures without a kickoff are kept but never listed.
+    """
+
+    def __init__(self):
+        self.revision = 0
+        self.rows: Dict[str, dict] = {}
+        self.by_time: List[Tuple[float, str]] = []
+        self.by_club: Dict[str, List[Tuple[float, str]]] = {}
+        self.names: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _entry(self, key: str) -> Optional[Tuple[float, str]]:
+        kickoff = self.rows[key]["kickoff"]
+        return (kickoff.timestamp(), key) if kickoff else None
+
+    def _clubs(self, key: str) -> Tuple[str, str]:
+        row = self.rows[key]
+        return str(row.get("home")).lower(), str(row.get("away")).lower()
+
+    def add(self, row: dict):
+        key = row_id("fixtures", row)
+        if key in self.rows:
+            self.remove(key)
+        self.rows[key] = {**row, "kickoff": fixture_kickoff(row)}
+        for club in ("home", "away"):
+            self.names.setdefault(str(row.get(club)).lower(), str(row.get(club)))
+        entry = self._entry(key)
+        if entry is None:
+            return
+        insort(self.by_time, entry)
+        for club in self._clubs(key):
+            insort(self.by_club.setdefault(club, []), entry)
+
+    def remove(self, key: str):
+        if key not in self.rows:
+            return
+        entry = self._entry(key)
+        if entry is not None:
+            self.by_time.pop(bisect_left(self.by_time, entry))
+            for club in self._clubs(key):
+                entries = self.by_club[club]
+                entries.pop(bisect_left(entries, entry))
+        del self.rows[key]
+
+    def apply(self, changes: dict) -> bool:
+        """Apply a snapshot ``delta``; False if it does not start at our revision."""
+        if changes["full"]:
+            self.__init__()
+        elif changes["since"] != self.revision:
+            return False
+        for row in changes["removed"]:
+            self.remove(row_id("fixtures", row))
+        for row in [*changes["inserted"], *changes["updated"]]:
+            self.add({k: v for k, v in row.items() if k != "previous"})
+        self.revision = changes["revision"]
+        return True
+
+    def club(self, name: str) -> str:
+        """The indexed club ``name`` refers to, matched case-insensitively."""
+        return match_club(name, self.by_club)
+
+    def _slice(self, entries, start, end) -> List[dict]:
+        lo = 0 if start is None else bisect_left(entries, (start.timestamp(), ""))
+        hi = len(entries)
+        if end is not None:
+            # Every row id sorts below "\uffff", so ``end`` itself is included
+            hi = bisect_right(entries, (end.timestamp(), "\uffff"))
+        return [self.rows[key] for _, key in entries[lo:hi]]
+
+    def between(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        club: Optional[str] = None,
+    ) -> List[dict]:
+        entries = self.by_club[self.club(club)] if club else self.by_time
+        return self._slice(entries, start, end)
+
+    def next_match(self, club: str, after: datetime) -> Optional[dict]:
+        entries = self.by_club[self.club(club)]
+        i = bisect_left(entries, (after.timestamp(), ""))
+        return self.rows[entries[i][1]] if i < len(entries) else None
+
+    def matchweeks(self) -> List[dict]:
+        """Group fixtures into rounds in kickoff order.
+
+        The site's list carries no matchweek number, so a new round starts
+        when a club that already played in the current one plays again.
+        Rounds are numbered from the first one listed.
+        """
+        rounds, current, seen = [], [], set()
+        for _, key in self.by_time:
+            clubs = self._clubs(key)
+            if seen.intersection(clubs):
+                rounds.append(current)
+                current, seen = [], set()
+            current.append(self.rows[key])
+            seen.update(clubs)
+        if current:
+            rounds.append(current)
+        return [
+            {
+                "round": number,
+                "start": fixtures[0]["kickoff"],
+                "end": fixtures[-1]["kickoff"],
+                "fixtures": fixtures,
+            }
+            for number, fixtures in enumerate(rounds, start=1)
+        ]
+
+
+def _ics_text(value: str) -> str:
+    for char in ("\\", ";", ","):
+        value = value.replace(char, f"\\{char}")
+    return value.replace("\n", "\\n")
+
+
+def _ics_time(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _fold(line: str) -> str:
+    # RFC 5545 caps content lines at 75 octets; continuations start with a space
+    encoded, parts = line.encode(), []
+    while len(encoded) > 75:
+        cut = 75 if not parts else 74
+        while encoded[cut] & 0xC0 == 0x80:  # never split a UTF-8 sequence
+            cut -= 1
+        parts.append(encoded[:cut].decode())
+        encoded = encoded[cut:]
+    parts.append(encoded.decode())
+    return "\r\n ".join(parts)
+
+
+def to_ics(fixtures: Iterable[dict], name: str = "Premier League fixtures") -> str:
+    stamp = _ics_time(datetime.now(timezone.utc))
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//EPL API//Fixtures//EN",
+        "CALSCALE:GREGORIAN",
+        f"X-WR-CALNAME:{_ics_text(name)}",
+    ]
+    for fixture in fixtures:
+        home, away = str(fixture.get("home")), str(fixture.get("away"))
+        uid = "-".join(f"{home}-{away}".lower().split())
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{_ics_text(uid)}@epl-api",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART:{_ics_time(fixture['kickoff'])}",
+            f"DTEND:{_ics_time(fixture['kickoff'] + MATCH_LENGTH)}",
+            f"SUMMARY:{_ics_text(f'{home} v {away}')}",
+            "END:VEVENT",
+        ]
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(_fold(line) for line in lines) + "\r\n"
+
+
+_index: Optional[FixtureIndex] = None
+
+
+def fixture_index() -> FixtureIndex:
+    global _index
+    if _index is None:
+        _index = FixtureIndex()
+    return _index
+
+
+def reset_fixture_index():
+    global _index
+    _index = None
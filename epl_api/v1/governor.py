@@ -0,0 +1,215 @@
+import asyncio
+import time
+import weakref
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Deque, Dict, Optional
+from django.conf import settings
+from epl_api.v1.exceptions import BudgetExceeded, UpstreamUnavailable
+from epl_api.v1.metrics import (
+    UPSTREAM_BREAKER_STATE,
+    UPSTREAM_IN_FLIGHT,
+    UPSTREAM_REJECTIONS,
+)
+from epl_api.v1.scheduler import PRIORITIES, scrape_priority
+
+
+class TokenBucket:
+    """Allow ``rate`` requests per second with bursts of up to ``burst``."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, max_wait: float):
+        waited = 0.0
+        while True:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            delay = (1 - self.tokens) / self.rate
+            if waited + delay > max_wait:
+                raise UpstreamUnavailable("rate limited", retry_after=delay)
+            await asyncio.sleep(delay)
+            waited += delay
+
+
+class InFlightLimiter:
+    """Cap concurrent upstream requests; waiters go by scrape priority, then arrival."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.active = 0
+        self._waiters: Dict[str, Deque[asyncio.Future]] = {
+            name: deque() for name in PRIORITIES
+        }
+
+    async def acquire(self, max_wait: float):
+        if self.active < self.limit and not any(self._waiters.values()):
+            self.active += 1
+            return
+        waiters = self._waiters[scrape_priority.get()]
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, max_wait)
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # Granted just as we gave up: hand the slot on
+                self.release()
+            if isinstance(e, asyncio.TimeoutError):
+                raise UpstreamUnavailable("too many in-flight requests", retry_after=1)
+            raise
+        finally:
+            if waiter in waiters:
+                waiters.remove(waiter)
+
+    def release(self):
+        # Hand the slot straight to the next waiter instead of freeing it
+        for name in PRIORITIES:
+            waiters = self._waiters[name]
+            while waiters:
+                waiter = waiters.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
+                    return
+        self.active -= 1
+
+
+class CircuitBreaker:
+    """Open after ``threshold`` consecutive failures, probe again after ``reset_timeout``."""
+
+    CLOSED, HALF_OPEN, OPEN = "closed", "half_open", "open"
+
+    def __init__(self, threshold: int, reset_timeout: float):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self.opened_at < self.reset_timeout:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    def check(self, probe: bool = True) -> bool:
+        """Raise while open; True if this caller became the half-open probe.
+
+        With ``probe=False`` only the fast rejection happens, so a request can
+        wait for its other admissions before claiming the probe.
+        """
+        state = self.state
+        if state == self.OPEN or (state == self.HALF_OPEN and self.probing):
+            retry_after = self.reset_timeout - (time.monotonic() - self.opened_at)
+            raise UpstreamUnavailable("circuit open", retry_after=max(retry_after, 1))
+        if state == self.HALF_OPEN and probe:
+            # Let exactly one request through to test the water
+            self.probing = True
+            return True
+        return False
+
+    def end_probe(self):
+        """Free the probe when it ended without an outcome, e.g. was cancelled."""
+        self.probing = False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+        UPSTREAM_BREAKER_STATE.set(0)
+
+    def record_failure(self):
+        self.failures += 1
+        if self.probing or self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+            UPSTREAM_BREAKER_STATE.set(1)
+        self.probing = False
+
+
+class UpstreamGovernor:
+    """Single choke point for every request we make to premierleague.com."""
+
+    def __init__(self, config: dict):
+        self.max_wait = config["MAX_QUEUE_WAIT"]
+        self.bucket = TokenBucket(config["RATE"], config["BURST"])
+        self.in_flight = InFlightLimiter(config["MAX_IN_FLIGHT"])
+        self.breaker = CircuitBreaker(
+            config["FAILURE_THRESHOLD"], config["RESET_TIMEOUT"]
+        )
+
+    @asynccontextmanager
+    async def navigation(self):
+        """Admit one navigation: breaker, then rate limit, then in-flight cap."""
+        try:
+            self.breaker.check(probe=False)
+            await self.bucket.acquire(self.max_wait)
+            await self.in_flight.acquire(self.max_wait)
+        except UpstreamUnavailable as e:
+            UPSTREAM_REJECTIONS.labels(e.reason).inc()
+            raise
+        try:
+            # Claimed only now, so a probe never waits in a queue it may not leave
+            probe = self.breaker.check()
+        except UpstreamUnavailable as e:
+            self.in_flight.release()
+            UPSTREAM_REJECTIONS.labels(e.reason).inc()
+            raise
+        UPSTREAM_IN_FLIGHT.inc()
+        try:
+            async with self.observe():
+                yield
+        finally:
+            UPSTREAM_IN_FLIGHT.dec()
+            self.in_flight.release()
+            if probe:
+                self.breaker.end_probe()
+
+    @asynccontextmanager
+    async def observe(self, counted: bool = True):
+        """Feed the outcome of an upstream-dependent step to the breaker.
+
+        With ``counted=False`` the step is left out, for waits on elements
+        that some pages legitimately lack.
+        """
+        if not counted:
+            yield
+            return
+        try:
+            yield
+        except BudgetExceeded:
+            # Our own deadline ran out, which says nothing about the upstream
+            raise
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+
+
+# The in-flight limiter's waiters are futures of the loop that created them
+_governors: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, UpstreamGovernor]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def upstream_governor() -> UpstreamGovernor:
+    loop = asyncio.get_running_loop()
+    if loop not in _governors:
+        _governors[loop] = UpstreamGovernor(settings.UPSTREAM_GOVERNOR)
+    return _governors[loop]
+
+
+def reset_upstream_governor():
+    _governors.clear()
+    UPSTREAM_BREAKER_STATE.set(0)
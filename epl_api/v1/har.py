@@ -0,0 +1,55 @@
+import time
+import uuid
+from pathlib import Path
+from typing import List
+from django.conf import settings
+
+
+def archive_dir() -> Path:
+    return Path(settings.HAR["DIR"])
+
+
+def archives() -> List[Path]:
+    """Recorded archives, oldest first, so newer recordings win on replay."""
+    found = [*archive_dir().glob("*.har"), *archive_dir().glob("*.har.zip")]
+    return sorted(found, key=lambda path: path.stat().st_mtime)
+
+
+def new_archive() -> Path:
+    archive_dir().mkdir(parents=True, exist_ok=True)
+    stamp = time.strftime("%Y%m%dT%H%M%S")
+    return archive_dir() / f"{stamp}-{uuid.uuid4().hex[:8]}.har.zip"
+
+
+async def replay_from(context, paths: List[Path]):
+    """Serve every request of ``context`` from ``paths`` and nothing else.
+
+    Routes run in reverse registration order, so each archive falls back to
+    the ones registered before it and the first route aborts what none has.
+    """
+    await context.route("**/*", lambda route: route.abort())
+    for path in paths:
+        await context.route_from_har(str(path), not_found="fallback")
+
+
+async def new_page(browser):
+    """A page in its own context, recording or replaying per ``HAR["MODE"]``."""
+    mode = settings.HAR["MODE"]
+    if mode == "record":
+        context = await browser.new_context(
+            record_har_path=str(new_archive()),
+            record_har_mode="full",
+            record_har_content="attach",
+        )
+    else:
+        context = await browser.new_context()
+        if mode == "replay":
+            await replay_from(context, archives())
+    return await context.new_page()
+
+
+async def close_browser(browser):
+    # A context only writes its HAR archive when it is closed explicitly
+    for context in browser.contexts:
+        await context.close()
+    await browser.close()
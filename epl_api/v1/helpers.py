@@ -1,41 +1,53 @@
 import re
-from typing import List, Optional, TypeVar as T, Dict
-from bs4 import BeautifulSoup
-from playwright.async_api import Page
+from typing import TYPE_CHECKING, List, Optional, TypeVar as T, Dict
 from epl_api.v1.schemas import (
     AttackSchema,
     DefenceSchema,
     DisciplineSchema,
     TeamPlaySchema,
 )
-from epl_api.v1.utils import onetrust_accept_cookie
-
-
-async def extract_player_stats(player: str, page: Page) -> List[Dict]:
-    await page.goto("https://www.premierleague.com/players")
+from epl_api.v1.exceptions import NotFound
+from epl_api.v1.lazy import BeautifulSoup
+from epl_api.v1.metrics import stage
+from epl_api.v1.navigation import budgeted
+from epl_api.v1.seasons import Season, season_query
+from epl_api.v1.utils import goto, onetrust_accept_cookie, upstream_url, wait_for
+
+if TYPE_CHECKING:
+    from bs4 import Tag
+    from playwright.async_api import Page
+
+
+@budgeted("players")
+async def extract_player_stats(
+    player: str, page: "Page", season: Optional[Season] = None
+) -> List[Dict]:
+    await goto(page, upstream_url("/players"))
     await onetrust_accept_cookie(page)
 
     # Search for the player
-    await page.wait_for_selector('input[placeholder="Search for a Player"]')
+    await wait_for(page, 'input[placeholder="Search for a Player"]')
     await page.fill('input[placeholder="Search for a Player"]', player)
     await page.keyboard.press("Enter")
-    await page.wait_for_selector("tbody.dataContainer.indexSection")
+    await wait_for(page, "tbody.dataContainer.indexSection")
 
     # Parse the page content
     content = await page.content()
-    soup = BeautifulSoup(content, "lxml")
+    with stage("parse", bytes=len(content)):
+        soup = BeautifulSoup(content, "lxml")
 
     # Extract the player list from the table
     tbody = soup.select_one("tbody.dataContainer.indexSection")
-    if not tbody:
-        raise Exception("Player table data not found")
-    players = tbody.find_all("tr", class_="player")
+    players = tbody.find_all("tr", class_="player") if tbody else []
+    if not players:
+        raise NotFound("player", player)
+    stats_path = "stats" + (season_query(season) if season else "")
     results = [
         {
             "name": player.find("a", class_="player__name").text.strip(),
-            "link": f"https:{player.find('a', class_='player__name')['href']}".replace(
-                "overview", "stats"
-            ),
+            "link": upstream_url(
+                player.find("a", class_="player__name")["href"]
+            ).replace("overview", stats_path),
             "position": player.find("td", class_="player__position").text.strip(),
             "nationality": player.find("span", class_="player__country").text.strip(),
         }
@@ -44,13 +56,15 @@ async def extract_player_stats(player: str, page: Page) -> List[Dict]:
     return (await extract_p_stats(player, page) for player in results if player)
 
 
+@budgeted("player_stats")
 async def extract_p_stats(player_data: dict, page) -> dict:
-    await page.goto(player_data["link"])
+    await goto(page, player_data["link"])
     await onetrust_accept_cookie(page)
 
     # Extract the stats content
     content = await page.content()
-    soup = BeautifulSoup(content, "lxml")
+    with stage("parse", bytes=len(content)):
+        soup = BeautifulSoup(content, "lxml")
 
     # Extract player stats
     stats_section = soup.select_one("div.player-stats__top-stats")
@@ -58,18 +72,19 @@ async def extract_p_stats(player_data: dict, page) -> dict:
         return {}
 
     # Helper function to extract top stats
-    def extract_stat(stat_class: str) -> int:
+    def extract_stat(stat_class: str) -> str:
         stat_element = stats_section.find("span", class_=f"stat{stat_class}")
-        return stat_element.text.strip() if stat_element else 0
+        return stat_element.text.strip() if stat_element else "0"
 
     # Extract appearances, goals, wins, and losses
     appearances = extract_stat("appearances")
     goals = extract_stat("goals")
     wins = extract_stat("wins")
     losses = extract_stat("losses")
+    club = soup.select_one(".player-header__team-name")
 
     # Filter sections by their names and map them to schemas
-    def filter_sections(name: str) -> Optional[BeautifulSoup]:
+    def filter_sections(name: str) -> Optional["Tag"]:
         return next(
             (
                 section
@@ -84,10 +99,11 @@ async def extract_p_stats(player_data: dict, page) -> dict:
             return str(round(int(arg.replace("%", "").strip()) / 100, 2))
         return arg
 
-    # Function to map the schema with extracted stats
-    def with_schema(section, schema: DefenceSchema):
+    # Function to map a section's stats onto the schema's fields. Plain dicts are
+    # returned; the caller validates every player in one pass
+    def with_schema(section, schema: DefenceSchema) -> dict:
         if not section:
-            return schema()  # validation error if field missing
+            return {}  # every field takes its default
 
         stats_dict = {}
         # Extract stats from the section
@@ -120,25 +136,28 @@ async def extract_p_stats(player_data: dict, page) -> dict:
                 else:
                     # Default to "N/A" if not found
                     filtered_stats[field] = "N/A"
-        return schema(**filtered_stats)
+        return filtered_stats
 
     # Mapping stats sections
     attack_section = filter_sections("Attack")
     team_play_section = filter_sections("Team Play")
     discipline_section = filter_sections("Discipline")
     defence_section = filter_sections("Defence")
-    attack: AttackSchema = with_schema(attack_section, AttackSchema)
-    team_play: TeamPlaySchema = with_schema(team_play_section, TeamPlaySchema)
-    discipline: DisciplineSchema = with_schema(discipline_section, DisciplineSchema)
-    defence: DefenceSchema = with_schema(defence_section, DefenceSchema)
+    with stage("parse"):
+        attack = with_schema(attack_section, AttackSchema)
+        team_play = with_schema(team_play_section, TeamPlaySchema)
+        discipline = with_schema(discipline_section, DisciplineSchema)
+        defence = with_schema(defence_section, DefenceSchema)
     return {
         "player_name": player_data["name"],
+        "position": player_data.get("position", "N/A"),
+        "club": club.text.strip() if club else "N/A",
         "appearances": appearances,
         "goals": goals,
         "wins": wins,
         "losses": losses,
-        "attack": attack.model_dump(),
-        "team_play": team_play.model_dump(),
-        "discipline": discipline.model_dump(),
-        "defence": defence.model_dump(),
+        "attack": attack,
+        "team_play": team_play,
+        "discipline": discipline,
+        "defence": defence,
     }
@@ -0,0 +1,92 @@
+import asyncio
+import queue
+from contextvars import ContextVar
+from typing import Any, Callable, Optional
+import orjson
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from epl_api.v1.metrics import SCRAPE_JOBS
+
+# Set inside the scraper worker so its cache misses scrape instead of enqueueing
+in_worker: ContextVar[bool] = ContextVar("in_worker", default=False)
+
+
+def cache_only() -> bool:
+    """True for API workers that must never scrape (``SERVING_MODE=cache_only``)."""
+    return settings.SERVING_MODE == "cache_only" and not in_worker.get()
+
+
+def pending_key(key: str) -> str:
+    return f"job:{key}"
+
+
+class RedisJobQueue:
+    """Jobs on a Redis list shared by every API and scraper worker."""
+
+    def __init__(self, name: str):
+        self.name = cache.make_key(name)
+
+    def push(self, job: dict):
+        cache.client.get_client(write=True).lpush(self.name, orjson.dumps(job))
+
+    async def pop(self, timeout: int) -> Optional[dict]:
+        client = cache.client.get_client(write=True)
+        item = await asyncio.to_thread(client.brpop, self.name, timeout)
+        return orjson.loads(item[1]) if item else None
+
+
+class MemoryJobQueue:
+    """In-process queue for tests and single-process setups."""
+
+    def __init__(self):
+        self.jobs = queue.Queue()
+
+    def push(self, job: dict):
+        self.jobs.put(job)
+
+    async def pop(self, timeout: int) -> Optional[dict]:
+        try:
+            return await asyncio.to_thread(self.jobs.get, timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+_queue = None
+
+
+def job_queue():
+    global _queue
+    if _queue is None:
+        config = settings.SCRAPE_QUEUE
+        if config["BACKEND"] == "redis":
+            _queue = RedisJobQueue(config["KEY"])
+        elif config["BACKEND"] == "memory":
+            _queue = MemoryJobQueue()
+        else:
+            raise ImproperlyConfigured(
+                f"Unknown SCRAPE_QUEUE backend {config['BACKEND']!r}"
+            )
+    return _queue
+
+
+def reset_job_queue():
+    global _queue
+    _queue = None
+
+
+def enqueue_scrape(func: Callable[..., Any], key: str, kwargs: dict) -> bool:
+    """Queue a scrape of ``key`` unless one is already pending.
+
+    The job names the decorated view by import path, so the worker runs it
+    through the same caching wrapper and stores the result where the API reads.
+    """
+    timeout = settings.SCRAPE_QUEUE["PENDING_TIMEOUT"]
+    if not cache.add(pending_key(key), 1, timeout=timeout):
+        SCRAPE_JOBS.labels("deduplicated").inc()
+        return False
+    job_queue().push(
+        {"func": f"{func.__module__}.{func.__qualname__}", "kwargs": kwargs, "key": key}
+    )
+    SCRAPE_JOBS.labels("enqueued").inc()
+    return True
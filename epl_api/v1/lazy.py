@@ -0,0 +1,74 @@
+import asyncio
+from contextlib import AsyncExitStack
+from importlib import import_module
+from typing import Any, AsyncContextManager, Callable, Optional
+
+
+class LazyImport:
+    """Stand-in for ``module.name``, or the module itself, that imports it on first use.
+
+    Keeps Playwright, BeautifulSoup/lxml and numpy out of the import path until
+    a request actually needs them, which shortens cold starts.
+    """
+
+    def __init__(self, module: str, name: Optional[str] = None):
+        self._module = module
+        self._name = name
+        self._target = None
+
+    def _resolve(self) -> Any:
+        if self._target is None:
+            module = import_module(self._module)
+            self._target = getattr(module, self._name) if self._name else module
+        return self._target
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._resolve(), attr)
+
+    def __repr__(self) -> str:
+        return f"<lazy {self._module}{f'.{self._name}' if self._name else ''}>"
+
+
+class LazyPage:
+    """Stand-in for a browser page that opens it on the first ``goto``.
+
+    Views get one from ``get_page``, so a request answered from the cache never
+    takes a page quota lease or starts a browser. ``opener`` makes the async
+    context manager that opens the real page, such as ``launch_page``; it is
+    exited along with this one.
+    """
+
+    def __init__(self, opener: Callable[[], AsyncContextManager]):
+        self._opener = opener
+        self._page = None
+        self._stack = AsyncExitStack()
+        self._lock = asyncio.Lock()
+
+    @property
+    def opened(self) -> bool:
+        return self._page is not None
+
+    async def open(self) -> Any:
+        async with self._lock:
+            if self._page is None:
+                self._page = await self._stack.enter_async_context(self._opener())
+        return self._page
+
+    def __getattr__(self, attr: str) -> Any:
+        if self._page is None:
+            raise RuntimeError(f"page.{attr} used before goto opened the page")
+        return getattr(self._page, attr)
+
+    async def __aenter__(self) -> "LazyPage":
+        return self
+
+    async def __aexit__(self, *exc_info) -> bool:
+        return await self._stack.__aexit__(*exc_info)
+
+
+BeautifulSoup = LazyImport("bs4", "BeautifulSoup")
+async_playwright = LazyImport("playwright.async_api", "async_playwright")
+np = LazyImport("numpy")
@@ -0,0 +1,157 @@
+import time
+from typing import Dict, List, Optional
+from django.conf import settings
+from django.core.cache import cache
+from epl_api.v1.codec import get_codec
+from epl_api.v1.exceptions import NotFound
+from epl_api.v1.lazy import np
+from epl_api.v1.metrics import stage
+from epl_api.v1.schemas import (
+    AttackSchema,
+    DefenceSchema,
+    DisciplineSchema,
+    TeamPlaySchema,
+)
+from epl_api.v1.seasons import resolve_season, season_key
+from epl_api.v1.utils import index_members
+
+# Column order also decides which section a bare name like "goals" refers to
+TOP_LEVEL = ("appearances", "goals", "wins", "losses")
+SECTIONS = {
+    "attack": AttackSchema,
+    "defence": DefenceSchema,
+    "team_play": TeamPlaySchema,
+    "discipline": DisciplineSchema,
+}
+COLUMNS = [*TOP_LEVEL] + [
+    f"{section}.{field}"
+    for section, schema in SECTIONS.items()
+    for field in schema.model_fields
+]
+
+
+def to_number(value) -> float:
+    try:
+        return float(str(value).replace(",", "").strip())
+    except ValueError:
+        return np.nan
+
+
+def resolve_column(stat: str) -> int:
+    """Index of ``stat``, given as "attack.shots" or just "shots"."""
+    if stat in COLUMNS:
+        return COLUMNS.index(stat)
+    for i, column in enumerate(COLUMNS):
+        if column.rpartition(".")[2] == stat:
+            return i
+    raise NotFound("stat", stat)
+
+
+class StatsMatrix:
+    """Players x stat columns as float64, with a precomputed ranking per column.
+
+    ``order[:, j]`` lists player rows by column ``j`` descending, with missing
+    values last, so a top-N query is a slice plus an optional mask.
+    """
+
+    def __init__(self, players: List[dict]):
+        self.names = [p["player_name"] for p in players]
+        self.rows = {name.lower(): i for i, name in enumerate(self.names)}
+        self.positions = np.array([str(p.get("position", "N/A")) for p in players])
+        self.clubs = np.array([str(p.get("club", "N/A")) for p in players])
+        self._positions = np.char.lower(self.positions)
+        self._clubs = np.char.lower(self.clubs)
+        self.values = np.array(
+            [
+                [to_number(p.get(column)) for column in TOP_LEVEL]
+                + [
+                    to_number(p.get(section, {}).get(field))
+                    for section, schema in SECTIONS.items()
+                    for field in schema.model_fields
+                ]
+                for p in players
+            ],
+            dtype=np.float64,
+        ).reshape(len(players), len(COLUMNS))
+        self.order = np.argsort(
+            np.where(np.isnan(self.values), np.inf, -self.values), axis=0, kind="stable"
+        )
+        self.counts = np.count_nonzero(~np.isnan(self.values), axis=0)
+        self.built_at = time.monotonic()
+
+    def top(
+        self,
+        stat: str,
+        n: int = 10,
+        position: Optional[str] = None,
+        club: Optional[str] = None,
+    ) -> List[dict]:
+        column = resolve_column(stat)
+        ranked = self.order[: self.counts[column], column]
+        if position or club:
+            mask = np.ones(len(self.names), dtype=bool)
+            if position:
+                mask &= self._positions == position.lower()
+            if club:
+                mask &= self._clubs == club.lower()
+            ranked = ranked[mask[ranked]]
+        return [
+            {
+                "rank": rank,
+                "player_name": self.names[i],
+                "position": str(self.positions[i]),
+                "club": str(self.clubs[i]),
+                "value": float(self.values[i, column]),
+            }
+            for rank, i in enumerate(ranked[:n].tolist(), start=1)
+        ]
+
+    def compare(self, players: List[str]) -> Dict[str, Dict[str, Optional[float]]]:
+        rows = []
+        for player in players:
+            if player.lower() not in self.rows:
+                raise NotFound("player", player)
+            rows.append(self.rows[player.lower()])
+        return {
+            self.names[i]: {
+                column: (None if np.isnan(v) else float(v))
+                for column, v in zip(COLUMNS, self.values[i].tolist())
+            }
+            for i in rows
+        }
+
+
+def player_index(p_name: Optional[str] = None, season: Optional[str] = None) -> str:
+    """The set of a season's cached ``player_stats`` keys."""
+    return season_key("player_stats_keys", season)
+
+
+def cached_player_stats(season_label: str) -> List[dict]:
+    """Every player already cached for the season, one entry per name."""
+    codec, players = get_codec(), {}
+    keys = index_members(player_index(season=season_label))
+    for raw in cache.get_many(keys).values():
+        for player in codec.decode(raw) or []:
+            if isinstance(player, dict) and player.get("player_name"):
+                players[player["player_name"]] = player
+    return list(players.values())
+
+
+_matrices: Dict[str, StatsMatrix] = {}
+
+
+def stats_matrix(season: Optional[str] = None) -> StatsMatrix:
+    """The season's matrix, rebuilt from the cache every ``REFRESH`` seconds."""
+    label = resolve_season(season).label
+    matrix = _matrices.get(label)
+    refresh = settings.LEADERBOARD["REFRESH"]
+    if matrix is None or time.monotonic() - matrix.built_at > refresh:
+        with stage("build_stats_matrix", season=label) as build:
+            matrix = StatsMatrix(cached_player_stats(label))
+            build.set_attribute("players", len(matrix.names))
+        _matrices[label] = matrix
+    return matrix
+
+
+def reset_stats_matrices():
+    _matrices.clear()
@@ -0,0 +1,240 @@
+import asyncio
+import json
+import logging
+from collections import Counter
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set
+from django.conf import settings
+from fastapi import Request, WebSocket
+from fastapi.responses import StreamingResponse
+from epl_api.v1.dependencies import get_page
+from epl_api.v1.fixture_calendar import parse_kickoff
+from epl_api.v1.lazy import BeautifulSoup
+from epl_api.v1.metrics import LIVE_SUBSCRIBERS, stage
+from epl_api.v1.navigation import budgeted
+from epl_api.v1.parsers import parse_assist
+from epl_api.v1.scheduler import client_disconnected, scrape_priority
+from epl_api.v1.utils import goto, onetrust_accept_cookie, upstream_url
+from epl_api.views import get_fixtures, process_lineups
+
+EVENT_KINDS = ("goals", "assists", "cards")
+
+
+def in_progress(fixtures: Iterable, now: Optional[datetime] = None) -> list:
+    """Fixtures whose kickoff lies within the last ``MATCH_WINDOW`` seconds."""
+    now = now or datetime.now(timezone.utc)
+    window = timedelta(seconds=settings.LIVE["MATCH_WINDOW"])
+    return [
+        f
+        for f in fixtures
+        if (kickoff := parse_kickoff(f.kickoff or f.time))
+        and kickoff <= now <= kickoff + window
+    ]
+
+
+def match_events(soup: BeautifulSoup, home: str, away: str, score: str) -> dict:
+    """Goals and cards from the line-ups, assists from the event summary."""
+    events = {kind: [] for kind in EVENT_KINDS}
+    home_lineup = soup.select_one(".teamList.mcLineUpContainter.homeLineup")
+    away_lineup = soup.select_one(".teamList.mcLineUpContainter.awayLineup")
+    if home_lineup and away_lineup:
+        lineups = process_lineups(
+            [home_lineup.get_text(" ")],
+            [away_lineup.get_text(" ")],
+            {"home_team_name": home, "away_team_name": away, "score": score},
+        )
+        for team, lineup in lineups.items():
+            players = [*lineup["starters"].values(), *lineup["substitutes"].values()]
+            for player in players:
+                who = {"team": team, "player": player["name"]}
+                events["goals"] += [who] * player["goals"]
+                for card in ("yellow", "red"):
+                    if player[f"{card}_cards"]:
+                        events["cards"].append({**who, "card": card})
+
+    for side, team in (("home", home), ("away", away)):
+        assisters = f".matchEventsContainer.{side} .mc-summary__assister"
+        for assister in soup.select(assisters):
+            parsed = parse_assist(assister.get_text())
+            if parsed:
+                events["assists"].append({"team": team, **parsed})
+    return events
+
+
+@budgeted("live")
+async def scrape_live_matches(page, fixtures: list) -> Dict[str, dict]:
+    """One pass over the fixtures list and the match centre of every live game."""
+    await goto(page, upstream_url("/fixtures"))
+    await onetrust_accept_cookie(page)
+    content = await page.content()
+    wanted = {(f.home, f.away) for f in fixtures}
+    listed = {}
+    with stage("parse", bytes=len(content)):
+        for element in BeautifulSoup(content, "lxml").select("li.match-fixture"):
+            teams = (element.get("data-home", ""), element.get("data-away", ""))
+            if teams in wanted:
+                score = element.select_one(".match-fixture__score")
+                link = element.select_one("[data-href]")
+                listed[teams] = (
+                    score.text.strip() if score else None,
+                    link["data-href"] if link else None,
+                )
+
+    matches = {}
+    for (home, away), (score, href) in listed.items():
+        state = {"home": home, "away": away, "score": score}
+        state.update({kind: [] for kind in EVENT_KINDS})
+        if href:
+            await goto(page, upstream_url(href))
+            content = await page.content()
+            with stage("parse", bytes=len(content)):
+                state.update(
+                    match_events(BeautifulSoup(content, "lxml"), home, away, score)
+                )
+        matches[f"{home} v {away}"] = state
+    return matches
+
+
+async def scrape_live_round(page) -> Dict[str, dict]:
+    fixtures = in_progress(list(await get_fixtures(page=page)))
+    if not fixtures:
+        return {}
+    return await scrape_live_matches(page, fixtures)
+
+
+def _multiset(events: List[dict]) -> Counter:
+    return Counter(tuple(sorted(e.items())) for e in events)
+
+
+def diff_matches(previous: Dict[str, dict], current: Dict[str, dict]) -> List[dict]:
+    """Score changes, new events and finished matches between two rounds."""
+    changes = []
+    for match, state in current.items():
+        before = previous.get(match, {})
+        if state["score"] != before.get("score"):
+            changes.append({"type": "score", "match": match, "score": state["score"]})
+        for kind in EVENT_KINDS:
+            added = _multiset(state[kind]) - _multiset(before.get(kind, []))
+            for event, count in added.items():
+                changes += [{"type": kind[:-1], "match": match, **dict(event)}] * count
+    for match in previous.keys() - current.keys():
+        changes.append(
+            {"type": "finished", "match": match, "score": previous[match]["score"]}
+        )
+    return changes
+
+
+class LiveHub:
+    """Runs one scraper for however many subscribers are listening.
+
+    The loop starts with the first subscriber, scrapes every ``INTERVAL``
+    seconds and stops once the last subscriber leaves. Slow subscribers lose
+    their oldest queued messages rather than holding up the others.
+    """
+
+    def __init__(self, scrape: Optional[Callable[..., Awaitable[dict]]] = None):
+        self.scrape = scrape or scrape_live_round
+        self.subscribers: Set[asyncio.Queue] = set()
+        self.state: Dict[str, dict] = {}
+        self.task: Optional[asyncio.Task] = None
+
+    @asynccontextmanager
+    async def subscribe(self):
+        queue = asyncio.Queue(maxsize=settings.LIVE["QUEUE_SIZE"])
+        queue.put_nowait({"type": "snapshot", "matches": self.state})
+        self.subscribers.add(queue)
+        LIVE_SUBSCRIBERS.set(len(self.subscribers))
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._run())
+        try:
+            yield queue
+        finally:
+            self.subscribers.discard(queue)
+            LIVE_SUBSCRIBERS.set(len(self.subscribers))
+
+    def publish(self, message: dict):
+        for queue in list(self.subscribers):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(message)
+
+    async def _run(self):
+        # Runs in a copy of the first subscriber's context: poll as background
+        # work that does not end when that subscriber leaves
+        client_disconnected.set(None)
+        scrape_priority.set("refresh")
+        pages = get_page()
+        page = await pages.__anext__()
+        if page is None:
+            # Cache-only API workers have no browser to poll with
+            logging.warning("Live mode needs a browser; not polling on this worker")
+            await pages.aclose()
+            return
+        try:
+            while self.subscribers:
+                try:
+                    current = await self.scrape(page)
+                except Exception as e:
+                    logging.warning(f"Live scrape failed: {e}")
+                else:
+                    changes = diff_matches(self.state, current)
+                    self.state = current
+                    if changes:
+                        self.publish({"type": "changes", "changes": changes})
+                await asyncio.sleep(settings.LIVE["INTERVAL"])
+        finally:
+            await pages.aclose()
+        if self.subscribers:
+            # Someone subscribed while the page was closing and saw this task
+            # still running, so nobody else will start the next loop
+            self.task = asyncio.create_task(self._run())
+
+
+live_hub = LiveHub()
+
+
+async def live_events(request: Request):
+    """Server-sent events: a snapshot, then only the changes."""
+
+    async def _stream():
+        async with live_hub.subscribe() as queue:
+            while not await request.is_disconnected():
+                try:
+                    message = await asyncio.wait_for(
+                        queue.get(), settings.LIVE["HEARTBEAT"]
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: {message['type']}\ndata: {json.dumps(message)}\n\n"
+
+    return StreamingResponse(
+        _stream(),
+        media_type="text/event-stream",
+        # identity keeps GZipMiddleware from buffering the stream
+        headers={"Cache-Control": "no-cache", "Content-Encoding": "identity"},
+    )
+
+
+async def live_socket(websocket: WebSocket):
+    await websocket.accept()
+    async with live_hub.subscribe() as queue:
+
+        async def send():
+            while True:
+                await websocket.send_json(await queue.get())
+
+        async def receive():
+            # Clients send nothing; reading is how a departure is noticed
+            # without waiting for the next change to fail to send
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                pass
+
+        tasks = [asyncio.create_task(send()), asyncio.create_task(receive())]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
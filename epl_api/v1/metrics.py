@@ -0,0 +1,214 @@
+import time
+from contextvars import ContextVar
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Any, Callable
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from epl_api.v1.tracing import span
+
+# Scrapes routinely take tens of seconds, so extend the default buckets upwards
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120
+)
+
+REQUEST_LATENCY = Histogram(
+    "epl_request_duration_seconds",
+    "End-to-end handler latency per endpoint",
+    ["endpoint"],
+    buckets=LATENCY_BUCKETS,
+)
+STAGE_LATENCY = Histogram(
+    "epl_stage_duration_seconds",
+    "Latency of a single scrape pipeline stage",
+    ["endpoint", "stage"],
+    buckets=LATENCY_BUCKETS,
+)
+CACHE_LOOKUPS = Counter(
+    "epl_cache_lookups_total",
+    "Cache lookups by outcome (hit, miss, stale)",
+    ["endpoint", "result"],
+)
+CACHE_ENTRY_BYTES = Histogram(
+    "epl_cache_entry_bytes",
+    "Encoded size of values written to the cache",
+    ["endpoint"],
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+)
+BUDGET_SPENT = Histogram(
+    "epl_navigation_budget_spent_seconds",
+    "Navigation budget consumed by each step, per page type",
+    ["page_type", "step"],
+    buckets=LATENCY_BUCKETS,
+)
+BUDGET_USED = Histogram(
+    "epl_navigation_budget_used_ratio",
+    "Share of the page type's budget used by the whole scrape",
+    ["page_type"],
+    buckets=(0.1, 0.25, 0.5, 0.75, 0.9, 1.0),
+)
+BUDGET_EXHAUSTED = Counter(
+    "epl_navigation_budget_exhausted_total",
+    "Scrapes cut short because the navigation budget ran out",
+    ["page_type", "step"],
+)
+SCRAPE_FAILURES = Counter(
+    "epl_scrape_failures_total",
+    "Exceptions raised inside a scrape pipeline stage",
+    ["endpoint", "stage"],
+)
+BROWSERS_OPEN = Gauge("epl_browsers_open", "Chromium instances currently open")
+BROWSER_LAUNCHES = Counter("epl_browser_launches_total", "Chromium launches")
+PAGES_OPEN = Gauge("epl_pages_open", "Browser pages (each in its own context) open")
+BROWSER_RECYCLES = Counter(
+    "epl_browser_recycles_total",
+    "Chromium instances retired by the watchdog, by reason",
+    ["reason"],
+)
+BROWSER_RSS = Gauge(
+    "epl_browser_rss_bytes", "Resident memory of the Chromium process tree"
+)
+BROWSER_QUOTA_WAIT = Histogram(
+    "epl_browser_quota_wait_seconds",
+    "Time spent queued for a slot under the global page quota",
+    buckets=LATENCY_BUCKETS,
+)
+BROWSER_QUOTA_TIMEOUTS = Counter(
+    "epl_browser_quota_timeouts_total",
+    "Pages refused because no quota slot freed up in time",
+)
+UPSTREAM_IN_FLIGHT = Gauge(
+    "epl_upstream_in_flight", "Navigations to the upstream site in progress"
+)
+UPSTREAM_BREAKER_STATE = Gauge(
+    "epl_upstream_breaker_open", "1 while the upstream circuit breaker is open"
+)
+UPSTREAM_REJECTIONS = Counter(
+    "epl_upstream_rejections_total",
+    "Navigations refused by the upstream governor",
+    ["reason"],
+)
+RETRY_ATTEMPTS = Counter(
+    "epl_retry_attempts_total",
+    "Attempts of retried scrapes by outcome (ok, retried, gave_up)",
+    ["operation", "outcome"],
+)
+SCHEDULER_WAIT = Histogram(
+    "epl_scheduler_wait_seconds",
+    "Time scrape jobs waited for a scheduler slot, by priority class",
+    ["priority"],
+    buckets=LATENCY_BUCKETS,
+)
+SCHEDULER_RUNNING = Gauge(
+    "epl_scheduler_running", "Scrape jobs holding a scheduler slot", ["priority"]
+)
+SCHEDULER_DROPPED = Counter(
+    "epl_scheduler_dropped_total",
+    "Queued scrape jobs dropped (deadline, disconnected)",
+    ["priority", "reason"],
+)
+SCRAPE_JOBS = Counter(
+    "epl_scrape_jobs_total",
+    "Scrape jobs by outcome (enqueued, deduplicated, completed, failed)",
+    ["outcome"],
+)
+LIVE_SUBSCRIBERS = Gauge(
+    "epl_live_subscribers", "Clients connected to the live match stream"
+)
+PROFILES_TAKEN = Counter(
+    "epl_profiles_total",
+    "Requests run under the profiler, by trigger (header, sampled)",
+    ["trigger"],
+)
+
+# Name of the endpoint being served; child tasks inherit it through the context
+current_endpoint: ContextVar[str] = ContextVar("current_endpoint", default="unknown")
+
+
+class stage:
+    """Time a pipeline stage, usable as both a sync and an async context manager.
+
+    Each stage is also traced as a span carrying ``attributes``. Failures are
+    counted against the stage and re-raised.
+    """
+
+    def __init__(self, name: str, **attributes):
+        self.name = name
+        self.started = 0.0
+        self.span = span(name, **attributes)
+
+    def set_attribute(self, key: str, value: Any):
+        self.span.set_attribute(key, value)
+
+    def __enter__(self):
+        self.span.__enter__()
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        endpoint = current_endpoint.get()
+        STAGE_LATENCY.labels(endpoint, self.name).observe(
+            time.perf_counter() - self.started
+        )
+        if exc_type is not None:
+            SCRAPE_FAILURES.labels(endpoint, self.name).inc()
+        self.span.__exit__(exc_type, exc, tb)
+        return False
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return self.__exit__(exc_type, exc, tb)
+
+
+def track_endpoint(func: Callable[..., Any]):
+    """Record handler latency and label every stage run beneath it.
+
+    The handler runs inside a root span that all stages become children of.
+    """
+    name = func.__name__
+
+    if iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            token = current_endpoint.set(name)
+            started = time.perf_counter()
+            try:
+                with span(name, **kwargs_attributes(kwargs)):
+                    return await func(*args, **kwargs)
+            finally:
+                REQUEST_LATENCY.labels(name).observe(time.perf_counter() - started)
+                current_endpoint.reset(token)
+
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        token = current_endpoint.set(name)
+        started = time.perf_counter()
+        try:
+            with span(name, **kwargs_attributes(kwargs)):
+                return func(*args, **kwargs)
+        finally:
+            REQUEST_LATENCY.labels(name).observe(time.perf_counter() - started)
+            current_endpoint.reset(token)
+
+    return wrapper
+
+
+def kwargs_attributes(kwargs: dict) -> dict:
+    # Keep path/query parameters, drop injected dependencies such as the page
+    return {
+        f"param.{k}": v for k, v in kwargs.items() if isinstance(v, (str, int, float))
+    }
+
+
+def render_metrics():
+    return generate_latest(), CONTENT_TYPE_LATEST
@@ -0,0 +1,102 @@
+import time
+from contextvars import ContextVar
+from functools import wraps
+from inspect import isasyncgenfunction
+from typing import Callable, Optional
+from django.conf import settings
+from epl_api.v1.exceptions import BudgetExceeded
+from epl_api.v1.metrics import BUDGET_EXHAUSTED, BUDGET_SPENT, BUDGET_USED
+
+
+class Budget:
+    """Overall deadline for scraping one page type.
+
+    Every navigation, selector wait and consent check draws its timeout from
+    what is left, so a slow upstream page costs at most ``BUDGET`` ms in total.
+    """
+
+    def __init__(self, page_type: str):
+        policy = settings.NAVIGATION.get(page_type, settings.NAVIGATION["default"])
+        self.page_type = page_type
+        self.wait_until = policy["WAIT_UNTIL"]
+        self.started = time.monotonic()
+        self.deadline = self.started + policy["BUDGET"] / 1000
+
+    def remaining_ms(self) -> int:
+        return max(0, int((self.deadline - time.monotonic()) * 1000))
+
+    def check(self, step: str) -> int:
+        remaining = self.remaining_ms()
+        if remaining <= 0:
+            BUDGET_EXHAUSTED.labels(self.page_type, step).inc()
+            raise BudgetExceeded(self.page_type, step)
+        return remaining
+
+    def record(self, step: str, started: float):
+        BUDGET_SPENT.labels(self.page_type, step).observe(time.monotonic() - started)
+
+    def close(self):
+        total = self.deadline - self.started
+        used = (time.monotonic() - self.started) / total if total > 0 else 1.0
+        BUDGET_USED.labels(self.page_type).observe(min(used, 1.0))
+
+
+current_budget: ContextVar[Optional[Budget]] = ContextVar("current_budget", default=None)
+
+
+class navigation_budget:
+    """Make a fresh budget current for the block.
+
+    A nested scrape (one match out of a club's results) gets its own budget
+    rather than sharing what is left of the outer page's.
+    """
+
+    def __init__(self, page_type: str):
+        self.page_type = page_type
+
+    def __enter__(self) -> Budget:
+        self.budget = Budget(self.page_type)
+        self.token = current_budget.set(self.budget)
+        return self.budget
+
+    def __exit__(self, exc_type, exc, tb):
+        current_budget.reset(self.token)
+        self.budget.close()
+        return False
+
+
+def budgeted(page_type: str):
+    """Run the decorated scraper (coroutine or async generator) under a budget."""
+
+    def decorator(func: Callable):
+        if isasyncgenfunction(func):
+
+            @wraps(func)
+            async def gen_wrapper(*args, **kwargs):
+                # The budget is only current while the generator runs, not
+                # while the consumer handles what it yielded
+                budget, agen = Budget(page_type), func(*args, **kwargs)
+                try:
+                    while True:
+                        token = current_budget.set(budget)
+                        try:
+                            item = await agen.__anext__()
+                        except StopAsyncIteration:
+                            break
+                        finally:
+                            current_budget.reset(token)
+                        yield item
+                finally:
+                    await agen.aclose()
+                    budget.close()
+
+            return gen_wrapper
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            with navigation_budget(page_type):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,156 @@
+import re
+from typing import Dict, List, Optional, TypedDict
+
+
+def parse_assist(text: str) -> Optional[dict]:
+    """Parse an assist label such as "Martin Ødegaard (Assist) 45+2’"."""
+    assist_cleaned = re.split(r"’| \(|\)", text.strip().replace("\n", " ").strip())
+    if len(assist_cleaned) < 2:
+        return None
+    minute, name = (
+        (assist_cleaned[0], assist_cleaned[1])
+        if assist_cleaned[0].isdigit() or "+" in assist_cleaned[0]
+        else (assist_cleaned[2], assist_cleaned[0])
+    )
+
+    # Sum minutes if there are additional time (e.g. "45+2")
+    return {
+        "name": name.strip(),
+        "minute": sum(map(int, minute.strip().split("+"))),
+    }
+
+
+class SquadPlayer(TypedDict):
+    name: str
+    appearances: int
+    goals: int
+    assists: int
+    clean_sheets: int
+    saves: int
+    shots: int
+
+
+class LineupPlayer(TypedDict):
+    name: str
+    yellow_cards: int
+    red_cards: int
+    goals: int
+    minutes: str
+
+
+class Lineup(TypedDict):
+    formation: Optional[str]
+    starters: Dict[str, LineupPlayer]
+    substitutes: Dict[str, LineupPlayer]
+
+
+POSITIONS = {"Goalkeepers", "Defenders", "Midfielders", "Forwards"}
+SQUAD_STATS = {
+    "Appearances": "appearances",
+    "Goals": "goals",
+    "Assists": "assists",
+    "Saves": "saves",
+    "Shots": "shots",
+}
+NUMBER = re.compile(r"\d+")
+
+
+def _squad_player(
+    words: List[str], start: int, name_end: Optional[int], stats: dict
+) -> SquadPlayer:
+    return {
+        "name": "Unknown" if name_end is None else " ".join(words[start:name_end]),
+        "appearances": stats.get("appearances", 0),
+        "goals": stats.get("goals", 0),
+        "assists": stats.get("assists", 0),
+        "clean_sheets": stats.get("clean_sheets", 0),
+        "saves": stats.get("saves", 0),
+        "shots": stats.get("shots", 0),
+    }
+
+
+def parse_squad(text: str) -> Dict[str, List[SquadPlayer]]:
+    """Players by position from the text of a club's squad list.
+
+    A single walk over the words of ``text``: an entry runs up to "View
+    Profile" or the next position heading, its name is whatever precedes
+    "Appearances", and each stat is the first "<label> <number>" in it.
+    """
+    words = text.split()
+    squad: Dict[str, List[SquadPlayer]] = {}
+    players: Optional[List[SquadPlayer]] = None
+    start, name_end, stats = 0, None, {}
+    i, n = 0, len(words)
+    while i < n:
+        word = words[i]
+        heading = word in POSITIONS
+        if heading or (word == "View" and i + 1 < n and words[i + 1] == "Profile"):
+            if players is not None and start < i:
+                players.append(_squad_player(words, start, name_end, stats))
+            if heading:
+                players = squad[word] = []
+            else:
+                i += 1
+            start, name_end, stats = i + 1, None, {}
+        else:
+            stat = SQUAD_STATS.get(word)
+            if (
+                stat is None
+                and word == "Clean"
+                and i + 1 < n
+                and words[i + 1] == "sheets"
+            ):
+                stat, i = "clean_sheets", i + 1
+            if stat == "appearances" and name_end is None:
+                name_end = i
+            value = NUMBER.match(words[i + 1]) if stat and i + 1 < n else None
+            if value:
+                i += 1
+                stats.setdefault(stat, int(value.group()))
+        i += 1
+    if players is not None and start < n:
+        players.append(_squad_player(words, start, name_end, stats))
+    return squad
+
+
+def _lineup_players(
+    entries: List[str], default_minutes: str
+) -> Dict[str, LineupPlayer]:
+    players: Dict[str, LineupPlayer] = {}
+    for entry in entries:
+        parts = entry.split()
+        name = " ".join(parts[1:3])
+        minutes = next(
+            (p for p in parts if "'" in p and p.replace("'", "").isdigit()), None
+        )
+        players[name] = {
+            "name": name,
+            "yellow_cards": 1 if "Yellow" in parts else 0,
+            "red_cards": 1 if "Red" in parts else 0,
+            "goals": entry.count("Goal") + entry.count("label.penaltyscore"),
+            "minutes": minutes.strip("'") if minutes else default_minutes,
+        }
+    return players
+
+
+def parse_lineup(
+    text: str, starter_minutes: str = "90", sub_minutes: str = "0"
+) -> Lineup:
+    """Formation, starters and substitutes from the text of one team's line-up.
+
+    The text is "<team info> Shirt number <n> <first> <last> <events>..." with
+    "Substitutes" after the last starter. Players without minutes get the
+    default for their side.
+    """
+    entries = " ".join(text.split()).split(" Shirt number ")
+    subs = next((i for i, entry in enumerate(entries) if "Substitutes" in entry), 0)
+    # Substitutes listed in the team info itself cannot split anything
+    starters = entries[1 : subs + 1] if subs else entries[1:]
+    team_info = entries[0].split()
+    return {
+        "formation": team_info[-2] if len(team_info) > 1 else None,
+        "starters": _lineup_players(starters, starter_minutes),
+        "substitutes": _lineup_players(
+            entries[subs + 1 :] if subs else [], sub_minutes
+        ),
+    }
@@ -0,0 +1,263 @@
+import asyncio
+import hmac
+import json
+import logging
+import random
+import re
+import secrets
+import sys
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from django.conf import settings
+from epl_api.v1.exceptions import NotFound
+from epl_api.v1.metrics import PROFILES_TAKEN
+
+PROFILE_HEADER = b"x-epl-profile"
+
+# Samples taken outside any task: callbacks, and the selector while idle
+LOOP = "(event loop)"
+
+PROFILE_ID = re.compile(r"[0-9A-Za-z-]+")
+
+Frame = Tuple[str, str, int]
+
+
+def token_valid(token: Optional[str]) -> bool:
+    expected = settings.PROFILING["TOKEN"]
+    return bool(expected and token) and hmac.compare_digest(
+        token.encode(), expected.encode()
+    )
+
+
+def trigger(scope: dict) -> Optional[str]:
+    """Why this request should be profiled, or None; cheap when profiling is off."""
+    config = settings.PROFILING
+    if config["TOKEN"]:
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                return "header" if token_valid(value.decode("latin-1")) else None
+    if config["SAMPLE_RATE"] and random.random() < config["SAMPLE_RATE"]:
+        return "sampled"
+    return None
+
+
+class Sampler:
+    """Sample the stacks of the event loop thread and of threads running our code.
+
+    A daemon thread reads ``sys._current_frames()`` every ``interval`` seconds
+    and weights each sample by the time since the previous one. Loop samples
+    are filed under the asyncio task running at that moment, so each task's
+    total is its time on the loop, and ``LOOP`` is the time no task held it.
+    Other threads are sampled only while a frame of the project is on their
+    stack and they are not parked in ``threading``, which keeps idle pool
+    workers out but catches sync views and ``to_thread`` work.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, interval: float):
+        self.loop = loop
+        self.loop_thread = threading.get_ident()
+        self.interval = interval
+        self.root = str(settings.BASE_DIR)
+        self.frames: Dict[Frame, int] = {}
+        self.stacks: Dict[str, Dict[Tuple[int, ...], float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+        self.count = 0
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="epl-profiler", daemon=True
+        )
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self):
+        last = time.perf_counter()
+        while not self._stopped.wait(self.interval):
+            now = time.perf_counter()
+            self._sample(now - last)
+            last = now
+
+    def _task(self) -> str:
+        try:
+            task = asyncio.current_task(self.loop)
+        except RuntimeError:
+            task = None
+        if task is None:
+            return LOOP
+        coro = task.get_coro()
+        return f"{getattr(coro, '__qualname__', 'task')} [{task.get_name()}]"
+
+    def _sample(self, elapsed: float):
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == self._thread.ident:
+                continue
+            stack, ours = [], False
+            leaf = frame.f_code.co_filename
+            while frame is not None:
+                code = frame.f_code
+                ours = ours or (
+                    code.co_filename.startswith(self.root)
+                    and "site-packages" not in code.co_filename
+                )
+                key = (
+                    getattr(code, "co_qualname", code.co_name),
+                    code.co_filename,
+                    code.co_firstlineno,
+                )
+                stack.append(self.frames.setdefault(key, len(self.frames)))
+                frame = frame.f_back
+            if ident == self.loop_thread:
+                owner = self._task()
+            elif ours and not leaf.endswith("threading.py"):
+                owner = f"thread {names.get(ident, ident)}"
+            else:
+                continue
+            self.stacks[owner][tuple(reversed(stack))] += elapsed
+            self.count += 1
+
+    def owners(self) -> Dict[str, float]:
+        """Sampled seconds per task and thread, busiest first."""
+        totals = {owner: sum(stacks.values()) for owner, stacks in self.stacks.items()}
+        return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+    def to_speedscope(self, name: str) -> dict:
+        """A speedscope file with one sampled profile per task and thread."""
+        frames = sorted(self.frames, key=self.frames.get)
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "epl_api",
+            "shared": {
+                "frames": [
+                    {"name": func, "file": file, "line": line}
+                    for func, file, line in frames
+                ]
+            },
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": owner,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": total,
+                    "samples": [list(stack) for stack in self.stacks[owner]],
+                    "weights": list(self.stacks[owner].values()),
+                }
+                for owner, total in self.owners().items()
+            ],
+        }
+
+
+def profile_dir() -> Path:
+    return Path(settings.PROFILING["DIR"])
+
+
+def save_profile(sampler: Sampler, summary: dict):
+    """Write the speedscope file and its summary, then prune to the newest ``KEEP``."""
+    directory = profile_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    name = f"{summary['method']} {summary['path']}"
+    profile = directory / f"{summary['id']}.speedscope.json"
+    profile.write_text(json.dumps(sampler.to_speedscope(name)))
+    (directory / f"{summary['id']}.summary.json").write_text(json.dumps(summary))
+    summaries = sorted(directory.glob("*.summary.json"))
+    for old in summaries[: -settings.PROFILING["KEEP"]]:
+        profile_id = old.name.split(".", 1)[0]
+        (directory / f"{profile_id}.speedscope.json").unlink(missing_ok=True)
+        old.unlink(missing_ok=True)
+
+
+def list_profiles() -> List[dict]:
+    """Summaries of the stored profiles, newest first."""
+    summaries = sorted(profile_dir().glob("*.summary.json"), reverse=True)
+    return [json.loads(path.read_text()) for path in summaries]
+
+
+def profile_path(profile_id: str) -> Path:
+    path = profile_dir() / f"{profile_id}.speedscope.json"
+    if not PROFILE_ID.fullmatch(profile_id) or not path.is_file():
+        raise NotFound("profile", profile_id)
+    return path
+
+
+def folded(path: Path) -> str:
+    """Collapsed stacks (``task;outer;inner microseconds``) for flamegraph.pl."""
+    profile = json.loads(path.read_text())
+    frames = [frame["name"] for frame in profile["shared"]["frames"]]
+    lines = []
+    for owner in profile["profiles"]:
+        for stack, weight in zip(owner["samples"], owner["weights"]):
+            path = ";".join([owner["name"], *(frames[i] for i in stack)])
+            lines.append(f"{path} {max(1, round(weight * 1e6))}")
+    return "\n".join(lines) + "\n"
+
+
+# One profile at a time: the sampler reads the whole loop thread, so two at
+# once would each see the other's work
+_busy = False
+
+
+class ProfilingMiddleware:
+    """Profile requests that ask for it with the token, or a sampled share of them.
+
+    The profile covers everything after this middleware: routing, the view,
+    ``cache_result``, parsing, validation and serialization. Its id is returned
+    in the ``X-EPL-Profile-Id`` response header.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        global _busy
+        reason = trigger(scope) if scope["type"] == "http" else None
+        if reason is None or _busy:
+            return await self.app(scope, receive, send)
+
+        _busy = True
+        started = datetime.now(timezone.utc)
+        profile_id = f"{started:%Y%m%dT%H%M%S%f}-{secrets.token_hex(4)}"
+        status = {}
+
+        async def send_with_id(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                header = (b"x-epl-profile-id", profile_id.encode())
+                message = {**message, "headers": [*message.get("headers", []), header]}
+            await send(message)
+
+        sampler = Sampler(asyncio.get_running_loop(), settings.PROFILING["INTERVAL"])
+        sampler.start()
+        began = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            wall = time.perf_counter() - began
+            sampler.stop()
+            _busy = False
+            PROFILES_TAKEN.labels(reason).inc()
+            summary = {
+                "id": profile_id,
+                "method": scope.get("method"),
+                "path": scope.get("path"),
+                "status": status.get("code"),
+                "trigger": reason,
+                "started": started.isoformat(),
+                "wall_seconds": round(wall, 6),
+                "samples": sampler.count,
+                "seconds": {k: round(v, 6) for k, v in sampler.owners().items()},
+            }
+            try:
+                await asyncio.to_thread(save_profile, sampler, summary)
+            except Exception as e:
+                logging.warning(f"Saving profile {profile_id} failed: {e}")
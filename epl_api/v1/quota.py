@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import time
+import uuid
+from contextlib import asynccontextmanager, suppress
+from typing import Optional
+from django.conf import settings
+from django.core.cache import cache
+from epl_api.v1.async_cache import async_cache
+from epl_api.v1.exceptions import UpstreamUnavailable
+from epl_api.v1.metrics import BROWSER_QUOTA_TIMEOUTS, BROWSER_QUOTA_WAIT
+
+# KEYS: leases, queue, waiting, tickets; ARGV: lease id, limit, now, lease ttl,
+# wait ttl. Leases and waiters are scored by expiry so dead workers drop out;
+# the queue is scored by ticket, and only its head may take a free slot.
+ACQUIRE = """
+local now = tonumber(ARGV[3])
+redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", now)
+for _, stale in ipairs(redis.call("ZRANGEBYSCORE", KEYS[3], "-inf", now)) do
+    redis.call("ZREM", KEYS[2], stale)
+    redis.call("ZREM", KEYS[3], stale)
+end
+if not redis.call("ZSCORE", KEYS[2], ARGV[1]) then
+    redis.call("ZADD", KEYS[2], redis.call("INCR", KEYS[4]), ARGV[1])
+end
+local free = tonumber(ARGV[2]) - redis.call("ZCARD", KEYS[1])
+if free > 0 and redis.call("ZRANK", KEYS[2], ARGV[1]) < free then
+    redis.call("ZREM", KEYS[2], ARGV[1])
+    redis.call("ZREM", KEYS[3], ARGV[1])
+    redis.call("ZADD", KEYS[1], now + tonumber(ARGV[4]), ARGV[1])
+    return 1
+end
+redis.call("ZADD", KEYS[3], now + tonumber(ARGV[5]), ARGV[1])
+return 0
+"""
+
+
+class PageQuota:
+    """At most ``PAGE_QUOTA`` browser pages open across every worker process.
+
+    Slots are leases in Redis that expire unless renewed, so a worker that dies
+    mid-scrape gives its pages back. Waiters queue by ticket and only the oldest
+    may take a freed slot, so one busy process cannot starve the others.
+    """
+
+    def __init__(self, config: dict):
+        self.limit = config["PAGE_QUOTA"]
+        self.lease_ttl = config["QUOTA_LEASE_TTL"]
+        self.max_wait = config["QUOTA_MAX_WAIT"]
+        self.poll = config["QUOTA_POLL_INTERVAL"]
+        # A waiter that stops polling for this long has gone and loses its place
+        self.wait_ttl = max(1.0, self.poll * 10)
+        self.keys = [
+            cache.make_key(f"browser_quota:{name}")
+            for name in ("leases", "queue", "waiting", "tickets")
+        ]
+
+    async def try_acquire(self, lease: str) -> bool:
+        """Take a slot for ``lease`` if it is at the head of the queue, else queue it."""
+        script = async_cache().client.register_script(ACQUIRE)
+        granted = await script(
+            keys=self.keys,
+            args=[lease, self.limit, time.time(), self.lease_ttl, self.wait_ttl],
+        )
+        return bool(granted)
+
+    async def acquire(self, lease: str):
+        started = time.monotonic()
+        try:
+            while not await self.try_acquire(lease):
+                if time.monotonic() - started + self.poll > self.max_wait:
+                    BROWSER_QUOTA_TIMEOUTS.inc()
+                    raise UpstreamUnavailable("browser page quota", retry_after=1)
+                await asyncio.sleep(self.poll)
+        except BaseException:
+            await self._dequeue(lease)
+            raise
+        BROWSER_QUOTA_WAIT.observe(time.monotonic() - started)
+
+    async def _dequeue(self, lease: str):
+        async with async_cache().client.pipeline(transaction=False) as pipe:
+            pipe.zrem(self.keys[1], lease)
+            pipe.zrem(self.keys[2], lease)
+            await pipe.execute()
+
+    async def _renew(self, lease: str):
+        while True:
+            await asyncio.sleep(self.lease_ttl / 3)
+            try:
+                await async_cache().client.zadd(
+                    self.keys[0], {lease: time.time() + self.lease_ttl}, xx=True
+                )
+            except Exception as e:
+                logging.warning(f"Renewing a browser page lease failed: {e}")
+
+    async def release(self, lease: str):
+        await async_cache().client.zrem(self.keys[0], lease)
+
+    async def in_use(self) -> int:
+        return await async_cache().client.zcount(self.keys[0], time.time(), "+inf")
+
+    @asynccontextmanager
+    async def lease(self):
+        """Hold one page slot for the duration of the block; no-op without a quota."""
+        if not self.limit:
+            yield
+            return
+        lease = uuid.uuid4().hex
+        await self.acquire(lease)
+        renewal = asyncio.create_task(self._renew(lease))
+        try:
+            yield
+        finally:
+            renewal.cancel()
+            with suppress(asyncio.CancelledError):
+                await renewal
+            await self.release(lease)
+
+
+_quota: Optional[PageQuota] = None
+
+
+def page_quota() -> PageQuota:
+    global _quota
+    if _quota is None:
+        _quota = PageQuota(settings.BROWSER)
+    return _quota
+
+
+def reset_page_quota():
+    global _quota
+    _quota = None
@@ -0,0 +1,223 @@
+import re
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterable, List, Optional, Tuple
+from epl_api.v1.fixture_calendar import match_club, parse_kickoff
+from epl_api.v1.snapshots import row_id
+
+SCORE = re.compile(r"\s*(\d+)\s*[-–]\s*(\d+)\s*")
+
+VENUES = ("home", "away")
+
+# (season, kickoff timestamp, sequence, key): seasons sort by label, matches
+# by kickoff, and matches without one by the order they were listed in
+Entry = Tuple[str, float, int, Tuple[str, str]]
+
+
+def parse_score(score) -> Optional[Tuple[int, int]]:
+    """Home and away goals of a score like "2-1"; None for "P-P" and the like."""
+    match = SCORE.fullmatch(str(score))
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+def _outcome(goals_for: int, goals_against: int) -> str:
+    if goals_for > goals_against:
+        return "W"
+    return "D" if goals_for == goals_against else "L"
+
+
+def tally(matches: Iterable[dict]) -> dict:
+    """Record, points and goals over ``matches`` seen from one club."""
+    outcomes = [m["outcome"] for m in matches]
+    totals = {
+        "played": len(outcomes),
+        "wins": outcomes.count("W"),
+        "draws": outcomes.count("D"),
+        "losses": outcomes.count("L"),
+        "goals_for": sum(m["goals_for"] for m in matches),
+        "goals_against": sum(m["goals_against"] for m in matches),
+    }
+    totals["points"] = 3 * totals["wins"] + totals["draws"]
+    return totals
+
+
+class ResultsStore:
+    """Played matches of every cached season, indexed for per-club queries.
+
+    Each result is stored once with its score parsed into goals. Sorted entry
+    lists per (home, away) pairing, per club and venue, and overall make a
+    head-to-head or a run of form a slice off the end of a list. Seasons are
+    loaded from their cached result lists and kept current by snapshot deltas,
+    so an appended result costs a few inserts rather than a rebuild.
+    """
+
+    def __init__(self):
+        self.revisions: Dict[str, int] = {}
+        self.rows: Dict[Tuple[str, str], dict] = {}
+        self.by_time: List[Entry] = []
+        self.by_pair: Dict[Tuple[str, str], List[Entry]] = {}
+        self.by_club: Dict[Tuple[str, str], List[Entry]] = {}
+        self.clubs: Dict[str, str] = {}
+        self.sequence = 0
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _lists(self, row: dict) -> List[List[Entry]]:
+        home, away = row["home"].lower(), row["away"].lower()
+        return [
+            self.by_time,
+            self.by_pair.setdefault((home, away), []),
+            self.by_club.setdefault((home, "home"), []),
+            self.by_club.setdefault((away, "away"), []),
+        ]
+
+    def add(self, season: str, row: dict):
+        goals = parse_score(row.get("score"))
+        key = (season, row_id("results", row))
+        previous = self.rows.get(key)
+        self.remove(key)
+        if goals is None:
+            return
+        kickoff = parse_kickoff(row.get("kickoff"))
+        if previous is None:
+            self.sequence += 1
+        sequence = previous["entry"][2] if previous else self.sequence
+        entry = (season, kickoff.timestamp() if kickoff else 0.0, sequence, key)
+        home, away = str(row.get("home")), str(row.get("away"))
+        self.rows[key] = {
+            "season": season,
+            "home": home,
+            "away": away,
+            "score": row.get("score"),
+            "home_goals": goals[0],
+            "away_goals": goals[1],
+            "kickoff": kickoff,
+            "entry": entry,
+        }
+        for club in (home, away):
+            self.clubs.setdefault(club.lower(), club)
+        for entries in self._lists(self.rows[key]):
+            insort(entries, entry)
+
+    def remove(self, key: Tuple[str, str]):
+        row = self.rows.pop(key, None)
+        if row is None:
+            return
+        for entries in self._lists(row):
+            entries.pop(bisect_left(entries, row["entry"]))
+
+    def load(self, season: str, rows: Iterable[dict], revision: int):
+        """Replace ``season`` with ``rows``, listed newest first as on the site."""
+        for key in [key for key in self.rows if key[0] == season]:
+            self.remove(key)
+        for row in reversed(list(rows)):
+            self.add(season, row)
+        self.revisions[season] = revision
+
+    def apply(self, season: str, changes: dict) -> bool:
+        """Apply a snapshot ``delta``; False unless it starts at our revision."""
+        if changes["full"] or changes["since"] != self.revisions.get(season):
+            return False
+        for row in changes["removed"]:
+            self.remove((season, row_id("results", row)))
+        for row in [*changes["inserted"], *changes["updated"]]:
+            self.add(season, row)
+        self.revisions[season] = changes["revision"]
+        return True
+
+    def club(self, name: str) -> str:
+        return match_club(name, self.clubs)
+
+    def _from(self, club: str, entry: Entry) -> dict:
+        row = self.rows[entry[3]]
+        venue = "home" if row["home"].lower() == club else "away"
+        goals_for = row[f"{venue}_goals"]
+        goals_against = row["away_goals" if venue == "home" else "home_goals"]
+        return {
+            "season": row["season"],
+            "kickoff": row["kickoff"],
+            "home": row["home"],
+            "away": row["away"],
+            "score": row["score"],
+            "venue": venue,
+            "opponent": row["away" if venue == "home" else "home"],
+            "goals_for": goals_for,
+            "goals_against": goals_against,
+            "outcome": _outcome(goals_for, goals_against),
+        }
+
+    @staticmethod
+    def _latest(lists: Iterable[List[Entry]], n: int) -> List[Entry]:
+        # Only the last ``n`` of each list can be among the last ``n`` overall
+        return sorted(e for entries in lists for e in entries[-n:])[-n:][::-1]
+
+    def head_to_head(self, club: str, opponent: str, n: int = 10) -> dict:
+        """The last ``n`` meetings of two clubs, newest first, at either ground."""
+        club, opponent = self.club(club), self.club(opponent)
+        entries = self._latest(
+            [
+                self.by_pair.get((club, opponent), []),
+                self.by_pair.get((opponent, club), []),
+            ],
+            n,
+        )
+        meetings = [self._from(club, entry) for entry in entries]
+        return {
+            "club": self.clubs[club],
+            "opponent": self.clubs[opponent],
+            **tally(meetings),
+            "meetings": meetings,
+        }
+
+    def form(self, club: str, n: int = 5, venue: Optional[str] = None) -> dict:
+        """A club's last ``n`` results, newest first, optionally home or away only."""
+        club = self.club(club)
+        venues = [venue] if venue else VENUES
+        entries = self._latest([self.by_club.get((club, v), []) for v in venues], n)
+        results = [self._from(club, entry) for entry in entries]
+        return {
+            "club": self.clubs[club],
+            "venue": venue or "all",
+            "form": "".join(r["outcome"] for r in results),
+            **tally(results),
+            "results": results,
+        }
+
+    def goal_difference(self, club: str, season: Optional[str] = None) -> List[dict]:
+        """A club's running goal difference, oldest match first."""
+        club = self.club(club)
+        lists = [self.by_club.get((club, v), []) for v in VENUES]
+        if season is not None:
+            # Entries sort by season first, so a season is one slice of each list
+            lists = [
+                entries[
+                    bisect_left(entries, (season,)) : bisect_right(
+                        entries, (season, float("inf"))
+                    )
+                ]
+                for entries in lists
+            ]
+        running, points = 0, []
+        for entry in sorted(e for entries in lists for e in entries):
+            match = self._from(club, entry)
+            difference = match["goals_for"] - match["goals_against"]
+            running += difference
+            points.append(
+                {**match, "goal_difference": difference, "cumulative": running}
+            )
+        return points
+
+
+_store: Optional[ResultsStore] = None
+
+
+def results_store() -> ResultsStore:
+    global _store
+    if _store is None:
+        _store = ResultsStore()
+    return _store
+
+
+def reset_results_store():
+    global _store
+    _store = None
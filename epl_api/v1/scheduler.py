@@ -0,0 +1,166 @@
+import asyncio
+import math
+import time
+import weakref
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Deque, Dict, Optional
+from django.conf import settings
+from epl_api.v1.exceptions import ClientDisconnected, UpstreamUnavailable
+from epl_api.v1.metrics import SCHEDULER_DROPPED, SCHEDULER_RUNNING, SCHEDULER_WAIT
+
+# Highest first. HTTP requests are interactive unless they say otherwise.
+PRIORITIES = ("interactive", "refresh", "bulk")
+
+scrape_priority: ContextVar[str] = ContextVar("scrape_priority", default="interactive")
+
+# Set per request so a scrape still queued for a departed client can be dropped
+client_disconnected: ContextVar[Optional[Callable[[], Awaitable[bool]]]] = ContextVar(
+    "client_disconnected", default=None
+)
+
+# True inside a running job; scrapes it calls run under its slot
+in_job: ContextVar[bool] = ContextVar("in_job", default=False)
+
+
+@contextmanager
+def priority(name: str):
+    """Run the block's scrapes in priority class ``name``."""
+    token = scrape_priority.set(name)
+    try:
+        yield
+    finally:
+        scrape_priority.reset(token)
+
+
+@contextmanager
+def at_most(name: str):
+    """Like ``priority``, but never raises the current class."""
+    current = scrape_priority.get()
+    with priority(max(current, name, key=PRIORITIES.index)):
+        yield
+
+
+class ScrapeScheduler:
+    """Admit scrape jobs by priority class onto ``CAPACITY`` concurrent slots.
+
+    Free slots go to the highest class with a job waiting, FIFO within a class,
+    but a class past its ``SHARE`` of the slots only gets one when no class
+    within its share is waiting, so bulk work keeps moving under load.
+    ``RESERVED`` slots are kept free for a class and those above it, so a burst
+    of background work cannot take the last slot from a user. Jobs still
+    waiting after their class ``DEADLINE`` are refused, and jobs of clients
+    that have gone away are dropped.
+    """
+
+    def __init__(self, config: dict):
+        self.capacity = config["CAPACITY"]
+        self.classes = config["CLASSES"]
+        self.poll = config["DISCONNECT_POLL"]
+        self.running: Dict[str, int] = dict.fromkeys(PRIORITIES, 0)
+        self._waiters: Dict[str, Deque[asyncio.Future]] = {
+            name: deque() for name in PRIORITIES
+        }
+
+    def _share(self, name: str) -> int:
+        return max(1, math.ceil(self.classes[name]["SHARE"] * self.capacity))
+
+    def _fits(self, name: str) -> bool:
+        free = self.capacity - sum(self.running.values())
+        above = PRIORITIES[: PRIORITIES.index(name)]
+        return free > sum(self.classes[h]["RESERVED"] for h in above)
+
+    def _dispatch(self):
+        while True:
+            ready = []
+            for name in PRIORITIES:
+                waiters = self._waiters[name]
+                while waiters and waiters[0].done():
+                    waiters.popleft()
+                if waiters and self._fits(name):
+                    ready.append(name)
+            if not ready:
+                return
+            # A class past its share runs only if no class within its share can
+            within = [n for n in ready if self.running[n] < self._share(n)]
+            name = (within or ready)[0]
+            self.running[name] += 1
+            self._waiters[name].popleft().set_result(None)
+
+    async def _wait(self, waiter: asyncio.Future, deadline: float):
+        disconnected = client_disconnected.get()
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise asyncio.TimeoutError
+            timeout = min(remaining, self.poll) if disconnected else remaining
+            done, _ = await asyncio.wait({waiter}, timeout=timeout)
+            if done:
+                return
+            if disconnected and await disconnected():
+                raise ClientDisconnected()
+
+    async def acquire(self, name: str, deadline: Optional[float] = None):
+        if deadline is None:
+            deadline = self.classes[name]["DEADLINE"]
+        started = time.monotonic()
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[name].append(waiter)
+        self._dispatch()
+        try:
+            await self._wait(waiter, started + deadline)
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # Granted just as we gave up: hand the slot on
+                self.release(name)
+            else:
+                waiter.cancel()
+            if isinstance(e, asyncio.TimeoutError):
+                SCHEDULER_DROPPED.labels(name, "deadline").inc()
+                raise UpstreamUnavailable("scrape deadline", retry_after=1)
+            if isinstance(e, ClientDisconnected):
+                SCHEDULER_DROPPED.labels(name, "disconnected").inc()
+            raise
+        finally:
+            if waiter in self._waiters[name]:
+                self._waiters[name].remove(waiter)
+        SCHEDULER_WAIT.labels(name).observe(time.monotonic() - started)
+        SCHEDULER_RUNNING.labels(name).inc()
+
+    def release(self, name: str):
+        self.running[name] -= 1
+        SCHEDULER_RUNNING.labels(name).dec()
+        self._dispatch()
+
+    @asynccontextmanager
+    async def job(self, name: Optional[str] = None, deadline: Optional[float] = None):
+        """Hold a slot while the block scrapes; nested jobs share the outer slot."""
+        if in_job.get():
+            yield
+            return
+        name = name or scrape_priority.get()
+        await self.acquire(name, deadline)
+        token = in_job.set(True)
+        try:
+            yield
+        finally:
+            in_job.reset(token)
+            self.release(name)
+
+
+# Waiters are futures of the loop that created them
+_schedulers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ScrapeScheduler]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def scrape_scheduler() -> ScrapeScheduler:
+    loop = asyncio.get_running_loop()
+    if loop not in _schedulers:
+        _schedulers[loop] = ScrapeScheduler(settings.SCRAPE_SCHEDULER)
+    return _schedulers[loop]
+
+
+def reset_scrape_scheduler():
+    _schedulers.clear()
@@ -1,4 +1,5 @@
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional
 from pydantic import BaseModel
 
 
@@ -71,6 +72,8 @@ class DefenceSchema(BaseModel):
 
 class PlayerStatsSchema(BaseModel):
     player_name: Optional[str] = "N/A"
+    position: Optional[str] = "N/A"
+    club: Optional[str] = "N/A"
     appearances: Optional[str] = "N/A"
     goals: Optional[str] = "N/A"
     wins: Optional[str] = "N/A"
@@ -85,6 +88,14 @@ class FixtureSchema(BaseModel):
     home: Optional[str] = "N/A"
     away: Optional[str] = "N/A"
     time: Optional[str] = "N/A"
+    kickoff: Optional[datetime] = None
+
+
+class MatchweekSchema(BaseModel):
+    round: int
+    start: datetime
+    end: datetime
+    fixtures: List[FixtureSchema]
 
 
 class TableSchema(BaseModel):
@@ -105,3 +116,64 @@ class ResultSchema(BaseModel):
     home: Optional[str] = "N/A"
     away: Optional[str] = "N/A"
     score: Optional[str] = "N/A"
+    kickoff: Optional[datetime] = None
+
+
+class ClubResultSchema(BaseModel):
+    """A result seen from one club: ``goals_for`` are that club's."""
+
+    season: str
+    kickoff: Optional[datetime] = None
+    home: str
+    away: str
+    score: str
+    venue: str
+    opponent: str
+    goals_for: int
+    goals_against: int
+    outcome: str
+
+
+class RecordSchema(BaseModel):
+    played: int
+    wins: int
+    draws: int
+    losses: int
+    goals_for: int
+    goals_against: int
+    points: int
+
+
+class HeadToHeadSchema(RecordSchema):
+    club: str
+    opponent: str
+    meetings: List[ClubResultSchema]
+
+
+class FormSchema(RecordSchema):
+    club: str
+    venue: str
+    form: str
+    results: List[ClubResultSchema]
+
+
+class GoalDifferenceSchema(ClubResultSchema):
+    goal_difference: int
+    cumulative: int
+
+
+class LeaderSchema(BaseModel):
+    rank: int
+    player_name: str
+    position: Optional[str] = "N/A"
+    club: Optional[str] = "N/A"
+    value: float
+
+
+class DeltaSchema(BaseModel):
+    revision: int
+    since: int
+    full: bool = False
+    inserted: List[dict] = []
+    updated: List[dict] = []
+    removed: List[dict] = []
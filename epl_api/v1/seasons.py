@@ -0,0 +1,47 @@
+import re
+from dataclasses import dataclass
+from typing import Optional
+from django.conf import settings
+from epl_api.v1.exceptions import NotFound
+
+
+@dataclass(frozen=True)
+class Season:
+    label: str  # e.g. "2023-24"
+    id: int  # premierleague.com compSeason id
+    current: bool
+
+
+def normalize_season(value: str) -> str:
+    """Accept "2023", "2023-24", "2023/24" or "2023-2024" and return "2023-24"."""
+    match = re.fullmatch(r"\s*(\d{4})(?:\s*[-/]\s*(\d{2}|\d{4}))?\s*", value)
+    if not match:
+        raise NotFound("season", value)
+    start, end = int(match.group(1)), match.group(2)
+    # "2023-25" names no season rather than a different one
+    if end and int(end) != (start + 1 if len(end) == 4 else (start + 1) % 100):
+        raise NotFound("season", value)
+    return f"{start}-{(start + 1) % 100:02d}"
+
+
+def resolve_season(value: Optional[str] = None) -> Season:
+    current = settings.SEASONS["CURRENT"]
+    label = normalize_season(value) if value else current
+    season_id = settings.SEASONS["IDS"].get(label)
+    if season_id is None:
+        raise NotFound("season", value or label)
+    return Season(label, season_id, label == current)
+
+
+def season_query(season: Season) -> str:
+    # The site defaults to the current season; older ones need an explicit id
+    return "" if season.current else f"?co=1&se={season.id}"
+
+
+def season_key(base: str, season: Optional[str] = None) -> str:
+    return f"{base}:{resolve_season(season).label}"
+
+
+def season_timeout(season: Optional[str] = None, **kwargs) -> Optional[int]:
+    """Past seasons are final, so they are cached without expiry."""
+    return settings.CACHE_TIMEOUT if resolve_season(season).current else None
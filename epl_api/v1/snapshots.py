@@ -0,0 +1,104 @@
+from typing import Dict, Iterable, Optional
+from django.conf import settings
+from django.core.cache import cache
+from epl_api.v1.codec import get_codec, to_plain
+from epl_api.v1.metrics import stage
+
+# Fields that identify a row across revisions of each dataset
+IDENTITY = {
+    "fixtures": ("home", "away"),
+    "results": ("home", "away"),
+    "table": ("club",),
+}
+
+
+def revision_key(partition: str) -> str:
+    return f"rev:{partition}"
+
+
+def head_key(partition: str) -> str:
+    return f"snap:{partition}:head"
+
+
+def snapshot_key(partition: str, revision: int) -> str:
+    return f"snap:{partition}:{revision}"
+
+
+def row_id(dataset: str, row: dict) -> str:
+    return "|".join(str(row.get(field)) for field in IDENTITY[dataset])
+
+
+def keyed_rows(dataset: str, rows: Iterable) -> Dict[str, dict]:
+    return {row_id(dataset, row): row for row in to_plain(list(rows))}
+
+
+def head_revision(partition: str) -> Optional[int]:
+    return cache.get(head_key(partition))
+
+
+def load_snapshot(partition: str, revision: int) -> Optional[Dict[str, dict]]:
+    raw = cache.get(snapshot_key(partition, revision))
+    return get_codec().decode(raw) if raw is not None else None
+
+
+def next_revision(partition: str) -> int:
+    # Redis INCR keeps revisions increasing across workers
+    cache.add(revision_key(partition), 0, timeout=None)
+    return cache.incr(revision_key(partition))
+
+
+def record_snapshot(
+    dataset: str, rows: Iterable, partition: Optional[str] = None
+) -> int:
+    """Store ``rows`` as a new revision unless they match the current head.
+
+    ``partition`` (e.g. the season's cache key) gets its own revision history;
+    it defaults to the dataset name.
+    """
+    partition = partition or dataset
+    with stage("snapshot", dataset=dataset, partition=partition) as record:
+        current = keyed_rows(dataset, rows)
+        head = head_revision(partition)
+        if head is not None and load_snapshot(partition, head) == current:
+            return head
+        revision = next_revision(partition)
+        record.set_attribute("revision", revision)
+        cache.set(
+            snapshot_key(partition, revision),
+            get_codec().encode(current),
+            timeout=settings.SNAPSHOT_TIMEOUT,
+        )
+        cache.set(head_key(partition), revision, timeout=None)
+        return revision
+
+
+def delta(dataset: str, since: int, partition: Optional[str] = None) -> dict:
+    """Rows inserted, updated and removed between revision ``since`` and the head.
+
+    Updated rows carry the previous value of each changed field, so a moved
+    kickoff shows up as ``{"previous": {"time": ...}}``. When ``since`` is 0,
+    has expired, or is ahead of the head (revisions restarted after the cache
+    was flushed), every current row is returned as inserted and ``full`` is set.
+    """
+    partition = partition or dataset
+    head = head_revision(partition) or 0
+    changes = {"revision": head, "since": since, "full": False}
+    changes.update(inserted=[], updated=[], removed=[])
+    if since == head:
+        return changes
+
+    current = load_snapshot(partition, head) or {}
+    previous = load_snapshot(partition, since) if 0 < since < head else None
+    if previous is None:
+        changes.update(full=True, inserted=list(current.values()))
+        return changes
+
+    for key, row in current.items():
+        old = previous.get(key)
+        if old is None:
+            changes["inserted"].append(row)
+        elif old != row:
+            changed = {f: old.get(f) for f in row if old.get(f) != row[f]}
+            changes["updated"].append({**row, "previous": changed})
+    changes["removed"] = [row for key, row in previous.items() if key not in current]
+    return changes
@@ -0,0 +1,189 @@
+import atexit
+import json
+import logging
+import queue
+import secrets
+import threading
+import time
+import urllib.request
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+from django.conf import settings
+
+
+class Span:
+    """A finished or in-flight unit of work, shaped after the OTLP span model."""
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "error",
+    )
+
+    def __init__(self, name: str, parent: Optional["Span"] = None, attributes=None):
+        self.name = name
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent.span_id if parent else None
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e6
+
+    def to_otlp(self) -> dict:
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id or "",
+            "name": self.name,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [
+                {"key": k, "value": _otlp_value(v)} for k, v in self.attributes.items()
+            ],
+            "status": (
+                {"code": 2, "message": self.error} if self.error else {"code": 1}
+            ),
+        }
+
+
+class _NoopSpan:
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def _otlp_value(value: Any) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class _Exporter:
+    """Ships finished spans from a daemon thread so the event loop never blocks."""
+
+    def __init__(self):
+        self._queue: "queue.Queue[Optional[Span]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, span: Span):
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="epl-trace-exporter", daemon=True
+                    )
+                    self._thread.start()
+        self._queue.put(span)
+
+    def flush(self):
+        if self._thread is not None:
+            self._queue.join()
+
+    def _run(self):
+        batch_size = settings.TRACING["BATCH_SIZE"]
+        while True:
+            batch: List[Span] = [self._queue.get()]
+            while len(batch) < batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._export(batch)
+            except Exception as e:
+                logging.warning(f"Trace export failed: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _export(self, batch: List[Span]):
+        spans = [s.to_otlp() for s in batch]
+        if settings.TRACING["EXPORTER"] == "otlp":
+            payload = {
+                "resourceSpans": [
+                    {
+                        "resource": {
+                            "attributes": [
+                                {
+                                    "key": "service.name",
+                                    "value": {"stringValue": "epl_api"},
+                                }
+                            ]
+                        },
+                        "scopeSpans": [{"scope": {"name": "epl_api"}, "spans": spans}],
+                    }
+                ]
+            }
+            request = urllib.request.Request(
+                settings.TRACING["ENDPOINT"],
+                data=json.dumps(payload).encode(),
+                headers={"Content-Type": "application/json"},
+            )
+            urllib.request.urlopen(request, timeout=5).close()
+        else:
+            with open(settings.TRACING["PATH"], "a") as f:
+                f.writelines(json.dumps(s) + "\n" for s in spans)
+
+
+exporter = _Exporter()
+atexit.register(exporter.flush)
+
+
+class span:
+    """Open a child of the current span, as a sync or async context manager.
+
+    Yields a no-op span when tracing is disabled.
+    """
+
+    def __init__(self, name: str, **attributes):
+        self.name = name
+        self.attributes = attributes
+        self.span = NOOP_SPAN
+        self._token = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.span.set_attribute(key, value)
+
+    def __enter__(self):
+        if settings.TRACING["ENABLED"]:
+            self.span = Span(self.name, current_span.get(), self.attributes)
+            self._token = current_span.set(self.span)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._token is None:
+            return False
+        current_span.reset(self._token)
+        self.span.end_ns = time.time_ns()
+        if exc_type is not None:
+            self.span.error = f"{exc_type.__name__}: {exc}"
+        exporter.submit(self.span)
+        return False
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return self.__exit__(exc_type, exc, tb)
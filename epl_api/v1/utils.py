@@ -1,62 +1,343 @@
-from inspect import isasyncgen, iscoroutine
+import asyncio
+import random
+import time
+from inspect import isasyncgen, isawaitable
 from functools import wraps
-from typing import Any, Callable, Union
+from typing import Any, Callable, List, Optional, Type, Union
+from urllib.parse import urljoin
 from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
 from django.conf import settings
-from playwright.async_api import async_playwright
+from pydantic import BaseModel
+from epl_api.v1.async_cache import async_cache
+from epl_api.v1.codec import get_codec, rehydrate
+from epl_api.v1.exceptions import (
+    ClientDisconnected,
+    NotFound,
+    ScrapeFailed,
+    ScrapeQueued,
+    UpstreamUnavailable,
+)
+from epl_api.v1.governor import upstream_governor
+from epl_api.v1.jobs import cache_only, enqueue_scrape
+from epl_api.v1.lazy import LazyPage
+from epl_api.v1.navigation import current_budget
+from epl_api.v1.scheduler import scrape_scheduler
+from epl_api.v1.metrics import (
+    CACHE_ENTRY_BYTES,
+    CACHE_LOOKUPS,
+    RETRY_ATTEMPTS,
+    stage,
+)
+from epl_api.v1.snapshots import delta, head_revision, record_snapshot
 
 
-async def get_browser():
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=False, args=["--no-sandbox"])
-        yield browser
-        await browser.close()
+def upstream_url(path: str) -> str:
+    # Resolves site paths and protocol-relative hrefs against the upstream site
+    return urljoin(settings.BASE_URL, path)
+
+
+def stage_timeout(name: str) -> int:
+    return settings.SCRAPE_TIMEOUTS[name]
+
+
+def apply_stage_timeouts(page):
+    # Navigations and locator waits fall back to these instead of Playwright's 30s
+    page.set_default_navigation_timeout(stage_timeout("goto"))
+    page.set_default_timeout(stage_timeout("selector"))
+    return page
+
+
+def backoff_delay(attempt: int, policy: dict) -> float:
+    """Full-jitter exponential backoff before retry number ``attempt + 1``."""
+    ceiling = min(policy["MAX_DELAY"], policy["BASE_DELAY"] * 2**attempt)
+    return random.uniform(0, ceiling)
+
+
+async def with_backoff(func: Callable[..., Any], *args, policy: dict, **kwargs):
+    """Await ``func`` up to ``ATTEMPTS`` times, backing off between failures.
+
+    ``UpstreamUnavailable`` is not retried: the governor has already decided
+    the upstream should be left alone.
+    """
+    for attempt in range(policy["ATTEMPTS"]):
+        try:
+            result = await func(*args, **kwargs)
+        except UpstreamUnavailable:
+            raise
+        except Exception:
+            if attempt + 1 >= policy["ATTEMPTS"]:
+                RETRY_ATTEMPTS.labels(func.__name__, "gave_up").inc()
+                raise
+            RETRY_ATTEMPTS.labels(func.__name__, "retried").inc()
+            await asyncio.sleep(backoff_delay(attempt, policy))
+        else:
+            RETRY_ATTEMPTS.labels(func.__name__, "ok").inc()
+            return result
+
+
+async def goto(page, url: str, **kwargs):
+    budget = current_budget.get()
+    if budget is not None:
+        # A spent budget fails here, without taking a rate or in-flight slot
+        budget.check("goto")
+    if isinstance(page, LazyPage):
+        page = await page.open()
+    async with upstream_governor().navigation():
+        if budget is not None:
+            kwargs.setdefault("wait_until", budget.wait_until)
+            kwargs.setdefault("timeout", budget.check("goto"))
+        started = time.monotonic()
+        try:
+            async with stage("goto", url=url):
+                return await page.goto(url, **kwargs)
+        finally:
+            if budget is not None:
+                budget.record("goto", started)
+
+
+async def wait_for(page, selector: str, optional: bool = False, **kwargs):
+    """Wait for ``selector``; an ``optional`` one may be missing from the page.
+
+    Timeouts of optional waits are still raised but not counted as upstream
+    failures, so pages without, say, a stats tab cannot open the breaker.
+    """
+    budget = current_budget.get()
+    if budget is not None:
+        # Return as soon as the element exists rather than once it is visible
+        kwargs.setdefault("state", "attached")
+        kwargs.setdefault("timeout", budget.check("wait_for_selector"))
+    started = time.monotonic()
+    try:
+        async with upstream_governor().observe(counted=not optional):
+            async with stage("wait_for_selector", selector=selector):
+                return await page.wait_for_selector(selector, **kwargs)
+    finally:
+        if budget is not None:
+            budget.record("wait_for_selector", started)
 
 
 async def onetrust_accept_cookie(page):
+    budget = current_budget.get()
+    started = time.monotonic()
     try:
-        # Wait for the consent modal button if it's there
-        await page.wait_for_selector('button:has-text("Accept All Cookies")')
-        await page.click('button:has-text("Accept All Cookies")')
+        timeout = stage_timeout("cookie")
+        if budget is not None:
+            timeout = min(timeout, budget.check("cookie"))
+        async with stage("cookie"):
+            # Wait for the consent modal button if it's there
+            await page.wait_for_selector(
+                'button:has-text("Accept All Cookies")', timeout=timeout
+            )
+            await page.click('button:has-text("Accept All Cookies")')
         print("Cookie consent accepted.")
     except Exception as e:
         print(f"No consent modal or button found: {e}")
+    finally:
+        if budget is not None:
+            budget.record("cookie", started)
+
+
+def stale_key(key: str) -> str:
+    return f"stale:{key}"
+
+
+def encode_result(value, endpoint: str, store) -> bytes:
+    encoded = get_codec().encode(value)
+    store.set_attribute("bytes", len(encoded))
+    CACHE_ENTRY_BYTES.labels(endpoint).observe(len(encoded))
+    return encoded
+
+
+def index_members(index: str) -> List[str]:
+    """Keys recorded in ``index`` by ``store_result``, without scanning the cache."""
+    members = cache.client.get_client().smembers(cache.make_key(index))
+    return sorted(member.decode() for member in members)
+
 
+def store_result(
+    key: str,
+    value,
+    endpoint: str = "unknown",
+    timeout=DEFAULT_TIMEOUT,
+    index: Optional[str] = None,
+):
+    """Store ``value`` and its stale copy; ``timeout=None`` keeps it indefinitely.
+
+    With ``index`` set, ``key`` is also added to that set so the entries of a
+    dataset can be listed with ``index_members``.
+    """
+    if timeout is DEFAULT_TIMEOUT:
+        timeout = settings.CACHE_TIMEOUT
+    with stage("cache_set", key=key) as store:
+        encoded = encode_result(value, endpoint, store)
+        cache.set(key, encoded, timeout=timeout)
+        cache.set(stale_key(key), encoded, timeout=settings.STALE_CACHE_TIMEOUT)
+        if index:
+            cache.client.get_client(write=True).sadd(cache.make_key(index), key)
+
+
+async def astore_result(
+    key: str,
+    value,
+    endpoint: str = "unknown",
+    timeout=DEFAULT_TIMEOUT,
+    index: Optional[str] = None,
+):
+    """``store_result`` through the async client, all writes in flight at once."""
+    if timeout is DEFAULT_TIMEOUT:
+        timeout = settings.CACHE_TIMEOUT
+    async with stage("cache_set", key=key) as store:
+        encoded = encode_result(value, endpoint, store)
+        client = async_cache()
+        writes = [
+            client.set(key, encoded, timeout=timeout),
+            client.set(stale_key(key), encoded, timeout=settings.STALE_CACHE_TIMEOUT),
+        ]
+        if index:
+            writes.append(client.add_to_set(index, key))
+        await asyncio.gather(*writes)
+
+
+def load_result(raw, schema=None):
+    with stage("cache_decode"):
+        return rehydrate(get_codec().decode(raw), schema)
+
+
+def negative_key(key: str) -> str:
+    return f"neg:{key}"
+
+
+async def store_negative(key: str, outcome: dict, timeout: int):
+    async with stage("cache_set", key=negative_key(key)):
+        await async_cache().set(negative_key(key), outcome, timeout=timeout)
+
+
+def raise_negative(key: str, outcome: dict):
+    if outcome["kind"] == "not_found":
+        raise NotFound(outcome["resource"], outcome["query"])
+    raise ScrapeFailed(key, outcome["reason"])
+
+
+def cache_result(
+    key_func: Union[str, Callable[..., str]],
+    use_generator: bool = True,
+    schema: Optional[Type[BaseModel]] = None,
+    snapshot: Optional[str] = None,
+    timeout: Optional[Callable[..., Optional[int]]] = None,
+    index: Optional[Callable[..., str]] = None,
+):
+    """Cache the wrapped scraper's result under ``key_func``.
+
+    Results are stored through the configured cache codec; list results are
+    rebuilt as ``schema`` instances when read back. With ``snapshot`` set, each
+    fresh result is also recorded as a revision of that dataset, and a ``since``
+    keyword turns the response into the delta since that revision. ``timeout``
+    is called with the same arguments as ``key_func`` to pick the entry's TTL,
+    and ``index`` to name a set the entry's key is added to when stored.
+    ``timeout`` may be a coroutine function, for TTLs that depend on the cache.
+
+    Cache reads and writes go through the async client so they never block the
+    event loop; the sync snapshot bookkeeping runs in a worker thread.
+    """
 
-def cache_result(key_func: Union[str, Callable[..., str]], use_generator: bool = True):
     def decorator(func: Callable[..., Any]):
         @wraps(func)
         async def wrapper(*args, **kwargs):
+            since = kwargs.pop("since", None) if snapshot else None
+
+            async def respond(data):
+                if since is None:
+                    return (item for item in data) if use_generator else data
+                if await asyncio.to_thread(head_revision, key) is None:
+                    await asyncio.to_thread(
+                        record_snapshot, snapshot, data, partition=key
+                    )
+                return await asyncio.to_thread(delta, snapshot, since, partition=key)
+
+            async def load_stale():
+                return load_result(await async_cache().get(stale_key(key)), schema)
+
             # Prepare cache key
             func_args = {k: v for k, v in kwargs.items() if k != "page"}
             key = key_func(*args, **func_args) if callable(key_func) else key_func
 
-            # Check if result is cached
-            cached_data = cache.get(key)
-
-            # If cached data is a coroutine, await it
-            if iscoroutine(cached_data):
-                cached_data = await cached_data
+            # Check for the result and a remembered negative outcome in one round trip
+            async with stage("cache_get", key=key) as lookup:
+                found = await async_cache().get_many([key, negative_key(key)])
+                cached_data = found.get(key)
+                lookup.set_attribute("hit", bool(cached_data))
+            if cached_data is not None:
+                cached_data = load_result(cached_data, schema)
 
             # If cached data exists, return it
             if cached_data:
-                return (item for item in cached_data) if use_generator else cached_data
+                CACHE_LOOKUPS.labels(func.__name__, "hit").inc()
+                return await respond(cached_data)
 
-            # Call the original function
-            result = await func(*args, **kwargs)
+            negative = found.get(negative_key(key))
+            if negative:
+                CACHE_LOOKUPS.labels(func.__name__, "negative").inc()
+                raise_negative(key, negative)
+
+            CACHE_LOOKUPS.labels(func.__name__, "miss").inc()
+
+            # Cache-only API workers hand the scrape to the worker queue and
+            # answer with the last good copy, or 202 when there is none
+            if cache_only():
+                await asyncio.to_thread(enqueue_scrape, func, key, func_args)
+                stale_data = await load_stale()
+                if not stale_data:
+                    raise ScrapeQueued(key, settings.SCRAPE_QUEUE["RETRY_AFTER"])
+                CACHE_LOOKUPS.labels(func.__name__, "stale").inc()
+                return await respond(stale_data)
+
+            # Call the original function in a scheduler slot, falling back to
+            # the last good copy while the upstream governor is shedding load
+            streamed = False
+            try:
+                async with scrape_scheduler().job():
+                    result = await func(*args, **kwargs)
+                    # Async generators scrape as they are drained, so drain
+                    # them inside the slot
+                    streamed = use_generator and isasyncgen(result)
+                    if streamed:
+                        result = [item async for item in result]
+            except ClientDisconnected:
+                raise
+            except UpstreamUnavailable:
+                stale_data = await load_stale()
+                if not stale_data:
+                    raise
+                CACHE_LOOKUPS.labels(func.__name__, "stale").inc()
+                return await respond(stale_data)
+            except NotFound as e:
+                await store_negative(
+                    key,
+                    {"kind": "not_found", "resource": e.resource, "query": e.query},
+                    settings.NEGATIVE_CACHE_TIMEOUT,
+                )
+                raise
+            except Exception as e:
+                reason = f"{type(e).__name__}: {e}"
+                await store_negative(
+                    key,
+                    {"kind": "failed", "reason": reason},
+                    settings.FAILURE_CACHE_TIMEOUT,
+                )
+                raise ScrapeFailed(key, reason) from e
 
-            # Handle async generators if `use_generator` is True
-            if use_generator and isasyncgen(result):
-                result_list = [
-                    item async for item in result
-                ]  # Convert async generator to list
-                cache.set(key, result_list, timeout=settings.CACHE_TIMEOUT)
-                return (
-                    item for item in result_list
-                )  # Return generator from the cached list
+            ttl = timeout(*args, **func_args) if timeout else DEFAULT_TIMEOUT
+            if isawaitable(ttl):
+                ttl = await ttl
+            entries = index(*args, **func_args) if index else None
+            await astore_result(key, result, func.__name__, ttl, entries)
+            if snapshot:
+                await asyncio.to_thread(record_snapshot, snapshot, result, partition=key)
+            if streamed or since is not None:
+                return await respond(result)  # Return generator from the cached list
 
             # Otherwise, handle normal async functions that return lists
-            cache.set(key, result, timeout=settings.CACHE_TIMEOUT)
             return result
 
         return wrapper
@@ -0,0 +1,57 @@
+import logging
+from importlib import import_module
+from inspect import isasyncgen, isgenerator
+from typing import Optional
+from django.core.cache import cache
+from epl_api.v1.browsers import shutdown_browsers
+from epl_api.v1.dependencies import launch_page
+from epl_api.v1.jobs import in_worker, job_queue, pending_key
+from epl_api.v1.metrics import SCRAPE_JOBS, current_endpoint
+from epl_api.v1.scheduler import priority
+
+
+def resolve(path: str):
+    module, _, name = path.rpartition(".")
+    return getattr(import_module(module), name)
+
+
+async def run_job(job: dict, page):
+    """Run one queued scrape through its cached view, which stores the result."""
+    func = resolve(job["func"])
+    token = current_endpoint.set(func.__name__)
+    try:
+        # The client already has a stale copy or a 202; users come first
+        with priority("refresh"):
+            result = await func(page=page, **job["kwargs"])
+        if isgenerator(result):
+            list(result)
+        elif isasyncgen(result):
+            [item async for item in result]
+        SCRAPE_JOBS.labels("completed").inc()
+    except Exception as e:
+        SCRAPE_JOBS.labels("failed").inc()
+        logging.error(f"Scrape job for {job['key']} failed: {e}")
+    finally:
+        current_endpoint.reset(token)
+        cache.delete(pending_key(job["key"]))
+
+
+async def run_worker(max_jobs: Optional[int] = None, poll_timeout: int = 5):
+    """Serve scrape jobs from the queue on the shared browser, a page per job.
+
+    Stops after ``max_jobs`` jobs when given, otherwise runs until cancelled.
+    """
+    token = in_worker.set(True)
+    done = 0
+    try:
+        while max_jobs is None or done < max_jobs:
+            job = await job_queue().pop(poll_timeout)
+            if job is None:
+                continue
+            async with launch_page() as page:
+                await run_job(job, page)
+            done += 1
+    finally:
+        in_worker.reset(token)
+        await shutdown_browsers()
+    return done
@@ -1,27 +1,157 @@
 import asyncio
+import logging
 import re
-from typing import List
-from bs4 import BeautifulSoup
-from epl_api.v1.dependencies import get_page
+from datetime import date, datetime, timezone
+from typing import Annotated, List, Optional, Union
+from django.conf import settings
+from epl_api.v1.async_cache import async_cache
+from epl_api.v1.codec import list_adapter
+from epl_api.v1.dependencies import get_page, launch_page
+from epl_api.v1.fixture_calendar import (
+    FixtureIndex,
+    fixture_index,
+    keep_bare_date,
+    match_club,
+    parse_kickoff,
+    query_bound,
+    to_ics,
+)
+from epl_api.v1.results_store import ResultsStore, results_store
+from epl_api.v1.lazy import BeautifulSoup, async_playwright
+from epl_api.v1.exceptions import (
+    ClientDisconnected,
+    Forbidden,
+    NotFound,
+    ScrapeFailed,
+    ScrapeQueued,
+    UpstreamUnavailable,
+)
 from epl_api.v1.helpers import extract_player_stats
+from epl_api.v1.aggregates import (
+    MatchStore,
+    club_aggregates,
+    club_slug,
+    club_stats_timeout,
+    fixture_id,
+    mark_completeness,
+)
+from epl_api.v1.leaderboard import player_index, stats_matrix
 from epl_api.v1.schemas import (
+    DeltaSchema,
     FixtureSchema,
+    FormSchema,
+    GoalDifferenceSchema,
+    HeadToHeadSchema,
+    LeaderSchema,
+    MatchweekSchema,
     PlayerStatsSchema,
     ResultSchema,
     TableSchema,
 )
-from fastapi import Depends, status
-from fastapi.responses import JSONResponse
-from playwright.async_api import async_playwright
-from epl_api.v1.utils import cache_result, get_browser, onetrust_accept_cookie
+from fastapi import Depends, Header, Query, status
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse, Response
+from pydantic import BeforeValidator
+from epl_api.v1.metrics import render_metrics, stage
+from epl_api.v1.navigation import budgeted
+from epl_api.v1.parsers import parse_assist, parse_lineup, parse_squad
+from epl_api.v1.profiling import folded, list_profiles, profile_path, token_valid
+from epl_api.v1.scheduler import at_most
+from epl_api.v1.seasons import (
+    resolve_season,
+    season_key,
+    season_query,
+    season_timeout,
+)
+from epl_api.v1.snapshots import delta, head_key, head_revision
+from epl_api.v1.tracing import span
+from epl_api.v1.utils import (
+    cache_result,
+    goto,
+    load_result,
+    onetrust_accept_cookie,
+    upstream_url,
+    wait_for,
+    with_backoff,
+)
 
 
 def get_root():
     return {"message": "Welcome to the EPL API"}
 
 
+def upstream_unavailable_handler(request, exc: UpstreamUnavailable):
+    # Fail fast rather than queueing behind a throttled or failing upstream
+    return JSONResponse(
+        {"detail": "Upstream temporarily unavailable", "reason": exc.reason},
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": str(max(1, round(exc.retry_after)))},
+    )
+
+
+def not_found_handler(request, exc: NotFound):
+    return JSONResponse(
+        {"detail": str(exc), "resource": exc.resource, "query": exc.query},
+        status_code=status.HTTP_404_NOT_FOUND,
+    )
+
+
+def scrape_failed_handler(request, exc: ScrapeFailed):
+    return JSONResponse(
+        {"detail": "Failed to scrape upstream data", "reason": exc.reason},
+        status_code=status.HTTP_502_BAD_GATEWAY,
+    )
+
+
+def scrape_queued_handler(request, exc: ScrapeQueued):
+    return JSONResponse(
+        {"detail": "Scrape queued, retry shortly", "key": exc.key},
+        status_code=status.HTTP_202_ACCEPTED,
+        headers={"Retry-After": str(max(1, round(exc.retry_after)))},
+    )
+
+
+def client_disconnected_handler(request, exc: ClientDisconnected):
+    # Nobody reads this; 499 keeps dropped scrapes apart from real errors in logs
+    return Response(status_code=499)
+
+
+def forbidden_handler(request, exc: Forbidden):
+    return JSONResponse(
+        {"detail": str(exc), "resource": exc.resource},
+        status_code=status.HTTP_403_FORBIDDEN,
+    )
+
+
+def get_metrics():
+    payload, content_type = render_metrics()
+    return Response(payload, media_type=content_type)
+
+
+def require_profile_token(authorization: Annotated[Optional[str], Header()] = None):
+    # A separate header from X-EPL-Profile, so reading profiles is not profiled
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token_valid(token):
+        raise Forbidden("profiles")
+
+
+def get_profiles(_=Depends(require_profile_token)) -> List[dict]:
+    return list_profiles()
+
+
+def get_profile(
+    profile_id: str,
+    format: Annotated[str, Query(pattern="^(speedscope|folded)$")] = "speedscope",
+    _=Depends(require_profile_token),
+):
+    path = profile_path(profile_id)
+    if format == "folded":
+        return PlainTextResponse(folded(path))
+    return FileResponse(path, media_type="application/json")
+
+
+@budgeted("clubs")
 async def current_club_list(page):
-    await page.goto("https://www.premierleague.com/clubs")
+    await goto(page, upstream_url("/clubs"))
     await onetrust_accept_cookie(page)
 
     async def _extract():  # TODO
@@ -35,13 +165,24 @@ async def current_club_list(page):
                 await list_items.nth(i).locator("h2.club-card__name").inner_text()
             )
 
-            yield club_name, f"https://www.premierleague.com{club_link}"
+            yield club_name, upstream_url(club_link)
 
     return _extract()
 
 
-async def team_level_features(link, page):
-    await page.goto(link)
+@budgeted("club_results")
+async def team_level_features(link, page, store: Optional[MatchStore] = None):
+    """Yield processed fixtures from the club's results page.
+
+    Fixtures already in ``store`` are read back instead of scraped again, and
+    newly processed ones are added to it. Incomplete fixtures are read back
+    too until they are due for another attempt.
+    """
+    # MatchStore talks to Redis synchronously, so it runs off the event loop
+    known = await asyncio.to_thread(store.load) if store else {}
+    if store:
+        known.update(await asyncio.to_thread(store.load_partial))
+    await goto(page, link)
     await onetrust_accept_cookie(page)
 
     fixtures = await page.locator(
@@ -67,40 +208,72 @@ async def team_level_features(link, page):
         tmp["home_team_name"] = home_team_name
         tmp["away_team_name"] = away_team_name
         tmp["score"] = score.replace("\n", "").strip()
-        tmp["href"] = f"https:{href}"
+        tmp["href"] = upstream_url(href)
 
         # Add the task for processing;
-        tasks.append(process_fixture(tmp, home_team_name, away_team_name))
-
-    # Run concurrently
-    results = await asyncio.gather(*tasks)
+        if fixture_id(tmp["href"]) in known:
+            tasks.append(stored_fixture(known[fixture_id(tmp["href"])]))
+        else:
+            tasks.append(traced_fixture(tmp, home_team_name, away_team_name))
+
+    # Run concurrently, behind single-page scrapes in the upstream queue
+    with at_most("refresh"):
+        results = await asyncio.gather(*tasks)
+    if store:
+        fresh = [r for r in results if r["match_id"] not in known]
+        await asyncio.to_thread(store.save, fresh)
 
     for result in results:
         yield result
 
 
-async def process_fixture(fixture, home, away):
-    _clean = lambda text: text.strip().replace("\n", " ").strip()
-    async for browser in get_browser():
-        page = await browser.new_page()
+async def stored_fixture(match_details):
+    return match_details
+
 
+async def traced_fixture(fixture, home, away):
+    # Each fan-out task gets its own span so slow fixtures stand out in traces
+    match_id = fixture_id(fixture["href"])
+    with span("process_fixture", url=fixture["href"], fixture_id=match_id) as task:
         try:
-            await page.goto(fixture["href"])
+            match_details = await with_backoff(
+                process_fixture, fixture, home, away, policy=settings.FIXTURE_RETRY
+            ) or {}
+        except UpstreamUnavailable:
+            raise
         except Exception as e:
-            print("Error href >> ", e)
+            attempts = settings.FIXTURE_RETRY["ATTEMPTS"]
+            logging.warning(
+                f"Giving up on {fixture['href']} after {attempts} attempts: {e}"
+            )
+            match_details = {}
+        match_details.update(
+            match_id=match_id, home=home, away=away, score=fixture["score"]
+        )
+        mark_completeness(match_details)
+        task.set_attribute("complete", match_details["complete"])
+        return match_details
+
+
+@budgeted("match")
+async def process_fixture(fixture, home, away):
+    """Scrape one match centre page.
+
+    Navigation and line-up failures raise so the caller can retry the fixture.
+    A page without line-ups, or whose stats tab fails, gives a partial record
+    that ``mark_completeness`` flags.
+    """
+    async with launch_page() as page:
+
+        await goto(page, fixture["href"])
         await onetrust_accept_cookie(page)
-        try:
-            # Click on the "Line-ups" tab if available
-            lineup_locator = page.locator('li[role="tab"]:has-text("Line-ups")')
-            if await lineup_locator.count() > 0:
-                await lineup_locator.click()
-            else:
-                print("Line-ups tab not found")
-                return None
-        except Exception as e:
-            print(e, ">>> Error Line-ups")
-            return None
-        await page.wait_for_selector(".matchLineups")
+        # Click on the "Line-ups" tab if available
+        lineup_locator = page.locator('li[role="tab"]:has-text("Line-ups")')
+        if await lineup_locator.count() == 0:
+            print("Line-ups tab not found")
+            return {}
+        await lineup_locator.click()
+        await wait_for(page, ".matchLineups")
 
         # Extract home and away team lineup data
         match_details = {"lineups": {}}
@@ -130,21 +303,9 @@ async def process_fixture(fixture, home, away):
                 ).all_text_contents()
 
                 for assist in assist_elements:
-                    assist_cleaned = re.split(r"’| \(|\)", _clean(assist))
-                    if len(assist_cleaned) >= 2:
-                        minute, name = (
-                            (assist_cleaned[0], assist_cleaned[1])
-                            if assist_cleaned[0].isdigit() or "+" in assist_cleaned[0]
-                            else (assist_cleaned[2], assist_cleaned[0])
-                        )
-
-                        # Sum minutes if there are additional time (e.g. "45+2")
-                        assists[which_team].append(
-                            {
-                                "name": name.strip(),
-                                "minute": sum(map(int, minute.strip().split("+"))),
-                            }
-                        )
+                    parsed = parse_assist(assist)
+                    if parsed:
+                        assists[which_team].append(parsed)
 
         assists = {home: [], away: []}
         await _extract_assists(home_assists_events, home)
@@ -161,12 +322,13 @@ async def process_fixture(fixture, home, away):
             ).filter(has_text="Stats")
 
             await matchstat_locator.click()
+            await wait_for(page, ".matchCentreStatsContainer", optional=True)
+        except UpstreamUnavailable:
+            raise
         except Exception as e:
             print(e, ">>> Error matchstat_locator")
             return match_details
 
-        await page.wait_for_selector(".matchCentreStatsContainer")
-
         # Extract match statistics
         stats_locator = page.locator(".matchCentreStatsContainer").nth(0)
 
@@ -188,7 +350,8 @@ async def process_fixture(fixture, home, away):
 
             return match_stats
 
-        awaited_statistics = await _extract_statistics(statistics[0])
+        with stage("parse", bytes=len(statistics[0])):
+            awaited_statistics = await _extract_statistics(statistics[0])
 
         # # Add match statistics to match details
         match_details["match_stats"] = awaited_statistics
@@ -196,223 +359,349 @@ async def process_fixture(fixture, home, away):
 
 
 def process_lineups(home_team, away_team, fixture):
-    def _clean(team_text):
-        return (
-            team_text[0]
-            .strip()
-            .replace("\n", " ")
-            .replace("  ", " ")
-            .split(" Shirt number ")
-        )
-
-    cleaned_home = _clean(home_team)
-    cleaned_away = _clean(away_team)
     lineups = {}
-
-    for team_info, team_name in zip(
-        [cleaned_home, cleaned_away],
+    for team_text, team_name in zip(
+        [home_team, away_team],
         [fixture["home_team_name"], fixture["away_team_name"]],
     ):
-        if not team_info:
-            continue
-
-        subi = next(
-            (i for i, entry in enumerate(team_info) if "Substitutes" in entry), None
-        )
-        starters = team_info[: subi + 1] if subi else team_info
-        substitutes = team_info[subi + 1 :] if subi else []
-
-        formation = starters[0].split()[-2] if starters else None
+        lineup = parse_lineup(team_text[0])
         lineups[team_name] = {
-            "formation": formation,
+            "formation": lineup["formation"],
             "score": fixture["score"],
-            "starters": process_players(
-                starters[1:], "90"
-            ),  # Skip first entry (team info)
-            "substitutes": process_players(substitutes, "0"),
+            "starters": lineup["starters"],
+            "substitutes": lineup["substitutes"],
         }
-
     return lineups
 
 
-def process_players(players, custom):
-    def _extract_player_info(player_string):
-        player_info = {}
-        parts = player_string.split()
-        player_info["name"] = " ".join(parts[1:3])  # First and last name
-
-        player_info["yellow_cards"] = 1 if "Yellow" in parts else 0
-        player_info["red_cards"] = 1 if "Red" in parts else 0
-        player_info["goals"] = player_string.count("Goal") + player_string.count(
-            "label.penaltyscore"
-        )
-
-        minutes_played = [
-            part for part in parts if "'" in part and part.replace("'", "").isdigit()
-        ]
-        player_info["minutes"] = (
-            minutes_played[0].strip("'") if minutes_played else custom
-        )
-
-        return player_info
-
-    return {
-        player_info["name"]: player_info
-        for player_info in map(_extract_player_info, players)
-    }
-
-
+@budgeted("squad")
 async def player_level_features(link, page):
-    await page.goto(link)
+    await goto(page, link)
     await onetrust_accept_cookie(page)
 
     squads = await page.locator("ul.squadListContainer.squad-list").all_text_contents()
 
-    # Clean the squad list content by replacing newline characters and extra spaces
-    cleaned_squads = [re.sub(r"\s+", " ", s.replace("\n", " ")).strip() for s in squads]
+    with stage("parse", bytes=len(squads[0])):
+        return parse_squad(squads[0])
 
-    def extract_player_data(from_text):
-        # Split the text into sections by positions
-        player_data = {}
-        players_by_position = re.split(
-            r"(Goalkeepers|Defenders|Midfielders|Forwards)", from_text[0]
-        )
 
-        # Iterate over positions and associated player details
-        for i in range(1, len(players_by_position), 2):
-            position = players_by_position[i].strip()
-            players_section = players_by_position[i + 1].strip()
+SeasonParam = Annotated[
+    Optional[str],
+    Query(description="Season such as 2023-24; defaults to the current one"),
+]
+
 
-            # Split players based on "View Profile" which marks the end of player data
-            player_entries = players_section.split("View Profile")
+@cache_result("club_directory", use_generator=False)
+async def club_directory(page=Depends(get_page)):
+    """Every club's name and overview link, as listed on the site."""
+    return [
+        {"name": name, "link": link}
+        async for name, link in await current_club_list(page)
+    ]
 
-            # List to hold player data for the current position
-            player_data[position] = []
 
-            for entry in player_entries:
-                entry = entry.strip()
-                if not entry:
-                    continue  # Skip empty entries
+async def resolve_club(club: str, page) -> dict:
+    """The directory entry ``club`` refers to, so every spelling shares one key."""
+    clubs = {entry["name"].lower(): entry for entry in await club_directory(page=page)}
+    return clubs[match_club(club, clubs)]
 
-                player_info = {}
 
-                # Extract player name before "Appearances"
-                name_pos = entry.find("Appearances")
-                if name_pos != -1:
-                    player_info["name"] = entry[:name_pos].rsplit(" ", 1)[0].strip()
-                else:
-                    player_info["name"] = "Unknown"
+@cache_result(
+    lambda club, link, season=None: season_key(
+        f"club_stats_{club_slug(club)}", season
+    ),
+    use_generator=False,
+    timeout=club_stats_timeout,
+)
+async def scrape_club_stats(
+    club: str, link: str, season: Optional[str] = None, page=None
+):
+    season = resolve_season(season)
+    p_link = link.replace("overview", f"squad?se={season.id}")
+    t_link = link.replace("overview", "results" + season_query(season))
 
-                def extract_stat(pattern, text, default=0):
-                    match = re.search(pattern, text)
-                    return int(match.group(1)) if match else default
+    # Fetch team-level and player-level statistics
+    store = MatchStore(club, season.label)
+    teamattr = [tfeat async for tfeat in team_level_features(t_link, page, store)]
+    player_level = await player_level_features(p_link, page)
+    return {"team_stats": teamattr, "player_stats": player_level}
 
-                # Extract numeric stats (default to 0 if not found)
-                player_info["appearances"] = extract_stat(r"Appearances (\d+)", entry)
-                player_info["goals"] = extract_stat(r"Goals (\d+)", entry)
-                player_info["assists"] = extract_stat(r"Assists (\d+)", entry)
-                player_info["clean_sheets"] = extract_stat(r"Clean sheets (\d+)", entry)
-                player_info["saves"] = extract_stat(r"Saves (\d+)", entry)
-                player_info["shots"] = extract_stat(r"Shots (\d+)", entry)
 
-                # Append player info to the list for this position
-                player_data[position].append(player_info)
+async def aggregate_club_stats(
+    club: str, season: SeasonParam = None, page=Depends(get_page)
+):
+    entry = await resolve_club(club, page)
+    return await scrape_club_stats(
+        club=entry["name"], link=entry["link"], season=season, page=page
+    )
 
-        return player_data
 
-    return extract_player_data(cleaned_squads)
+async def get_club_aggregates(
+    club: str, season: SeasonParam = None, page=Depends(get_page)
+):
+    # Refreshes the club's stored matches on a cache miss, scraping only new ones
+    entry = await resolve_club(club, page)
+    await scrape_club_stats(
+        club=entry["name"], link=entry["link"], season=season, page=page
+    )
+    return await asyncio.to_thread(club_aggregates, entry["name"], season)
 
 
-# @cache_result(lambda club: '-'.join(club.split()))
-async def aggregate_club_stats(club: str, page=Depends(get_page)):
-    _links = await current_club_list(page)
-    p_link = t_link = None
+SinceParam = Annotated[
+    Optional[int], Query(ge=0, description="Only return changes after this revision")
+]
 
-    async for name, link in _links:
-        if club.lower() in name.lower():
-            p_link = link.replace("overview", "squad?se=719")
-            t_link = link.replace("overview", "results")
-            break
 
-    # Fetch team-level and player-level statistics
-    teamattr = [tfeat async for tfeat in team_level_features(t_link, page)]
-    player_level = await player_level_features(p_link, page)
-    return {"team_stats": teamattr, "player_stats": player_level}
+FIXTURES_KEY = "epl_fixture"
 
 
-@cache_result("epl_fixture")
-async def get_fixtures(page=Depends(get_page)):
+@cache_result(FIXTURES_KEY, schema=FixtureSchema, snapshot="fixtures")
+@budgeted("fixtures")
+async def get_fixtures(since: SinceParam = None, page=Depends(get_page)):
     async with async_playwright() as p:
-        await page.goto("https://www.premierleague.com/fixtures")
+        await goto(page, upstream_url("/fixtures"))
         await onetrust_accept_cookie(page)
         await page.click('li[data-tab-index="0"][data-text="First Team"]')
-        await page.wait_for_selector("li.match-fixture")
+        await wait_for(page, "li.match-fixture")
         content = await page.content()
-        soup = BeautifulSoup(content, "lxml")
-        fixture_elements = soup.select("li.match-fixture")
+        with stage("parse", bytes=len(content)):
+            soup = BeautifulSoup(content, "lxml")
+            fixture_elements = soup.select("li.match-fixture")
 
         def _extract(element):
             home_team = element.get("data-home", "")
             away_team = element.get("data-away", "")
             time = element.select_one("time")
+            when = time and time.get("datetime", time.text.strip())
             return {
                 "home": home_team,
                 "away": away_team,
-                "time": time and time.get("datetime", time.text.strip()),
+                "time": when,
+                "kickoff": parse_kickoff(when),
             }
 
-        fixtures = [_extract(e) for e in fixture_elements]
-        return [FixtureSchema(**fsch) for fsch in fixtures]
+        with stage("parse"):
+            fixtures = [_extract(e) for e in fixture_elements]
+        with stage("validate"):
+            return list_adapter(FixtureSchema).validate_python(fixtures)
+
+
+async def synced_fixture_index(page) -> FixtureIndex:
+    """The fixture index, caught up with the fixtures cache.
+
+    While the cached list is present and its snapshot head matches the index,
+    this costs two cache lookups. Otherwise the index applies the delta since
+    its revision, which refreshes the list first if it has expired.
+    """
+    index = fixture_index()
+    head = await asyncio.to_thread(head_revision, FIXTURES_KEY)
+    if head == index.revision and head and await async_cache().exists(FIXTURES_KEY):
+        return index
+    since = index.revision if head and head >= index.revision else 0
+    with stage("index_fixtures", since=since):
+        if not index.apply(await get_fixtures(since=since, page=page)):
+            # Another request moved the index on meanwhile; start over
+            index.apply(await get_fixtures(since=0, page=page))
+    return index
+
+
+DateParam = Annotated[
+    Optional[Union[datetime, date]],
+    BeforeValidator(keep_bare_date),
+    Query(
+        description="ISO date or datetime; UTC unless an offset is given. "
+        "A date alone covers the whole day"
+    ),
+]
+
+
+async def list_fixtures(
+    since: SinceParam = None,
+    start: Annotated[DateParam, Query(alias="from")] = None,
+    end: Annotated[DateParam, Query(alias="to")] = None,
+    club: Optional[str] = None,
+    page=Depends(get_page),
+):
+    # Plain and ``since`` requests go straight to the cached list
+    if start is None and end is None and club is None:
+        return await get_fixtures(since=since, page=page)
+    index = await synced_fixture_index(page)
+    with stage("query", index="fixtures"):
+        rows = index.between(query_bound(start), query_bound(end, end=True), club)
+    with stage("validate"):
+        return list_adapter(FixtureSchema).validate_python(rows)
+
+
+async def get_next_fixture(club: str, page=Depends(get_page)) -> FixtureSchema:
+    index = await synced_fixture_index(page)
+    with stage("query", index="fixtures"):
+        fixture = index.next_match(club, datetime.now(timezone.utc))
+    if fixture is None:
+        raise NotFound("fixture", club)
+    return FixtureSchema.model_validate(fixture)
+
+
+async def get_matchweeks(page=Depends(get_page)) -> List[MatchweekSchema]:
+    index = await synced_fixture_index(page)
+    with stage("query", index="fixtures"):
+        weeks = index.matchweeks()
+    with stage("validate"):
+        return list_adapter(MatchweekSchema).validate_python(weeks)
+
+
+async def get_fixture_calendar(club: Optional[str] = None, page=Depends(get_page)):
+    index = await synced_fixture_index(page)
+    with stage("query", index="fixtures"):
+        fixtures = index.between(club=club)
+    name = f"{index.names[index.club(club)]} fixtures" if club else None
+    return Response(
+        to_ics(fixtures, name or "Premier League fixtures"),
+        media_type="text/calendar",
+    )
 
 
-@cache_result("epl_results", use_generator=True)
-async def get_results(page=Depends(get_page)):
+@cache_result(
+    lambda season=None: season_key("epl_results", season),
+    use_generator=True,
+    schema=ResultSchema,
+    snapshot="results",
+    timeout=season_timeout,
+)
+@budgeted("results")
+async def get_results(
+    season: SeasonParam = None,
+    since: SinceParam = None,
+    page=Depends(get_page),
+):
+    season = resolve_season(season)
     async with async_playwright() as p:
-        await page.goto("https://www.premierleague.com/results")
+        await goto(page, upstream_url("/results" + season_query(season)))
         await onetrust_accept_cookie(page)
-        await page.wait_for_selector('li[data-tab-index="0"][data-text="First Team"]')
+        await wait_for(page, 'li[data-tab-index="0"][data-text="First Team"]')
         await page.click('li[data-tab-index="0"][data-text="First Team"]')
-        await page.wait_for_selector("li.match-fixture")
+        await wait_for(page, "li.match-fixture")
 
         # Parse page content
         content = await page.content()
-        soup = BeautifulSoup(content, "lxml")
-        result_elements = soup.select("li.match-fixture")
+        with stage("parse", bytes=len(content)):
+            soup = BeautifulSoup(content, "lxml")
+            result_elements = soup.select("li.match-fixture")
 
         def extract_result_data(result):
             home_team = result.get("data-home", "")
             away_team = result.get("data-away", "")
             score = result.select_one(".match-fixture__score").text.strip()
+            # Results are grouped under a heading carrying the match date
+            time = result.select_one("time") or result.find_previous("time")
+            when = time and time.get("datetime", time.text.strip())
             return {
                 "home": home_team,
                 "away": away_team,
                 "score": score,
+                "kickoff": parse_kickoff(when),
             }
 
-        results = [extract_result_data(result) for result in result_elements]
-        return [ResultSchema(**rsch) for rsch in results]
+        with stage("parse"):
+            results = [extract_result_data(result) for result in result_elements]
+        with stage("validate"):
+            return list_adapter(ResultSchema).validate_python(results)
+
+
+async def synced_results_store() -> ResultsStore:
+    """The results store, caught up with every cached season of results.
+
+    One batched lookup of the seasons' snapshot heads when nothing changed.
+    A season that moved applies its snapshot delta, or reloads from its cached
+    list when the delta is gone; seasons nobody has fetched yet are left out
+    rather than scraped.
+    """
+    store = results_store()
+    keys = {
+        label: season_key("epl_results", label) for label in settings.SEASONS["IDS"]
+    }
+    heads = await async_cache().get_many(head_key(key) for key in keys.values())
+    for label, key in keys.items():
+        head = heads.get(head_key(key))
+        since = store.revisions.get(label)
+        if head is None or head == since:
+            continue
+        with stage("index_results", season=label, since=since or 0):
+            if since and store.apply(
+                label, await asyncio.to_thread(delta, "results", since, key)
+            ):
+                continue
+            raw = await async_cache().get(key)
+            if raw is not None:
+                store.load(label, load_result(raw), head)
+    return store
+
+
+ClubResultsN = Annotated[int, Query(ge=1, le=100)]
 
 
-@cache_result("epl_table", use_generator=True)
-async def get_table(page=Depends(get_page)) -> List[TableSchema]:
-    await page.goto("https://www.premierleague.com/tables")
+async def get_head_to_head(
+    club: str, opponent: str, n: ClubResultsN = 10
+) -> HeadToHeadSchema:
+    store = await synced_results_store()
+    with stage("query", index="results"):
+        return HeadToHeadSchema(**store.head_to_head(club, opponent, n))
+
+
+async def get_form(
+    club: str,
+    n: ClubResultsN = 5,
+    venue: Annotated[Optional[str], Query(pattern="^(home|away)$")] = None,
+) -> FormSchema:
+    store = await synced_results_store()
+    with stage("query", index="results"):
+        return FormSchema(**store.form(club, n, venue))
+
+
+async def get_goal_difference(
+    club: str, season: SeasonParam = None
+) -> List[GoalDifferenceSchema]:
+    label = resolve_season(season).label if season else None
+    store = await synced_results_store()
+    with stage("query", index="results"):
+        points = store.goal_difference(club, label)
+    with stage("validate"):
+        return list_adapter(GoalDifferenceSchema).validate_python(points)
+
+
+@cache_result(
+    lambda season=None: season_key("epl_table", season),
+    use_generator=True,
+    schema=TableSchema,
+    snapshot="table",
+    timeout=season_timeout,
+)
+@budgeted("table")
+async def get_table(
+    season: SeasonParam = None,
+    since: SinceParam = None,
+    page=Depends(get_page),
+) -> Union[List[TableSchema], DeltaSchema]:
+    season = resolve_season(season)
+    await goto(page, upstream_url("/tables" + season_query(season)))
     await onetrust_accept_cookie(page)
 
     # Click on "First Team" tab and wait for the table to load
-    await page.wait_for_selector('li[data-tab-index="0"][data-text="First Team"]')
+    await wait_for(page, 'li[data-tab-index="0"][data-text="First Team"]')
     await page.click('li[data-tab-index="0"][data-text="First Team"]')
-    await page.wait_for_selector(
-        "#mainContent div.league-table__all-tables-container.allTablesContainer table tbody"
+    await wait_for(
+        page,
+        "#mainContent div.league-table__all-tables-container.allTablesContainer table tbody",
     )
 
     # Parse page content
     content = await page.content()
-    soup = BeautifulSoup(content, "lxml")
+    with stage("parse", bytes=len(content)):
+        soup = BeautifulSoup(content, "lxml")
 
-    # Extract table rows
-    table = soup.select_one(
-        "#mainContent div.league-table__all-tables-container.allTablesContainer table tbody"
-    )
+        # Extract table rows
+        table = soup.select_one(
+            "#mainContent div.league-table__all-tables-container.allTablesContainer table tbody"
+        )
 
     # Function to clean form text
     def clean_form(text):
@@ -451,20 +740,51 @@ async def get_table(page=Depends(get_page)) -> List[TableSchema]:
             "form": clean_form(cells[10].text.strip()) if len(cells) > 10 else None,
         }
 
-    rows = table.find_all("tr")
-    league_table = (data for row in rows if (data := extract_team_data(row)))
-    return [TableSchema(**team_data) for team_data in league_table if team_data]
+    with stage("parse"):
+        rows = table.find_all("tr")
+        league_table = [data for row in rows if (data := extract_team_data(row))]
+    with stage("validate"):
+        return list_adapter(TableSchema).validate_python(league_table)
 
 
 @cache_result(
-    lambda p_name: f"player_stats_{''.join(p_name.split(' ')).lower()}",
+    lambda p_name, season=None: season_key(
+        f"player_stats_{''.join(p_name.split(' ')).lower()}", season
+    ),
     use_generator=True,
+    schema=PlayerStatsSchema,
+    timeout=season_timeout,
+    index=player_index,
 )
-async def get_p_stats(p_name: str, page=Depends(get_page)):
-    stats = await extract_player_stats(p_name, page)
+async def get_p_stats(
+    p_name: str, season: SeasonParam = None, page=Depends(get_page)
+):
+    stats = await extract_player_stats(p_name, page, resolve_season(season))
     if not stats:
         return JSONResponse(
             {"error get_player_stats": "Failed to retrieve stats"},
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         )
-    return [PlayerStatsSchema(**p_stat) async for p_stat in stats]
+    rows = [p_stat async for p_stat in stats]
+    with stage("validate"):
+        return list_adapter(PlayerStatsSchema).validate_python(rows)
+
+
+def get_leaderboard(
+    stat: str,
+    season: SeasonParam = None,
+    n: Annotated[int, Query(ge=1, le=100)] = 10,
+    position: Optional[str] = None,
+    club: Optional[str] = None,
+) -> List[LeaderSchema]:
+    # Served from the in-memory stats matrix; never scrapes
+    with stage("rank", stat=stat):
+        return stats_matrix(season).top(stat, n, position=position, club=club)
+
+
+def compare_players(
+    players: Annotated[List[str], Query(min_length=1)],
+    season: SeasonParam = None,
+):
+    with stage("compare"):
+        return stats_matrix(season).compare(players)
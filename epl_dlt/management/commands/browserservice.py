@@ -0,0 +1,22 @@
+import asyncio
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from epl_api.v1.browsers import serve_browser
+
+
+class Command(BaseCommand):
+    help = "Run the Chromium that all API and scraper workers share over CDP"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--port",
+            type=int,
+            default=settings.BROWSER["PORT"],
+            help="local port for CDP connections",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            asyncio.run(serve_browser(settings.BROWSER, options["port"]))
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.SUCCESS("Browser service stopped"))
@@ -0,0 +1,28 @@
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from epl_api.v1.codec import CacheCodec
+
+
+class Command(BaseCommand):
+    help = "Report the stored size and encoding of cache entries"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--pattern", default="*", help="key glob, e.g. player_*")
+
+    def handle(self, *args, **options):
+        client = cache.client.get_client()
+        rows = []
+        for key in cache.iter_keys(options["pattern"]):
+            size = client.strlen(cache.make_key(key))
+            header = CacheCodec.describe(cache.get(key)) or {}
+            encoding = "/".join(
+                str(header[f]) for f in ("format", "compression") if f in header
+            )
+            rows.append((size, key, encoding or "raw"))
+
+        for size, key, encoding in sorted(rows, reverse=True):
+            self.stdout.write(f"{size:>10}  {encoding:<14}  {key}")
+        total = sum(size for size, _, _ in rows)
+        self.stdout.write(
+            self.style.SUCCESS(f"{len(rows)} keys, {total} bytes stored")
+        )
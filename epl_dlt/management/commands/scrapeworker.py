@@ -0,0 +1,21 @@
+import asyncio
+from django.core.management.base import BaseCommand
+from epl_api.v1.worker import run_worker
+
+
+class Command(BaseCommand):
+    help = "Run a scraper worker that serves cache-miss jobs queued by the API"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-jobs", type=int, default=None, help="exit after this many jobs"
+        )
+        parser.add_argument(
+            "--poll-timeout", type=int, default=5, help="seconds to block on the queue"
+        )
+
+    def handle(self, *args, **options):
+        done = asyncio.run(
+            run_worker(max_jobs=options["max_jobs"], poll_timeout=options["poll_timeout"])
+        )
+        self.stdout.write(self.style.SUCCESS(f"Processed {done} scrape jobs"))
@@ -4,6 +4,7 @@ from django.core.management.base import BaseCommand
 import dlt
 from playwright.async_api import async_playwright
 from epl_api.v1.dependencies import get_page
+from epl_api.v1.scheduler import priority
 from epl_api.views import get_results
 
 
@@ -13,7 +14,8 @@ class Command(BaseCommand, ABC):
     async def run_get_results(self):
         async with async_playwright() as p:
             async for page in get_page():
-                results = await get_results(page=page)
+                with priority("bulk"):
+                    results = await get_results(page=page)
 
                 pipeline = dlt.pipeline(
                     pipeline_name="epl_pipeline",